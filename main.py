@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 
 from src.emby_client import EmbyClient
 from src.log_buffer import get_log_buffer
-from src.metadata import MetadataClient
+from src.metadata import MetadataClient, create_http_session
 from src.pipeline import Pipeline
 from src.queue import QueueDB
 from src.token_manager import TokenManager, load_refresh_token
@@ -55,6 +55,7 @@ def load_config() -> dict:
             'scan_retry_delays': [
                 int(x) for x in os.getenv('EMBY_SCAN_RETRY_DELAYS', '2,4,8,16,32,64').split(',')
             ],
+            'verify_updates': os.getenv('EMBY_VERIFY_UPDATES', 'false').lower() == 'true',
         },
         'stability': {
             'check_interval_seconds': int(os.getenv('STABILITY_CHECK_INTERVAL', '5')),
@@ -115,12 +116,16 @@ def main():
     else:
         logger.warning('No refresh token found — token auto-refresh disabled')
 
+    # One keep-alive session shared by the metadata and Emby clients
+    http_session = create_http_session()
+
     # Init metadata client
     metadata_client = MetadataClient(
         base_url=api_config.get('base_url', ''),
         token=api_config.get('token', ''),
         search_order=api_config.get('search_order', ['missav', 'javguru']),
         token_manager=token_manager,
+        session=http_session,
     )
 
     # Init Emby client
@@ -135,6 +140,8 @@ def main():
             wordpress_token=api_config.get('token', ''),
             retry_delays=emby_config.get('scan_retry_delays'),
             token_manager=token_manager,
+            verify_updates=emby_config.get('verify_updates', False),
+            session=http_session,
         )
         logger.info('Emby client initialized (parent_folder_id=%s)', emby_config.get('parent_folder_id'))
 
@@ -195,6 +202,9 @@ def main():
         observer.join()
         if token_manager:
             token_manager.stop()
+        if emby_client:
+            emby_client.close()
+        http_session.close()
         queue_db.close()
         logger.info('Shutdown complete')
 
@@ -0,0 +1,18 @@
+-- Migration 004: Partial indexes for cleanup and retry predicates
+-- Cleanup only ever scans completed rows by age, and the retry paths only
+-- ever look at errored rows, so index just those slices of the queue.
+
+-- Completed items by age (/api/cleanup, emby-processor cleanup)
+CREATE INDEX IF NOT EXISTS idx_queue_completed_updated
+    ON processing_queue (updated_at)
+    WHERE status = 'completed';
+
+-- Errored items, including those with no retry scheduled (emby-processor status/retry)
+CREATE INDEX IF NOT EXISTS idx_queue_error_retry
+    ON processing_queue (next_retry_at)
+    WHERE status = 'error';
+
+-- Finished downloads by age (/api/cleanup)
+CREATE INDEX IF NOT EXISTS idx_downloads_finished_created
+    ON download_jobs (created_at)
+    WHERE status IN ('completed', 'failed');
@@ -25,6 +25,8 @@ if __name__ == "__main__":
         "src.api:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         log_level="info",
         access_log=False,  # Disable access logs to reduce noise
     )
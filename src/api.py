@@ -1,22 +1,30 @@
 """FastAPI web dashboard for queue monitoring and manual controls."""
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
 import os
 import re
+import threading
 import time as _time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException, Query, Request, Response
-from fastapi.responses import HTMLResponse, PlainTextResponse, StreamingResponse
-from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, PlainTextResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from .downloader import DownloadManager, get_download_manager
+from .emby_client import EmbyClient
 from .log_buffer import get_log_buffer
+from .metadata import MetadataClient, SEARCH_CACHE_HARD_TTL, SEARCH_CACHE_SOFT_TTL, create_http_session
 from .metrics import DASHBOARD_REQUEST_DURATION, QUEUE_DEPTH, DOWNLOADS_DEPTH
-from .queue import QueueDB
+from .queue import QueueDB, execute_prepared, to_jsonb
 from .token_manager import TokenManager, load_refresh_token
 
 logger = logging.getLogger(__name__)
@@ -26,11 +34,28 @@ app = FastAPI(
     title="Emby Processor Dashboard",
     description="Queue monitoring and manual controls for emby-processor",
     version="0.5.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Path normalization regex for Prometheus labels (avoid cardinality explosion)
 _ID_PATTERN = re.compile(r'/\d+')
 
+# Route template -> endpoint label, e.g. '/api/queue/{item_id}' -> '/api/queue/{id}'
+_ROUTE_LABELS: dict[str, str] = {}
+_PATH_PARAM_PATTERN = re.compile(r'\{[^}]+\}')
+
+
+def _endpoint_label(scope) -> str:
+    """Metrics label for a request: the matched route template with path
+    params spelled ``{id}``; unmatched paths fall back to the regex."""
+    route = scope.get('route')
+    if route is None:
+        return _ID_PATTERN.sub('/{id}', scope['path'])
+    label = _ROUTE_LABELS.get(route.path)
+    if label is None:
+        label = _ROUTE_LABELS[route.path] = _PATH_PARAM_PATTERN.sub('{id}', route.path)
+    return label
+
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     """Record request duration for dashboard endpoints."""
@@ -44,8 +69,8 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
         duration = _time.monotonic() - start
 
-        # Normalize path: replace numeric IDs with {id}
-        endpoint = _ID_PATTERN.sub('/{id}', request.url.path)
+        # Normalize path: the router stored the matched route in the scope
+        endpoint = _endpoint_label(request.scope)
 
         DASHBOARD_REQUEST_DURATION.labels(
             method=request.method,
@@ -56,45 +81,334 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return response
 
 
-# Add CORS middleware (allow all origins for LAN access)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS policy is fixed (any origin, method and header, with credentials, for
+# LAN access), so the response headers are built once here
+_CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-credentials", b"true"),
+]
+_CORS_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-allow-credentials", b"true"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+]
+_CORS_PREFLIGHT_BODY = {"type": "http.response.body", "body": b"OK"}
+
+
+class CORSHeadersMiddleware:
+    """Pure-ASGI CORS for the allow-everything policy.
+
+    Mirrors Starlette's ``CORSMiddleware(allow_origins=["*"],
+    allow_credentials=True, allow_methods=["*"], allow_headers=["*"])``:
+    requests without an ``Origin`` header pass through untouched, preflights
+    are answered directly, and other cross-origin responses get the
+    precomputed headers (echoing the origin when a cookie is sent, since
+    browsers reject ``*`` on credentialed requests).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = cookie = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"cookie":
+                cookie = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = [(b"access-control-allow-origin", origin), *_CORS_PREFLIGHT_HEADERS]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send(_CORS_PREFLIGHT_BODY)
+            return
+
+        if cookie is None:
+            cors_headers = _CORS_HEADERS
+        else:
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(CORSHeadersMiddleware)
+
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """Render HTTPException details with orjson, like FastAPI's default handler."""
+    if exc.status_code in (204, 304) or exc.status_code < 200:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
 
 # Add metrics middleware (outermost to capture full request duration)
 app.add_middleware(MetricsMiddleware)
 
+# Hot statements, run as server-side prepared statements so Postgres parses
+# and plans each one once per pooled connection (see execute_prepared)
+_STATEMENTS = {
+    'api_metrics_summary': """
+        SELECT COUNT(*) FILTER (WHERE status = 'completed'),
+               COUNT(*) FILTER (WHERE status = 'error'),
+               AVG(EXTRACT(EPOCH FROM (updated_at - created_at)))
+                   FILTER (WHERE status = 'completed')
+        FROM processing_queue
+        WHERE status IN ('completed', 'error')
+          AND updated_at >= NOW() - INTERVAL '24 hours'
+    """,
+    'api_stats': """
+        SELECT 'status', status, COUNT(*)
+        FROM processing_queue
+        GROUP BY status
+        UNION ALL
+        (SELECT 'actress', actress, COUNT(*)
+         FROM processing_queue
+         WHERE actress IS NOT NULL AND status = 'completed'
+         GROUP BY actress
+         ORDER BY 3 DESC
+         LIMIT 10)
+    """,
+    'api_item_detail': """
+        SELECT id, file_path, movie_code, actress, subtitle, status,
+               error_message, new_path, emby_item_id, metadata_json,
+               retry_count, next_retry_at, created_at, updated_at
+        FROM processing_queue
+        WHERE id = $1
+    """,
+    'api_item_status': "SELECT status FROM processing_queue WHERE id = $1",
+    'api_item_status_new_path': "SELECT status, new_path FROM processing_queue WHERE id = $1",
+    'api_item_file_path': "SELECT file_path FROM processing_queue WHERE id = $1",
+    'api_item_movie_code': "SELECT movie_code FROM processing_queue WHERE id = $1",
+    'api_item_for_rename': """
+        SELECT file_path, movie_code, subtitle, metadata_json
+        FROM processing_queue WHERE id = $1
+    """,
+    'api_item_for_emby': """
+        SELECT movie_code, emby_item_id, status, new_path
+        FROM processing_queue WHERE id = $1
+    """,
+    'api_item_file_status': "SELECT file_path, status FROM processing_queue WHERE id = $1",
+    'api_item_paths_status': "SELECT file_path, new_path, status FROM processing_queue WHERE id = $1",
+    'api_item_for_run_all': "SELECT file_path, emby_item_id FROM processing_queue WHERE id = $1",
+}
+
+
+def _execute(cur, name: str, *params):
+    """Run one of the prepared ``_STATEMENTS`` on ``cur``."""
+    execute_prepared(cur, name, _STATEMENTS[name], params)
+
+
 # Global QueueDB instance (initialized on startup)
 queue_db: Optional[QueueDB] = None
 
 # Global TokenManager instance (initialized on startup)
 _token_manager: Optional[TokenManager] = None
 
+# /api/config payload; built once on startup since it only reflects env vars
+_CONFIG_RESPONSE: Optional[Response] = None
+_CONFIG_ETAG: Optional[str] = None
+
+# Dashboard HTML and its ETag, loaded once on startup (shipped in the image)
+_DASHBOARD_PATH = Path(__file__).parent / "static" / "dashboard.html"
+_DASHBOARD_HTML: Optional[bytes] = None
+_DASHBOARD_ETAG: Optional[str] = None
+
+
+# Informational "timestamp" field of JSON responses, refreshed in the
+# background by _now_updater() so requests don't each format a datetime
+_NOW_INTERVAL = 0.25  # seconds
+_NOW_STR: str = datetime.now(timezone.utc).isoformat()
+_NOW_TASK: Optional[asyncio.Task] = None
+
+
+async def _now_updater():
+    """Refresh ``_NOW_STR`` every ``_NOW_INTERVAL`` seconds until cancelled."""
+    global _NOW_STR
+    while True:
+        await asyncio.sleep(_NOW_INTERVAL)
+        _NOW_STR = datetime.now(timezone.utc).isoformat()
+
+
+# Short-lived cache of poll-heavy responses (/api/logs, /api/downloads) so
+# concurrent dashboard pollers share one backend call per window. Keys start
+# with the endpoint's kind; each kind has one build lock and a generation
+# that _poll_cache_invalidate bumps, so a build that started before an
+# invalidation is never stored.
+POLL_CACHE_TTL = 1.0  # seconds
+_POLL_CACHE: dict[tuple, tuple[float, Response]] = {}
+_POLL_CACHE_LOCKS: dict[str, threading.Lock] = {}
+_POLL_CACHE_GENERATIONS: dict[str, int] = {}
+_POLL_CACHE_GUARD = threading.Lock()
+
+
+def _poll_cached(key: tuple, build) -> Response:
+    """Return the cached response for ``key``, rebuilding it when expired.
+
+    Concurrent misses for the same endpoint wait for a single ``build()``
+    call; its result is rendered once and served until ``POLL_CACHE_TTL``
+    passes.
+    """
+    entry = _POLL_CACHE.get(key)
+    if entry and entry[0] > _time.monotonic():
+        return entry[1]
+    kind = key[0]
+    with _POLL_CACHE_GUARD:
+        lock = _POLL_CACHE_LOCKS.setdefault(kind, threading.Lock())
+    with lock:
+        entry = _POLL_CACHE.get(key)
+        if entry and entry[0] > _time.monotonic():
+            return entry[1]
+        generation = _POLL_CACHE_GENERATIONS.get(kind, 0)
+        response = ORJSONResponse(build())
+        now = _time.monotonic()
+        with _POLL_CACHE_GUARD:
+            if _POLL_CACHE_GENERATIONS.get(kind, 0) == generation:
+                if len(_POLL_CACHE) > 256:
+                    for stale in [k for k, (expires, _) in _POLL_CACHE.items() if expires <= now]:
+                        del _POLL_CACHE[stale]
+                _POLL_CACHE[key] = (now + POLL_CACHE_TTL, response)
+        return response
+
+
+def _poll_cache_invalidate(kind: str):
+    """Drop cached responses whose key starts with ``kind``.
+
+    Builds already in flight for ``kind`` still answer their own request but
+    are not cached.
+    """
+    with _POLL_CACHE_GUARD:
+        _POLL_CACHE_GENERATIONS[kind] = _POLL_CACHE_GENERATIONS.get(kind, 0) + 1
+        for key in [k for k in _POLL_CACHE if k[0] == kind]:
+            del _POLL_CACHE[key]
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a static response body."""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names ``etag``."""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    return any(tag.strip() in (etag, f'W/{etag}', '*') for tag in header.split(','))
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+
+# API pool size: enough for concurrent dashboard requests without crowding
+# the workers' own pools out of the server's max_connections
+DB_POOL_MAX_SIZE = min((os.cpu_count() or 1) * 2, 10)
+# psycopg2's pool closes any connection returned while it already holds
+# minconn idle ones, so keep the whole pool open: otherwise concurrent
+# requests reconnect and lose their prepared statements
+DB_POOL_MIN_SIZE = DB_POOL_MAX_SIZE
+
+# Concurrent metadata searches / Emby updates in /api/bulk/refresh-metadata,
+# and the separate workers draining its Emby image uploads
+BULK_REFRESH_CONCURRENCY = 8
+BULK_IMAGE_UPLOAD_WORKERS = 4
+# Failures kept for the bulk refresh response; the rest are only counted and logged
+BULK_FAILED_ITEMS_LIMIT = 10
+
+
+def _create_queue_db() -> QueueDB:
+    """Create and initialize the QueueDB from environment variables."""
+    database_url = os.getenv('DATABASE_URL', '')
+    if database_url:
+        db = QueueDB(database_url=database_url,
+                     minconn=DB_POOL_MIN_SIZE, maxconn=DB_POOL_MAX_SIZE)
+    else:
+        db = QueueDB(
+            minconn=DB_POOL_MIN_SIZE,
+            maxconn=DB_POOL_MAX_SIZE,
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=os.getenv('DB_PORT', '5432'),
+            dbname=os.getenv('DB_NAME', 'emby_processor'),
+            user=os.getenv('DB_USER', 'emby'),
+            password=os.getenv('DB_PASSWORD', ''),
+        )
+    db.initialize()
+    return db
+
+
+# Executor for blocking endpoint bodies (psycopg2 queries, outbound HTTP).
+# Sized to the pool; the pool is shared with the download threads, so a
+# checkout made while every connection is out waits for one to be returned
+# (see QueueDB) rather than failing. Created on startup.
+_DB_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _offload(fn):
+    """Turn a blocking endpoint into a coroutine that runs on ``_DB_EXECUTOR``.
+
+    The connection is borrowed and returned inside ``fn``, so it never
+    crosses threads; the event loop stays free for other requests.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await _run_blocking(fn, *args, **kwargs)
+    return wrapper
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """Await ``fn(*args, **kwargs)`` on ``_DB_EXECUTOR``."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DB_EXECUTOR, functools.partial(fn, *args, **kwargs))
+
 
 def get_queue_db() -> QueueDB:
-    """Get or create QueueDB instance."""
-    global queue_db
+    """FastAPI dependency returning the QueueDB created at startup."""
     if queue_db is None:
-        # Load database config from environment
-        database_url = os.getenv('DATABASE_URL', '')
-        if database_url:
-            queue_db = QueueDB(database_url=database_url)
-        else:
-            queue_db = QueueDB(
-                host=os.getenv('DB_HOST', 'localhost'),
-                port=os.getenv('DB_PORT', '5432'),
-                dbname=os.getenv('DB_NAME', 'emby_processor'),
-                user=os.getenv('DB_USER', 'emby'),
-                password=os.getenv('DB_PASSWORD', ''),
-            )
-        queue_db.initialize()
+        raise HTTPException(status_code=503, detail="Database not initialized")
     return queue_db
 
 
+def get_metadata_client() -> MetadataClient:
+    """FastAPI dependency returning the shared MetadataClient."""
+    return app.state.metadata_client
+
+
+def get_emby_client() -> Optional[EmbyClient]:
+    """FastAPI dependency returning the shared EmbyClient (None if Emby is not configured)."""
+    return app.state.emby_client
+
+
+def get_downloader() -> DownloadManager:
+    """FastAPI dependency returning the shared DownloadManager."""
+    return app.state.download_manager
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database connection on startup."""
@@ -112,12 +426,32 @@ async def startup_event():
     )
     log_buffer.setFormatter(formatter)
 
-    # Initialize database
-    db = get_queue_db()
+    # Keep the cached response timestamp fresh
+    global _NOW_TASK
+    _NOW_TASK = asyncio.create_task(_now_updater())
+
+    # Initialize database and the executor its blocking calls run on
+    global queue_db, _DB_EXECUTOR
+    queue_db = db = _create_queue_db()
+    _DB_EXECUTOR = ThreadPoolExecutor(max_workers=DB_POOL_MAX_SIZE, thread_name_prefix='api-db')
+
+    # Frontend config never changes after start, so render it once
+    global _CONFIG_RESPONSE, _CONFIG_ETAG, _DASHBOARD_HTML, _DASHBOARD_ETAG
+    _CONFIG_RESPONSE = ORJSONResponse({
+        "emby_public_url": os.getenv('EMBY_PUBLIC_URL', ''),
+        "emby_server_id": os.getenv('EMBY_SERVER_ID', ''),
+    })
+    _CONFIG_ETAG = _etag(_CONFIG_RESPONSE.body)
+    _CONFIG_RESPONSE.headers['ETag'] = _CONFIG_ETAG
+    _CONFIG_RESPONSE.headers['Cache-Control'] = 'no-cache'
+
+    # Same for the dashboard page, so polling clients can revalidate with a 304
+    if _DASHBOARD_PATH.exists():
+        _DASHBOARD_HTML = _DASHBOARD_PATH.read_bytes()
+        _DASHBOARD_ETAG = _etag(_DASHBOARD_HTML)
 
     # Initialize download manager with DB access
-    from .downloader import get_download_manager
-    get_download_manager(queue_db=db)
+    app.state.download_manager = get_download_manager(queue_db=db)
 
     # Initialize token manager
     global _token_manager
@@ -138,6 +472,31 @@ async def startup_event():
     else:
         logger.warning("No refresh token found — token auto-refresh disabled in API process")
 
+    # Shared HTTP clients, reused by all requests over one keep-alive session
+    app.state.http_session = create_http_session()
+    app.state.metadata_client = MetadataClient(
+        base_url=os.getenv('API_BASE_URL', ''),
+        token=os.getenv('API_TOKEN', ''),
+        token_manager=_token_manager,
+        cache_soft_ttl=SEARCH_CACHE_SOFT_TTL,
+        cache_hard_ttl=SEARCH_CACHE_HARD_TTL,
+        session=app.state.http_session,
+    )
+    app.state.emby_client = None
+    emby_base_url = os.getenv('EMBY_BASE_URL', '')
+    emby_api_key = os.getenv('EMBY_API_KEY', '')
+    if emby_base_url and emby_api_key:
+        app.state.emby_client = EmbyClient(
+            base_url=emby_base_url,
+            api_key=emby_api_key,
+            parent_folder_id=os.getenv('EMBY_PARENT_FOLDER_ID', '4'),
+            user_id=os.getenv('EMBY_USER_ID', ''),
+            wordpress_token=os.getenv('API_TOKEN', ''),
+            token_manager=_token_manager,
+            verify_updates=os.getenv('EMBY_VERIFY_UPDATES', 'false').lower() == 'true',
+            session=app.state.http_session,
+        )
+
     logger.info("=== FastAPI dashboard started ===")
     logger.info(f"Log buffer has {len(log_buffer.buffer)} entries")
     logger.info(f"Root logger handlers: {[type(h).__name__ for h in root_logger.handlers]}")
@@ -146,10 +505,28 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Close database connection and token manager on shutdown."""
-    global queue_db, _token_manager
+    global queue_db, _token_manager, _DB_EXECUTOR, _NOW_TASK
+    if _NOW_TASK:
+        _NOW_TASK.cancel()
+        _NOW_TASK = None
+    metadata_client = getattr(app.state, 'metadata_client', None)
+    if metadata_client:
+        metadata_client.close()
+        app.state.metadata_client = None
+    emby_client = getattr(app.state, 'emby_client', None)
+    if emby_client:
+        emby_client.close()
+        app.state.emby_client = None
+    http_session = getattr(app.state, 'http_session', None)
+    if http_session:
+        http_session.close()
+        app.state.http_session = None
     if _token_manager:
         _token_manager.stop()
         _token_manager = None
+    if _DB_EXECUTOR:
+        _DB_EXECUTOR.shutdown(wait=True)
+        _DB_EXECUTOR = None
     if queue_db:
         queue_db.close()
         queue_db = None
@@ -157,37 +534,37 @@ async def shutdown_event():
 
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
+async def dashboard(request: Request):
     """Serve the dashboard HTML page."""
-    dashboard_path = Path(__file__).parent / "static" / "dashboard.html"
-    if not dashboard_path.exists():
+    if _DASHBOARD_HTML is None:
         return HTMLResponse(
             content="<h1>Dashboard not found</h1><p>dashboard.html is missing</p>",
             status_code=404,
         )
-    return HTMLResponse(content=dashboard_path.read_text())
+    if _etag_matches(request, _DASHBOARD_ETAG):
+        return _not_modified(_DASHBOARD_ETAG)
+    return HTMLResponse(
+        content=_DASHBOARD_HTML,
+        headers={'ETag': _DASHBOARD_ETAG, 'Cache-Control': 'no-cache'},
+    )
 
 
 @app.get("/api/config")
-async def get_config():
+async def get_config(request: Request):
     """Get frontend configuration (Emby public URL, server ID)."""
-    return {
-        "emby_public_url": os.getenv('EMBY_PUBLIC_URL', ''),
-        "emby_server_id": os.getenv('EMBY_SERVER_ID', ''),
-    }
+    if _etag_matches(request, _CONFIG_ETAG):
+        return _not_modified(_CONFIG_ETAG)
+    return _CONFIG_RESPONSE
 
 
 @app.get("/api/health")
-async def health():
+@_offload
+def health(db: QueueDB = Depends(get_queue_db)):
     """Get system health status."""
-    db = get_queue_db()
-
     # Check database connection
     try:
-        conn = db._get_conn()
-        with conn.cursor() as cur:
+        with db.connection() as conn, conn.cursor() as cur:
             cur.execute("SELECT 1")
-        db._put_conn(conn)
         db_status = "connected"
     except Exception as e:
         db_status = f"error: {e}"
@@ -195,7 +572,7 @@ async def health():
     # TODO: Check worker status (would need IPC or shared state)
     # For now, just return placeholder
 
-    return {
+    return ORJSONResponse({
         "status": "healthy" if db_status == "connected" else "degraded",
         "database": db_status,
         "workers": {
@@ -203,18 +580,19 @@ async def health():
             "EmbyUpdater": "unknown",
             "RetryHandler": "unknown",
         },
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+        "timestamp": _NOW_STR,
+    })
 
 
 @app.get("/metrics")
-async def prometheus_metrics():
+@_offload
+def prometheus_metrics(db: QueueDB = Depends(get_queue_db)):
     """Expose Prometheus metrics (multiprocess-safe)."""
     from prometheus_client import CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
     from prometheus_client.multiprocess import MultiProcessCollector
 
     # Refresh queue/download gauges from DB before generating output
-    _refresh_queue_gauges()
+    _refresh_queue_gauges(db)
 
     registry = CollectorRegistry()
     MultiProcessCollector(registry)
@@ -223,270 +601,234 @@ async def prometheus_metrics():
 
 
 @app.get("/api/metrics-summary")
-async def metrics_summary():
+@_offload
+def metrics_summary(db: QueueDB = Depends(get_queue_db)):
     """JSON summary of key metrics for the last 24 hours."""
-    db = get_queue_db()
-    conn = db._get_conn()
-
+    with db.connection() as conn, conn.cursor() as cur:
+        # Single scan/round-trip: completed and error counts plus the
+        # average processing time (created_at -> updated_at) of completed items
+        _execute(cur, 'api_metrics_summary')
+        completed_24h, errors_24h, avg_row = cur.fetchone()
+        avg_processing_seconds = round(float(avg_row), 2) if avg_row else 0.0
+
+    total_24h = completed_24h + errors_24h
+    error_rate_24h = round(errors_24h / total_24h, 4) if total_24h > 0 else 0.0
+
+    return ORJSONResponse({
+        "completed_24h": completed_24h,
+        "errors_24h": errors_24h,
+        "avg_processing_seconds": avg_processing_seconds,
+        "error_rate_24h": error_rate_24h,
+        "timestamp": _NOW_STR,
+    })
+
+
+def _refresh_queue_gauges(db: QueueDB):
+    """Update queue/download depth gauges from the database."""
     try:
-        with conn.cursor() as cur:
-            # Completed in last 24h
+        with db.connection() as conn, conn.cursor() as cur:
+            # Queue and download depth by status in one round-trip
             cur.execute("""
-                SELECT COUNT(*) FROM processing_queue
-                WHERE status = 'completed'
-                  AND updated_at >= NOW() - INTERVAL '24 hours'
+                SELECT 'queue', status, COUNT(*) FROM processing_queue GROUP BY status
+                UNION ALL
+                SELECT 'downloads', status, COUNT(*) FROM download_jobs GROUP BY status
             """)
-            completed_24h = cur.fetchone()[0]
+            rows = cur.fetchall()
+
+        # Reset all known statuses to 0 first
+        for s in ('pending', 'processing', 'moved', 'emby_pending', 'completed', 'error'):
+            QUEUE_DEPTH.labels(status=s).set(0)
+        for s in ('queued', 'downloading', 'completed', 'failed'):
+            DOWNLOADS_DEPTH.labels(status=s).set(0)
+        for source, status, count in rows:
+            gauge = QUEUE_DEPTH if source == 'queue' else DOWNLOADS_DEPTH
+            gauge.labels(status=status).set(count)
+    except Exception as e:
+        logger.warning('Failed to refresh queue gauges: %s', e)
 
-            # Errors in last 24h
-            cur.execute("""
-                SELECT COUNT(*) FROM processing_queue
-                WHERE status = 'error'
-                  AND updated_at >= NOW() - INTERVAL '24 hours'
-            """)
-            errors_24h = cur.fetchone()[0]
 
-            # Average processing time (created_at -> updated_at for completed items in last 24h)
-            cur.execute("""
-                SELECT AVG(EXTRACT(EPOCH FROM (updated_at - created_at)))
-                FROM processing_queue
-                WHERE status = 'completed'
-                  AND updated_at >= NOW() - INTERVAL '24 hours'
-            """)
-            avg_row = cur.fetchone()[0]
-            avg_processing_seconds = round(float(avg_row), 2) if avg_row else 0.0
+@app.get("/api/stats")
+@_offload
+def stats(db: QueueDB = Depends(get_queue_db)):
+    """Get queue statistics."""
+    with db.connection() as conn, conn.cursor() as cur:
+        # Counts by status and top actresses in one round-trip; the
+        # overall total is the sum of the per-status counts
+        _execute(cur, 'api_stats')
+        status_counts = {}
+        by_actress = {}
+        for kind, key, count in cur.fetchall():
+            if kind == 'status':
+                status_counts[key] = count
+            else:
+                by_actress[key] = count
+        total = sum(status_counts.values())
 
-        total_24h = completed_24h + errors_24h
-        error_rate_24h = round(errors_24h / total_24h, 4) if total_24h > 0 else 0.0
+    return ORJSONResponse({
+        "total": total,
+        "completed": status_counts.get('completed', 0),
+        "pending": status_counts.get('pending', 0),
+        "processing": status_counts.get('processing', 0),
+        "moved": status_counts.get('moved', 0),
+        "emby_pending": status_counts.get('emby_pending', 0),
+        "error": status_counts.get('error', 0),
+        "by_actress": by_actress,
+        "timestamp": _NOW_STR,
+    })
+
+
+def _build_queue_sql(by_status: bool, by_search: bool) -> tuple[str, str]:
+    """Build the (items, count) SQL for one /api/queue filter combination."""
+    where_clauses = []
+    if by_status:
+        where_clauses.append("status = %s")
+    if by_search:
+        where_clauses.append("(movie_code ILIKE %s OR actress ILIKE %s)")
+    where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+
+    items_sql = f"""
+        SELECT id, file_path, movie_code, actress, subtitle, status,
+               error_message, new_path, emby_item_id, retry_count,
+               created_at, updated_at,
+               (metadata_json IS NOT NULL) as has_metadata,
+               COUNT(*) OVER () as total
+        FROM processing_queue
+        {where_sql}
+        ORDER BY created_at DESC
+        LIMIT %s OFFSET %s
+    """
+    count_sql = f"SELECT COUNT(*) FROM processing_queue {where_sql}"
+    return items_sql, count_sql
 
-        return {
-            "completed_24h": completed_24h,
-            "errors_24h": errors_24h,
-            "avg_processing_seconds": avg_processing_seconds,
-            "error_rate_24h": error_rate_24h,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-    finally:
-        db._put_conn(conn)
 
+# /api/queue SQL for every filter combination, keyed by (status?, search?)
+_QUEUE_SQL = {
+    (by_status, by_search): _build_queue_sql(by_status, by_search)
+    for by_status in (False, True)
+    for by_search in (False, True)
+}
 
-def _refresh_queue_gauges():
-    """Update queue/download depth gauges from the database."""
-    try:
-        db = get_queue_db()
-        conn = db._get_conn()
-        try:
-            with conn.cursor() as cur:
-                # Queue depth by status
-                cur.execute("""
-                    SELECT status, COUNT(*) FROM processing_queue GROUP BY status
-                """)
-                # Reset all known statuses to 0 first
-                for s in ('pending', 'processing', 'moved', 'emby_pending', 'completed', 'error'):
-                    QUEUE_DEPTH.labels(status=s).set(0)
-                for row in cur.fetchall():
-                    QUEUE_DEPTH.labels(status=row[0]).set(row[1])
-
-                # Download depth by status
-                cur.execute("""
-                    SELECT status, COUNT(*) FROM download_jobs GROUP BY status
-                """)
-                for s in ('queued', 'downloading', 'completed', 'failed'):
-                    DOWNLOADS_DEPTH.labels(status=s).set(0)
-                for row in cur.fetchall():
-                    DOWNLOADS_DEPTH.labels(status=row[0]).set(row[1])
-        finally:
-            db._put_conn(conn)
-    except Exception as e:
-        logger.warning('Failed to refresh queue gauges: %s', e)
 
+def _queue_item(row) -> dict:
+    """Shape one /api/queue row for the response."""
+    return {
+        "id": row[0],
+        "file_path": row[1],
+        "movie_code": row[2],
+        "actress": row[3],
+        "subtitle": row[4],
+        "status": row[5],
+        "error_message": row[6],
+        "new_path": row[7],
+        "emby_item_id": row[8],
+        "retry_count": row[9],
+        "created_at": row[10],
+        "updated_at": row[11],
+        "has_metadata": bool(row[12]),
+    }
 
-@app.get("/api/stats")
-async def stats():
-    """Get queue statistics."""
-    db = get_queue_db()
-    conn = db._get_conn()
 
-    try:
-        with conn.cursor() as cur:
-            # Total counts by status
-            cur.execute("""
-                SELECT status, COUNT(*) as count
-                FROM processing_queue
-                GROUP BY status
-            """)
-            status_counts = {row[0]: row[1] for row in cur.fetchall()}
+def _queue_page_body(db: QueueDB, status: Optional[str], search: Optional[str],
+                     limit: int, offset: int) -> bytes:
+    """Run the /api/queue query and encode the page as JSON.
 
-            # Total items
-            cur.execute("SELECT COUNT(*) FROM processing_queue")
+    Pages are capped at 1000 rows, so the whole page is fetched and the
+    connection is back in the pool before any byte goes to the client.
+    ``total`` rides along on every row via the window count, so only an
+    empty page past the first needs a separate COUNT.
+    """
+    items_sql, count_sql = _QUEUE_SQL[(bool(status), bool(search))]
+    params = []
+    if status:
+        params.append(status)
+    if search:
+        search_pattern = f"%{search}%"
+        params.extend([search_pattern, search_pattern])
+
+    with db.connection() as conn, conn.cursor() as cur:
+        cur.execute(items_sql, params + [limit, offset])
+        rows = cur.fetchall()
+        if rows:
+            total = rows[0][13]
+        elif offset:
+            cur.execute(count_sql, params)
             total = cur.fetchone()[0]
+        else:
+            total = 0
 
-            # Top actresses
-            cur.execute("""
-                SELECT actress, COUNT(*) as count
-                FROM processing_queue
-                WHERE actress IS NOT NULL AND status = 'completed'
-                GROUP BY actress
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            by_actress = {row[0]: row[1] for row in cur.fetchall()}
-
-        return {
-            "total": total,
-            "completed": status_counts.get('completed', 0),
-            "pending": status_counts.get('pending', 0),
-            "processing": status_counts.get('processing', 0),
-            "moved": status_counts.get('moved', 0),
-            "emby_pending": status_counts.get('emby_pending', 0),
-            "error": status_counts.get('error', 0),
-            "by_actress": by_actress,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-    finally:
-        db._put_conn(conn)
+    return orjson.dumps({
+        "items": [_queue_item(row) for row in rows],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
 
 
 @app.get("/api/queue")
-async def get_queue(
+@_offload
+def get_queue(
     status: Optional[str] = Query(None, description="Filter by status"),
     search: Optional[str] = Query(None, description="Search movie code or actress"),
     limit: int = Query(50, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    db: QueueDB = Depends(get_queue_db),
 ):
     """Get queue items with filters and pagination."""
-    db = get_queue_db()
-    conn = db._get_conn()
-
-    try:
-        # Build query
-        where_clauses = []
-        params = []
-
-        if status:
-            where_clauses.append("status = %s")
-            params.append(status)
-
-        if search:
-            where_clauses.append("(movie_code ILIKE %s OR actress ILIKE %s)")
-            search_pattern = f"%{search}%"
-            params.extend([search_pattern, search_pattern])
-
-        where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
-
-        # Get items
-        with conn.cursor() as cur:
-            cur.execute(f"""
-                SELECT id, file_path, movie_code, actress, subtitle, status,
-                       error_message, new_path, emby_item_id, retry_count,
-                       created_at, updated_at,
-                       (metadata_json IS NOT NULL) as has_metadata
-                FROM processing_queue
-                {where_sql}
-                ORDER BY created_at DESC
-                LIMIT %s OFFSET %s
-            """, params + [limit, offset])
-
-            items = []
-            for row in cur.fetchall():
-                items.append({
-                    "id": row[0],
-                    "file_path": row[1],
-                    "movie_code": row[2],
-                    "actress": row[3],
-                    "subtitle": row[4],
-                    "status": row[5],
-                    "error_message": row[6],
-                    "new_path": row[7],
-                    "emby_item_id": row[8],
-                    "retry_count": row[9],
-                    "created_at": row[10].isoformat() if row[10] else None,
-                    "updated_at": row[11].isoformat() if row[11] else None,
-                    "has_metadata": bool(row[12]),
-                })
-
-            # Get total count
-            cur.execute(f"""
-                SELECT COUNT(*) FROM processing_queue {where_sql}
-            """, params)
-            total = cur.fetchone()[0]
-
-        return {
-            "items": items,
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
-    finally:
-        db._put_conn(conn)
+    return Response(
+        content=_queue_page_body(db, status, search, limit, offset),
+        media_type="application/json",
+    )
 
 
 @app.get("/api/queue/{item_id}")
-async def get_queue_item(item_id: int):
+@_offload
+def get_queue_item(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Get detailed information for a specific queue item."""
-    db = get_queue_db()
-    conn = db._get_conn()
-
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, file_path, movie_code, actress, subtitle, status,
-                       error_message, new_path, emby_item_id, metadata_json,
-                       retry_count, next_retry_at, created_at, updated_at
-                FROM processing_queue
-                WHERE id = %s
-            """, (item_id,))
-
-            row = cur.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Item not found")
-
-            # Parse metadata JSON
-            metadata_json = row[9]
-            if isinstance(metadata_json, str):
-                metadata_json = json.loads(metadata_json)
-
-            return {
-                "id": row[0],
-                "file_path": row[1],
-                "movie_code": row[2],
-                "actress": row[3],
-                "subtitle": row[4],
-                "status": row[5],
-                "error_message": row[6],
-                "new_path": row[7],
-                "emby_item_id": row[8],
-                "metadata_json": metadata_json,
-                "retry_count": row[10],
-                "next_retry_at": row[11].isoformat() if row[11] else None,
-                "created_at": row[12].isoformat() if row[12] else None,
-                "updated_at": row[13].isoformat() if row[13] else None,
-            }
-    finally:
-        db._put_conn(conn)
+    with db.connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'api_item_detail', item_id)
+        row = cur.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        # Parse metadata JSON
+        metadata_json = row[9]
+        if isinstance(metadata_json, str):
+            metadata_json = orjson.loads(metadata_json)
+
+        return ORJSONResponse({
+            "id": row[0],
+            "file_path": row[1],
+            "movie_code": row[2],
+            "actress": row[3],
+            "subtitle": row[4],
+            "status": row[5],
+            "error_message": row[6],
+            "new_path": row[7],
+            "emby_item_id": row[8],
+            "metadata_json": metadata_json,
+            "retry_count": row[10],
+            "next_retry_at": row[11],
+            "created_at": row[12],
+            "updated_at": row[13],
+        })
 
 
 @app.post("/api/queue/{item_id}/retry")
-async def retry_item(item_id: int):
+@_offload
+def retry_item(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Manually retry a failed queue item."""
-    db = get_queue_db()
-
     # Get item to verify it exists and is in error state
-    conn = db._get_conn()
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT status FROM processing_queue WHERE id = %s", (item_id,))
-            row = cur.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Item not found")
-
-            if row[0] != 'error':
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Item is not in error state (current: {row[0]})"
-                )
-    finally:
-        db._put_conn(conn)
+    with db.connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'api_item_status', item_id)
+        row = cur.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        if row[0] != 'error':
+            raise HTTPException(
+                status_code=400,
+                detail=f"Item is not in error state (current: {row[0]})"
+            )
 
     # Reset for retry
     db.reset_for_retry(item_id)
@@ -499,59 +841,49 @@ async def retry_item(item_id: int):
 
 
 @app.post("/api/queue/{item_id}/reprocess-metadata")
-async def reprocess_metadata(item_id: int):
+@_offload
+def reprocess_metadata(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Re-fetch metadata and update Emby for a completed item."""
-    db = get_queue_db()
-    conn = db._get_conn()
-
-    try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT status, new_path FROM processing_queue WHERE id = %s", (item_id,))
-            row = cur.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Item not found")
-
-            if row[0] != 'completed':
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Item must be completed to reprocess metadata (current: {row[0]})"
-                )
+    with db.connection() as conn, conn.cursor() as cur:
+        _execute(cur, 'api_item_status_new_path', item_id)
+        row = cur.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Item not found")
+
+        if row[0] != 'completed':
+            raise HTTPException(
+                status_code=400,
+                detail=f"Item must be completed to reprocess metadata (current: {row[0]})"
+            )
 
-            if not row[1]:
-                raise HTTPException(status_code=400, detail="Item has no new_path (file not moved)")
+        if not row[1]:
+            raise HTTPException(status_code=400, detail="Item has no new_path (file not moved)")
 
-            # Reset to moved state to trigger EmbyUpdater reprocessing
-            cur.execute("""
-                UPDATE processing_queue
-                SET status = 'moved', updated_at = NOW()
-                WHERE id = %s
-            """, (item_id,))
-            conn.commit()
+        # Reset to moved state to trigger EmbyUpdater reprocessing
+        cur.execute("""
+            UPDATE processing_queue
+            SET status = 'moved', updated_at = NOW()
+            WHERE id = %s
+        """, (item_id,))
+        conn.commit()
 
-        return {
-            "success": True,
-            "message": f"Item {item_id} reset to moved for metadata reprocessing",
-            "item_id": item_id,
-        }
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        db._put_conn(conn)
+    return {
+        "success": True,
+        "message": f"Item {item_id} reset to moved for metadata reprocessing",
+        "item_id": item_id,
+    }
 
 
 @app.post("/api/queue/{item_id}/actions/extract-code")
-async def action_extract_code(item_id: int):
+@_offload
+def action_extract_code(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Re-extract movie code and subtitle from filename."""
     from .extractor import extract_movie_code, detect_subtitle
 
     logger.info(f"[API Action] Extract code requested for item {item_id}")
-    db = get_queue_db()
-    conn = db._get_conn()
-
     try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT file_path FROM processing_queue WHERE id = %s", (item_id,))
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_file_path', item_id)
             row = cur.fetchone()
             if not row:
                 logger.warning(f"[API Action] Item {item_id} not found")
@@ -593,29 +925,24 @@ async def action_extract_code(item_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to extract code for item {item_id}")
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
 @app.post("/api/queue/{item_id}/actions/fetch-metadata")
-async def action_fetch_metadata(
+@_offload
+def action_fetch_metadata(
     item_id: int,
-    fresh: bool = Query(False, description="Force fresh metadata (bypass cache)")
+    fresh: bool = Query(False, description="Force fresh metadata (bypass cache)"),
+    db: QueueDB = Depends(get_queue_db),
+    metadata_client: MetadataClient = Depends(get_metadata_client),
 ):
     """Re-fetch metadata from WordPress API."""
-    from .metadata import MetadataClient
-
     fresh_text = " (FORCE FRESH)" if fresh else ""
     logger.info(f"[API Action] Fetch metadata requested for item {item_id}{fresh_text}")
-    db = get_queue_db()
-    conn = db._get_conn()
-
     try:
-        with conn.cursor() as cur:
-            cur.execute("SELECT movie_code FROM processing_queue WHERE id = %s", (item_id,))
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_movie_code', item_id)
             row = cur.fetchone()
             if not row:
                 logger.warning(f"[API Action] Item {item_id} not found")
@@ -632,12 +959,6 @@ async def action_fetch_metadata(
             logger.info(f"[API Action] Fetching metadata for: {movie_code}{fresh_text}")
 
             # Fetch metadata
-            metadata_client = MetadataClient(
-                base_url=os.getenv('API_BASE_URL', ''),
-                token=os.getenv('API_TOKEN', ''),
-                token_manager=_token_manager,
-            )
-
             metadata = metadata_client.search(movie_code, fresh=fresh)
             if not metadata:
                 logger.warning(f"[API Action] No metadata found for {movie_code}")
@@ -655,7 +976,7 @@ async def action_fetch_metadata(
                 UPDATE processing_queue
                 SET metadata_json = %s, updated_at = NOW()
                 WHERE id = %s
-            """, (json.dumps(metadata), item_id))
+            """, (to_jsonb(metadata), item_id))
             conn.commit()
 
             logger.info(f"[API Action] Item {item_id} metadata updated")
@@ -671,28 +992,77 @@ async def action_fetch_metadata(
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to fetch metadata for item {item_id}")
         raise HTTPException(status_code=500, detail=f"Metadata fetch failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
-@app.post("/api/queue/{item_id}/actions/rename-file")
-async def action_rename_file(item_id: int):
-    """Re-rename and move file using current metadata."""
+def _locate_source_file(file_path: str) -> str:
+    """Return the item's current file path, falling back to ``WATCH_DIR/unprocessed``.
+
+    Raises:
+        HTTPException: 400 if the file exists in neither location.
+    """
+    if Path(file_path).exists():
+        return file_path
+
+    # Try unprocessed directory as fallback
+    watch_dir = os.getenv('WATCH_DIR', '/watch')
+    unprocessed_path = Path(watch_dir) / 'unprocessed' / Path(file_path).name
+    if unprocessed_path.exists():
+        logger.info(f"[API Action] File found in unprocessed dir: {unprocessed_path}")
+        return str(unprocessed_path)
+
+    logger.warning(f"[API Action] File not found: {file_path}")
+    raise HTTPException(
+        status_code=400,
+        detail=f"File not found: {file_path}"
+    )
+
+
+def _rename_and_move(file_path: str, movie_code: str, subtitle: Optional[str],
+                     metadata: dict) -> tuple[str, str, str]:
+    """Build the destination filename from metadata and move the file there.
+
+    Returns:
+        Tuple of (actress, new_filename, new_path).
+    """
     from .renamer import build_filename, move_file
 
-    logger.info(f"[API Action] Rename/move file requested for item {item_id}")
-    db = get_queue_db()
-    conn = db._get_conn()
+    # Extract fields
+    actress_list = metadata.get('actress', [])
+    actress = actress_list[0] if actress_list else 'Unknown'
+    title = metadata.get('title', '')
+    api_code = metadata.get('movie_code', movie_code)
+
+    actress = actress.title()
+
+    # Remove code from title if present
+    if title.upper().startswith(api_code.upper()):
+        title = title[len(api_code):].strip()
+        if title and title[0] in ['-', ' ']:
+            title = title[1:].strip()
+    title = title.title()
+
+    logger.info(f"[API Action] Building filename for: {actress} - {api_code}")
+
+    # Build filename and move
+    destination_dir = os.getenv('DESTINATION_DIR', '/destination')
+    extension = Path(file_path).suffix
+    new_filename = build_filename(actress, subtitle, api_code, title, extension)
+
+    logger.info(f"[API Action] Moving file: {Path(file_path).name} -> {actress}/{new_filename}")
+    new_path = move_file(file_path, destination_dir, actress, new_filename)
+    return actress, new_filename, new_path
+
 
+@app.post("/api/queue/{item_id}/actions/rename-file")
+@_offload
+def action_rename_file(item_id: int, db: QueueDB = Depends(get_queue_db)):
+    """Re-rename and move file using current metadata."""
+    logger.info(f"[API Action] Rename/move file requested for item {item_id}")
     try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT file_path, movie_code, subtitle, metadata_json
-                FROM processing_queue WHERE id = %s
-            """, (item_id,))
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_for_rename', item_id)
             row = cur.fetchone()
             if not row:
                 logger.warning(f"[API Action] Item {item_id} not found")
@@ -709,49 +1079,12 @@ async def action_rename_file(item_id: int):
 
             # Parse metadata
             if isinstance(metadata_json, str):
-                metadata = json.loads(metadata_json)
+                metadata = orjson.loads(metadata_json)
             else:
                 metadata = metadata_json
 
-            # Check if file exists; if not, check unprocessed directory
-            if not Path(file_path).exists():
-                # Try unprocessed directory as fallback
-                watch_dir = os.getenv('WATCH_DIR', '/watch')
-                unprocessed_path = Path(watch_dir) / 'unprocessed' / Path(file_path).name
-                if unprocessed_path.exists():
-                    logger.info(f"[API Action] File found in unprocessed dir: {unprocessed_path}")
-                    file_path = str(unprocessed_path)
-                else:
-                    logger.warning(f"[API Action] File not found: {file_path}")
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"File not found: {file_path}"
-                    )
-
-            # Extract fields
-            actress_list = metadata.get('actress', [])
-            actress = actress_list[0] if actress_list else 'Unknown'
-            title = metadata.get('title', '')
-            api_code = metadata.get('movie_code', movie_code)
-
-            actress = actress.title()
-
-            # Remove code from title if present
-            if title.upper().startswith(api_code.upper()):
-                title = title[len(api_code):].strip()
-                if title and title[0] in ['-', ' ']:
-                    title = title[1:].strip()
-            title = title.title()
-
-            logger.info(f"[API Action] Building filename for: {actress} - {api_code}")
-
-            # Build filename and move
-            destination_dir = os.getenv('DESTINATION_DIR', '/destination')
-            extension = Path(file_path).suffix
-            new_filename = build_filename(actress, subtitle, api_code, title, extension)
-
-            logger.info(f"[API Action] Moving file: {Path(file_path).name} -> {actress}/{new_filename}")
-            new_path = move_file(file_path, destination_dir, actress, new_filename)
+            file_path = _locate_source_file(file_path)
+            actress, new_filename, new_path = _rename_and_move(file_path, movie_code, subtitle, metadata)
 
             # Update database
             cur.execute("""
@@ -771,33 +1104,25 @@ async def action_rename_file(item_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to rename/move file for item {item_id}")
         raise HTTPException(status_code=500, detail=f"File move failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
 @app.post("/api/queue/{item_id}/actions/update-emby")
-async def action_update_emby(
+@_offload
+def action_update_emby(
     item_id: int,
-    fresh: bool = Query(False, description="Force fresh metadata (bypass cache)")
+    fresh: bool = Query(False, description="Force fresh metadata (bypass cache)"),
+    db: QueueDB = Depends(get_queue_db),
+    metadata_client: MetadataClient = Depends(get_metadata_client),
+    emby_client: Optional[EmbyClient] = Depends(get_emby_client),
 ):
     """Re-fetch metadata (optionally fresh) and update Emby."""
-    from .metadata import MetadataClient
-    from .emby_client import EmbyClient
-
     fresh_text = " (FORCE FRESH)" if fresh else ""
     logger.info(f"[API Action] Update Emby requested for item {item_id}{fresh_text}")
-    db = get_queue_db()
-    conn = db._get_conn()
-
     try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT movie_code, emby_item_id, status, new_path
-                FROM processing_queue WHERE id = %s
-            """, (item_id,))
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_for_emby', item_id)
             row = cur.fetchone()
             if not row:
                 logger.warning(f"[API Action] Item {item_id} not found")
@@ -835,12 +1160,6 @@ async def action_update_emby(
             logger.info(f"[API Action] Fetching metadata for: {movie_code}{fresh_text}")
 
             # Fetch metadata (fresh or cached)
-            metadata_client = MetadataClient(
-                base_url=os.getenv('API_BASE_URL', ''),
-                token=os.getenv('API_TOKEN', ''),
-                token_manager=_token_manager,
-            )
-
             metadata = metadata_client.search(movie_code, fresh=fresh)
             if not metadata:
                 logger.warning(f"[API Action] No metadata found for {movie_code}")
@@ -859,27 +1178,11 @@ async def action_update_emby(
                 UPDATE processing_queue
                 SET metadata_json = %s, updated_at = NOW()
                 WHERE id = %s
-            """, (json.dumps(metadata), item_id))
+            """, (to_jsonb(metadata), item_id))
             conn.commit()
 
             # Update Emby directly using stored emby_item_id
-            emby_config = {
-                'base_url': os.getenv('EMBY_BASE_URL', ''),
-                'api_key': os.getenv('EMBY_API_KEY', ''),
-                'parent_folder_id': os.getenv('EMBY_PARENT_FOLDER_ID', '4'),
-                'user_id': os.getenv('EMBY_USER_ID', ''),
-            }
-
-            if emby_config['base_url'] and emby_config['api_key']:
-                emby_client = EmbyClient(
-                    base_url=emby_config['base_url'],
-                    api_key=emby_config['api_key'],
-                    parent_folder_id=emby_config['parent_folder_id'],
-                    user_id=emby_config['user_id'],
-                    wordpress_token=os.getenv('API_TOKEN', ''),
-                    token_manager=_token_manager,
-                )
-
+            if emby_client:
                 logger.info(f"[API Action] Updating Emby metadata for item {item_id} (Emby ID: {emby_item_id})")
 
                 # Update Emby metadata
@@ -921,35 +1224,143 @@ async def action_update_emby(
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to update Emby for item {item_id}")
         raise HTTPException(status_code=500, detail=f"Emby update failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
+
+
+@app.post("/api/queue/{item_id}/actions/run-all")
+@_offload
+def action_run_all(
+    item_id: int,
+    fresh: bool = Query(False, description="Force fresh metadata (bypass cache)"),
+    db: QueueDB = Depends(get_queue_db),
+    metadata_client: MetadataClient = Depends(get_metadata_client),
+    emby_client: Optional[EmbyClient] = Depends(get_emby_client),
+):
+    """Run extract-code, fetch-metadata, rename-file and update-emby in one request.
+
+    The item is read once and the network and filesystem steps run back to
+    back. As in rename-file, the move is committed (with the code, metadata
+    and ``moved`` status) as soon as the file is at its new path, so a later
+    failure cannot leave the row pointing at the old one; a successful Emby
+    update then marks it ``completed``. Without a stored ``emby_item_id`` the
+    item is left in ``moved`` for the EmbyUpdater to pick up, as update-emby
+    does.
+    """
+    from .extractor import extract_movie_code, detect_subtitle
+
+    fresh_text = " (FORCE FRESH)" if fresh else ""
+    logger.info(f"[API Action] Run-all requested for item {item_id}{fresh_text}")
+    try:
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_for_run_all', item_id)
+            row = cur.fetchone()
+            if not row:
+                logger.warning(f"[API Action] Item {item_id} not found")
+                raise HTTPException(status_code=404, detail="Item not found")
+
+            file_path, emby_item_id = row
+
+            # 1. Extract code and subtitle
+            filename = Path(file_path).name
+            movie_code = extract_movie_code(filename)
+            subtitle = detect_subtitle(filename)
+            if not movie_code:
+                logger.warning(f"[API Action] No movie code found in: {filename}")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"No movie code found in filename: {filename}"
+                )
+            logger.info(f"[API Action] Extracted: {movie_code}, subtitle: {subtitle}")
+
+            # 2. Fetch metadata
+            metadata = metadata_client.search(movie_code, fresh=fresh)
+            if not metadata:
+                logger.warning(f"[API Action] No metadata found for {movie_code}")
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"No metadata found for {movie_code}"
+                )
+
+            # 3. Rename and move
+            file_path = _locate_source_file(file_path)
+            actress, new_filename, new_path = _rename_and_move(file_path, movie_code, subtitle, metadata)
+
+            # The file has moved: record that before anything else can fail
+            cur.execute("""
+                UPDATE processing_queue
+                SET movie_code = %s, subtitle = %s, metadata_json = %s,
+                    new_path = %s, actress = %s, status = 'moved',
+                    error_message = NULL, updated_at = NOW()
+                WHERE id = %s
+            """, (movie_code, subtitle, to_jsonb(metadata), new_path, actress, item_id))
+            conn.commit()
+
+            # 4. Update Emby when the item is already known to it
+            status = 'moved'
+            if emby_item_id and emby_client:
+                logger.info(f"[API Action] Updating Emby metadata for item {item_id} (Emby ID: {emby_item_id})")
+                try:
+                    updated = emby_client.update_item_metadata(emby_item_id, metadata)
+                except Exception as e:
+                    logger.warning(f"[API Action] Emby update error for item {item_id}: {e}")
+                    updated = False
+                if updated:
+                    image_url = metadata.get('image_cropped') or metadata.get('raw_image_url', '')
+                    if image_url:
+                        try:
+                            emby_client.upload_item_images(emby_item_id, image_url)
+                        except Exception as e:
+                            logger.warning(f"[API Action] Image upload failed for item {emby_item_id}: {e}")
+                    cur.execute("""
+                        UPDATE processing_queue
+                        SET status = 'completed', updated_at = NOW()
+                        WHERE id = %s
+                    """, (item_id,))
+                    conn.commit()
+                    status = 'completed'
+                else:
+                    logger.warning(f"[API Action] Emby update failed for item {item_id}; leaving it moved")
+
+            logger.info(f"[API Action] Item {item_id} run-all finished with status: {status}")
+
+            return {
+                "success": True,
+                "message": f"Moved to: {actress}/{new_filename[:40]}... ({status})",
+                "movie_code": movie_code,
+                "subtitle": subtitle,
+                "actress": actress,
+                "title": metadata.get('title', ''),
+                "new_path": new_path,
+                "status": status,
+            }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"[API Action] Run-all failed for item {item_id}")
+        raise HTTPException(status_code=500, detail=f"Run-all failed: {str(e)}")
 
 
 @app.post("/api/queue/{item_id}/actions/full-retry")
-async def action_full_retry(item_id: int):
+async def action_full_retry(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Reset to pending for full pipeline retry (alias for retry)."""
     # Just call the existing endpoint
-    return await retry_item(item_id)
+    return await retry_item(item_id, db)
 
 
 @app.delete("/api/queue/{item_id}")
-async def delete_queue_item(item_id: int):
+@_offload
+def delete_queue_item(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Delete a queue item from the database.
 
     Useful for removing error items or cleaning up the queue.
     Does NOT delete the actual file - only removes from processing queue.
     """
     logger.info(f"[API Action] Delete requested for item {item_id}")
-    db = get_queue_db()
-    conn = db._get_conn()
-
     try:
-        with conn.cursor() as cur:
+        with db.connection() as conn, conn.cursor() as cur:
             # Check if item exists
-            cur.execute("SELECT file_path, status FROM processing_queue WHERE id = %s", (item_id,))
+            _execute(cur, 'api_item_file_status', item_id)
             row = cur.fetchone()
             if not row:
                 logger.warning(f"[API Action] Item {item_id} not found")
@@ -972,15 +1383,13 @@ async def delete_queue_item(item_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to delete item {item_id}")
         raise HTTPException(status_code=500, detail=f"Delete failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
 @app.delete("/api/queue/{item_id}/file")
-async def delete_queue_item_and_file(item_id: int):
+@_offload
+def delete_queue_item_and_file(item_id: int, db: QueueDB = Depends(get_queue_db)):
     """Delete a queue item AND its associated file from disk.
 
     Deletes new_path (destination) if set, otherwise file_path (source).
@@ -988,15 +1397,9 @@ async def delete_queue_item_and_file(item_id: int):
     """
     import os
     logger.info(f"[API Action] Delete file+queue requested for item {item_id}")
-    db = get_queue_db()
-    conn = db._get_conn()
-
     try:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT file_path, new_path, status FROM processing_queue WHERE id = %s",
-                (item_id,)
-            )
+        with db.connection() as conn, conn.cursor() as cur:
+            _execute(cur, 'api_item_paths_status', item_id)
             row = cur.fetchone()
             if not row:
                 raise HTTPException(status_code=404, detail="Item not found")
@@ -1032,64 +1435,54 @@ async def delete_queue_item_and_file(item_id: int):
     except HTTPException:
         raise
     except Exception as e:
-        conn.rollback()
         logger.exception(f"[API Action] Failed to delete file for item {item_id}")
         raise HTTPException(status_code=500, detail=f"Delete failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
 @app.post("/api/cleanup")
-async def cleanup(older_than_days: int = Query(30, ge=1, le=365)):
+@_offload
+def cleanup(
+    older_than_days: int = Query(30, ge=1, le=365),
+    db: QueueDB = Depends(get_queue_db),
+):
     """Delete completed items older than specified days (queue + downloads)."""
-    db = get_queue_db()
-    conn = db._get_conn()
-
-    try:
-        with conn.cursor() as cur:
-            cur.execute("""
+    # Both deletes in one statement: one round-trip, and atomic
+    with db.connection() as conn, conn.cursor() as cur:
+        cur.execute("""
+            WITH q AS (
                 DELETE FROM processing_queue
                 WHERE status = 'completed'
-                  AND updated_at < NOW() - INTERVAL '%s days'
+                  AND updated_at < NOW() - INTERVAL '1 day' * %(days)s
                 RETURNING id
-            """, (older_than_days,))
-            deleted_ids = [row[0] for row in cur.fetchall()]
-            conn.commit()
+            ), d AS (
+                DELETE FROM download_jobs
+                WHERE status IN ('completed', 'failed')
+                  AND created_at < NOW() - INTERVAL '1 day' * %(days)s
+                RETURNING id
+            )
+            SELECT (SELECT COUNT(*) FROM q), (SELECT COUNT(*) FROM d)
+        """, {'days': older_than_days})
+        deleted_count, dl_deleted = cur.fetchone()
+        conn.commit()
 
-        # Also clean up old download jobs
-        dl_deleted = db.cleanup_old_downloads(older_than_days)
+    if dl_deleted:
+        logger.info(f"[API] Cleaned up {dl_deleted} old download jobs")
 
-        return {
-            "success": True,
-            "message": f"Deleted {len(deleted_ids)} queue items and {dl_deleted} download jobs older than {older_than_days} days",
-            "deleted_count": len(deleted_ids),
-            "downloads_deleted": dl_deleted,
-        }
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        db._put_conn(conn)
+    return {
+        "success": True,
+        "message": f"Deleted {deleted_count} queue items and {dl_deleted} download jobs older than {older_than_days} days",
+        "deleted_count": deleted_count,
+        "downloads_deleted": dl_deleted,
+    }
 
 
 @app.post("/api/generate-preview")
-async def generate_preview():
+@_offload
+def generate_preview(emby_client: Optional[EmbyClient] = Depends(get_emby_client)):
     """Trigger Emby video preview/trickplay generation scheduled task."""
-    from .emby_client import EmbyClient
-
-    emby_config = {
-        'base_url': os.getenv('EMBY_BASE_URL', ''),
-        'api_key': os.getenv('EMBY_API_KEY', ''),
-    }
-
-    if not emby_config['base_url'] or not emby_config['api_key']:
+    if not emby_client:
         raise HTTPException(status_code=500, detail="Emby not configured")
 
-    emby_client = EmbyClient(
-        base_url=emby_config['base_url'],
-        api_key=emby_config['api_key'],
-    )
-
     success = emby_client.generate_video_preview()
     if success:
         return {"success": True, "message": "Video preview generation task triggered"}
@@ -1097,10 +1490,14 @@ async def generate_preview():
 
 
 @app.post("/api/bulk/refresh-metadata")
-async def bulk_refresh_metadata(
+@_offload
+def bulk_refresh_metadata(
     status: Optional[str] = Query(None, description="Filter by status (default: completed)"),
     update_emby: bool = Query(True, description="Also update Emby metadata"),
     fresh: bool = Query(False, description="Force fresh metadata (bypass cache)"),
+    db: QueueDB = Depends(get_queue_db),
+    metadata_client: MetadataClient = Depends(get_metadata_client),
+    emby_client: Optional[EmbyClient] = Depends(get_emby_client),
 ):
     """Bulk re-fetch metadata for items using unified search endpoint.
 
@@ -1109,19 +1506,15 @@ async def bulk_refresh_metadata(
 
     Does NOT move files - only updates metadata_json and optionally Emby.
     """
-    from .metadata import MetadataClient
-
     fresh_text = " (FORCE FRESH)" if fresh else ""
     logger.info(f"[API Bulk] Bulk metadata refresh started{fresh_text}")
-    db = get_queue_db()
-    conn = db._get_conn()
 
     # Default to completed items if no status specified
     filter_status = status or 'completed'
 
     try:
         # Get items to refresh
-        with conn.cursor() as cur:
+        with db.connection() as conn, conn.cursor() as cur:
             cur.execute("""
                 SELECT id, movie_code, new_path, emby_item_id
                 FROM processing_queue
@@ -1142,90 +1535,72 @@ async def bulk_refresh_metadata(
 
         logger.info(f"[API Bulk] Found {len(items)} items to refresh")
 
-        # Initialize metadata client with unified search
-        metadata_client = MetadataClient(
-            base_url=os.getenv('API_BASE_URL', ''),
-            token=os.getenv('API_TOKEN', ''),
-            token_manager=_token_manager,
-        )
-
-        updated_count = 0
-        failed_count = 0
         failed_items = []
+        failed_count = 0
 
-        for item_id, movie_code, new_path, emby_item_id in items:
-            try:
-                fresh_item_text = " (FORCE FRESH)" if fresh else ""
-                logger.info(f"[API Bulk] Refreshing metadata for item {item_id}: {movie_code}{fresh_item_text}")
+        def record_failure(item_id, movie_code, reason):
+            nonlocal failed_count
+            failed_count += 1
+            if len(failed_items) < BULK_FAILED_ITEMS_LIMIT:
+                failed_items.append({"id": item_id, "code": movie_code, "reason": reason})
+
+        def queue_images(emby_item_id, metadata):
+            # Upload images (best-effort) on their own workers so slow
+            # uploads don't hold up the remaining metadata updates
+            image_url = metadata.get('image_cropped') or metadata.get('raw_image_url', '')
+            if image_url:
+                image_pool.submit(upload_images, emby_item_id, image_url)
 
-                # Fetch metadata using unified search
-                metadata = metadata_client.search(movie_code, fresh=fresh)
+        def upload_images(emby_item_id, image_url):
+            try:
+                emby_client.upload_item_images(emby_item_id, image_url)
+                logger.info(f"[API Bulk] Uploaded images for Emby item {emby_item_id}")
+            except Exception as e:
+                logger.warning(f"[API Bulk] Image upload failed for item {emby_item_id}: {e}")
+
+        # Leaving the with-block waits for queued image uploads to finish
+        with ThreadPoolExecutor(max_workers=BULK_IMAGE_UPLOAD_WORKERS,
+                                thread_name_prefix='api-bulk-img') as image_pool:
+            # 1. Search metadata for every distinct code concurrently
+            logger.info(f"[API Bulk] Searching metadata for {len(items)} items{fresh_text}")
+            found = metadata_client.search_many(
+                [movie_code for _, movie_code, _, _ in items],
+                fresh=fresh,
+                concurrency=BULK_REFRESH_CONCURRENCY,
+            )
+            refreshed = []
+            for item_id, movie_code, _, emby_item_id in items:
+                metadata = found.get(movie_code)
                 if not metadata:
                     logger.warning(f"[API Bulk] No metadata found for {movie_code} (item {item_id})")
-                    failed_count += 1
-                    failed_items.append({"id": item_id, "code": movie_code, "reason": "No metadata found"})
-                    continue
-
-                # Update metadata_json in database
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        UPDATE processing_queue
-                        SET metadata_json = %s, updated_at = NOW()
-                        WHERE id = %s
-                    """, (json.dumps(metadata), item_id))
-                    conn.commit()
-
-                # Update Emby directly if requested and item has emby_item_id
-                if update_emby and emby_item_id:
-                    from .emby_client import EmbyClient
-
-                    # Initialize Emby client
-                    emby_config = {
-                        'base_url': os.getenv('EMBY_BASE_URL', ''),
-                        'api_key': os.getenv('EMBY_API_KEY', ''),
-                        'parent_folder_id': os.getenv('EMBY_PARENT_FOLDER_ID', '4'),
-                        'user_id': os.getenv('EMBY_USER_ID', ''),
-                    }
-
-                    if emby_config['base_url'] and emby_config['api_key']:
-                        emby_client = EmbyClient(
-                            base_url=emby_config['base_url'],
-                            api_key=emby_config['api_key'],
-                            parent_folder_id=emby_config['parent_folder_id'],
-                            user_id=emby_config['user_id'],
-                            wordpress_token=os.getenv('API_TOKEN', ''),
-                            token_manager=_token_manager,
-                        )
-
-                        logger.info(f"[API Bulk] Updating Emby metadata for item {item_id} (Emby ID: {emby_item_id})")
-
-                        # Update Emby metadata directly using stored emby_item_id
-                        update_success = emby_client.update_item_metadata(emby_item_id, metadata)
-
-                        if update_success:
-                            logger.info(f"[API Bulk] Successfully updated Emby for item {item_id}")
-
-                            # Upload images (best-effort)
-                            image_url = metadata.get('image_cropped') or metadata.get('raw_image_url', '')
-                            if image_url:
-                                try:
-                                    emby_client.upload_item_images(emby_item_id, image_url)
-                                    logger.info(f"[API Bulk] Uploaded images for Emby item {emby_item_id}")
-                                except Exception as e:
-                                    logger.warning(f"[API Bulk] Image upload failed for item {emby_item_id}: {e}")
-                        else:
-                            logger.warning(f"[API Bulk] Failed to update Emby for item {item_id}")
-                    else:
-                        logger.warning("[API Bulk] Emby not configured, skipping Emby update")
-
-                updated_count += 1
-                logger.info(f"[API Bulk] Successfully updated item {item_id}")
+                    record_failure(item_id, movie_code, "No metadata found")
+                else:
+                    refreshed.append((item_id, movie_code, emby_item_id, metadata))
+
+            # 2. Store all fetched metadata in one UPDATE, committed before
+            # the Emby phase so Emby failures can't undo it
+            db.update_metadata_batch([(item_id, metadata) for item_id, _, _, metadata in refreshed])
+
+            # 3. Push the new metadata to Emby concurrently
+            emby_failed = 0
+            if update_emby:
+                to_update = [r for r in refreshed if r[2]]
+                if to_update and not emby_client:
+                    logger.warning("[API Bulk] Emby not configured, skipping Emby update")
+                elif to_update:
+                    logger.info(f"[API Bulk] Updating Emby metadata for {len(to_update)} items")
+                    results = emby_client.update_many(
+                        [(emby_item_id, metadata) for _, _, emby_item_id, metadata in to_update],
+                        max_workers=BULK_REFRESH_CONCURRENCY,
+                        on_updated=queue_images,
+                    )
+                    for (item_id, movie_code, emby_item_id, _), ok in zip(to_update, results):
+                        if not ok:
+                            logger.warning(f"[API Bulk] Failed to update Emby for item {item_id} (Emby ID: {emby_item_id})")
+                            record_failure(item_id, movie_code, "Emby update failed")
+                            emby_failed += 1
 
-            except Exception as e:
-                logger.exception(f"[API Bulk] Failed to refresh item {item_id}")
-                failed_count += 1
-                failed_items.append({"id": item_id, "code": movie_code, "reason": str(e)})
-                conn.rollback()
+        updated_count = len(refreshed) - emby_failed
 
         logger.info(f"[API Bulk] Completed: {updated_count} updated, {failed_count} failed")
 
@@ -1235,30 +1610,28 @@ async def bulk_refresh_metadata(
             "total": len(items),
             "updated": updated_count,
             "failed": failed_count,
-            "failed_items": failed_items[:10],  # Return first 10 failures
+            "failed_items": failed_items,  # First BULK_FAILED_ITEMS_LIMIT failures
         }
 
     except Exception as e:
         logger.exception("[API Bulk] Bulk refresh failed")
         raise HTTPException(status_code=500, detail=f"Bulk refresh failed: {str(e)}")
-    finally:
-        db._put_conn(conn)
 
 
 @app.post("/api/download")
-async def submit_download(
+@_offload
+def submit_download(
     url: str = Query(..., description="URL to download"),
     filename: str = Query("", description="Optional output filename"),
+    manager: DownloadManager = Depends(get_downloader),
 ):
-    """Submit a yt-dlp download job via docker exec."""
-    from .downloader import get_download_manager
-
+    """Submit a yt-dlp download job via Docker exec."""
     if not url.strip():
         raise HTTPException(status_code=400, detail="URL is required")
 
-    manager = get_download_manager()
     job = manager.submit(url.strip(), filename.strip() or None)
 
+    _poll_cache_invalidate('downloads')
     logger.info(f"[API] Download submitted: job={job['id']} url={url}")
 
     return {
@@ -1269,70 +1642,67 @@ async def submit_download(
 
 
 @app.get("/api/downloads")
-async def list_downloads(
+@_offload
+def list_downloads(
     limit: int = Query(10, ge=1, le=100),
     offset: int = Query(0, ge=0),
     status: Optional[str] = Query(None, description="Filter by status"),
+    manager: DownloadManager = Depends(get_downloader),
 ):
     """List recent download jobs with pagination and optional status filter."""
-    from .downloader import get_download_manager
+    def build():
+        jobs, total = manager.list_jobs(limit=limit, offset=offset, status=status)
+        return {
+            "jobs": jobs,
+            "total": total,
+            "count": len(jobs),
+        }
 
-    manager = get_download_manager()
-    jobs, total = manager.list_jobs(limit=limit, offset=offset, status=status)
-    return {
-        "jobs": jobs,
-        "total": total,
-        "count": len(jobs),
-    }
+    return _poll_cached(('downloads', limit, offset, status), build)
 
 
 @app.get("/api/downloads/{job_id}")
-async def get_download(job_id: int):
+@_offload
+def get_download(job_id: int, manager: DownloadManager = Depends(get_downloader)):
     """Get details for a specific download job."""
-    from .downloader import get_download_manager
-
-    manager = get_download_manager()
     job = manager.get_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Download job not found")
-    return {"job": job}
+    return ORJSONResponse({"job": job})
 
 
 @app.post("/api/downloads/{job_id}/retry")
-async def retry_download(job_id: int):
+@_offload
+def retry_download(job_id: int, manager: DownloadManager = Depends(get_downloader)):
     """Retry a failed download job by resubmitting with the same URL/filename."""
-    from .downloader import get_download_manager
-
-    manager = get_download_manager()
     job = manager.retry(job_id)
     if not job:
         raise HTTPException(status_code=400, detail="Download not found or not in failed state")
+    _poll_cache_invalidate('downloads')
     logger.info(f"[API] Download retried: job={job_id}")
     return {"success": True, "message": f"Download retrying (job {job_id})", "job": job}
 
 
 @app.delete("/api/downloads/{job_id}")
-async def delete_download(job_id: int):
+@_offload
+def delete_download(job_id: int, manager: DownloadManager = Depends(get_downloader)):
     """Delete a download job."""
-    from .downloader import get_download_manager
-
-    manager = get_download_manager()
     deleted = manager.delete(job_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Download job not found")
+    _poll_cache_invalidate('downloads')
     logger.info(f"[API] Download deleted: job={job_id}")
     return {"success": True, "message": f"Download job {job_id} deleted"}
 
 
 @app.post("/api/downloads/{job_id}/cancel")
-async def cancel_download(job_id: int):
+@_offload
+def cancel_download(job_id: int, manager: DownloadManager = Depends(get_downloader)):
     """Cancel an active or queued download job."""
-    from .downloader import get_download_manager
-
-    manager = get_download_manager()
     cancelled = manager.cancel(job_id)
     if not cancelled:
         raise HTTPException(status_code=404, detail="Download not found or not cancellable")
+    _poll_cache_invalidate('downloads')
     logger.info(f"[API] Download cancelled: job={job_id}")
     return {"success": True, "message": f"Download job {job_id} cancelled"}
 
@@ -1341,14 +1711,15 @@ async def cancel_download(job_id: int):
 async def get_logs(lines: int = Query(100, ge=1, le=1000)):
     """Get recent log lines from in-memory buffer."""
     try:
-        log_buffer = get_log_buffer()
-        log_lines = log_buffer.get_recent_logs(lines=lines)
+        def build():
+            log_lines = get_log_buffer().get_recent_logs(lines=lines)
+            return {
+                "lines": log_lines,
+                "count": len(log_lines),
+                "timestamp": _NOW_STR,
+            }
 
-        return {
-            "lines": log_lines,
-            "count": len(log_lines),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        }
+        return _poll_cached(('logs', lines), build)
     except Exception as e:
         logger.error(f"Failed to fetch logs: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch logs: {str(e)}")
@@ -1356,4 +1727,4 @@ async def get_logs(lines: int = Query(100, ge=1, le=1000)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
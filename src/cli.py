@@ -5,30 +5,117 @@ Provides commands to inspect, retry, and clean up the processing queue.
 Usage:
     python -m src status
     python -m src list --status pending
-    python -m src retry 42
+    python -m src retry 42 43
     python -m src retry-all
     python -m src cleanup --days 30
-    python -m src reset 42
+    python -m src reset 42 43
 """
 
 import argparse
+import atexit
 import os
 import sys
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 import psycopg2
+import psycopg2.pool
 from dotenv import load_dotenv
 
+from .queue import execute_prepared
+
+# Connection pool shared by every command run in this process; created on
+# first use so building the parser or printing help never touches the DB
+_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+
+
+# Fixed statements, run as server-side prepared statements so repeated
+# commands on a pooled connection skip parse/plan (see execute_prepared)
+_STATEMENTS = {
+    # Counts by status, with the oldest pending created_at and the number
+    # of retryable errors repeated on every row (window over the groups)
+    'cli_status': """
+        SELECT status, COUNT(*),
+               MIN(MIN(created_at) FILTER (WHERE status = 'pending')) OVER (),
+               SUM(COUNT(*) FILTER (
+                   WHERE status = 'error'
+                   AND (next_retry_at IS NULL OR next_retry_at <= NOW())
+               )) OVER ()
+        FROM processing_queue
+        GROUP BY status
+        ORDER BY status
+    """,
+    'cli_items_status': """
+        SELECT id, file_path, status FROM processing_queue
+        WHERE id = ANY($1::int[])
+        ORDER BY id
+    """,
+    'cli_retry_items': """
+        UPDATE processing_queue
+        SET status = 'pending', error_message = NULL, next_retry_at = NULL
+        WHERE id = ANY($1::int[])
+    """,
+    'cli_retry_all': """
+        UPDATE processing_queue
+        SET status = 'pending', error_message = NULL, next_retry_at = NULL
+        WHERE status = 'error'
+    """,
+    'cli_cleanup_count': """
+        SELECT COUNT(*) FROM processing_queue
+        WHERE status = 'completed' AND updated_at < $1
+    """,
+    'cli_cleanup_delete': """
+        DELETE FROM processing_queue
+        WHERE status = 'completed' AND updated_at < $1
+    """,
+    'cli_reset_items': """
+        UPDATE processing_queue
+        SET status = 'pending', error_message = NULL,
+            retry_count = 0, next_retry_at = NULL
+        WHERE id = ANY($1::int[])
+    """,
+}
+
+
+def _execute(cur, name: str, *params):
+    """Run one of the prepared ``_STATEMENTS`` on ``cur``."""
+    execute_prepared(cur, name, _STATEMENTS[name], params)
+
+
+def _relax_commit(cur):
+    """Let the current transaction commit without waiting for the WAL flush.
+
+    Only used for retry/reset: they just requeue work, so if a crash loses
+    the commit the command can simply be run again.
+    """
+    cur.execute("SET LOCAL synchronous_commit = OFF")
+
+
+def _fetch_items(cur, ids: list[int]) -> list[tuple]:
+    """Fetch (id, file_path, status) for ``ids``; report and exit if any is missing."""
+    _execute(cur, 'cli_items_status', ids)
+    rows = cur.fetchall()
+
+    found = {row[0] for row in rows}
+    missing = [item_id for item_id in ids if item_id not in found]
+    for item_id in missing:
+        print(f"Error: Item {item_id} not found.")
+    if missing:
+        sys.exit(1)
 
-def get_db_connection():
-    """Create a database connection from environment variables."""
+    return rows
+
+
+def _create_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Create the connection pool from environment variables."""
     load_dotenv()
 
     database_url = os.getenv('DATABASE_URL')
     if database_url:
-        return psycopg2.connect(database_url)
+        return psycopg2.pool.ThreadedConnectionPool(1, 4, database_url)
 
-    return psycopg2.connect(
+    return psycopg2.pool.ThreadedConnectionPool(
+        1, 4,
         host=os.getenv('DB_HOST', 'localhost'),
         port=int(os.getenv('DB_PORT', '5432')),
         dbname=os.getenv('DB_NAME', 'emby_processor'),
@@ -37,22 +124,37 @@ def get_db_connection():
     )
 
 
+def get_db_connection():
+    """Borrow a database connection from the CLI pool.
+
+    Return it with release_db_connection() when done.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = _create_pool()
+        atexit.register(_POOL.closeall)
+    return _POOL.getconn()
+
+
+def release_db_connection(conn):
+    """Return a connection obtained from get_db_connection()."""
+    if _POOL is None:
+        conn.close()
+    else:
+        _POOL.putconn(conn)
+
+
 def cmd_status(args):
     """Show queue statistics."""
     conn = get_db_connection()
     try:
         cur = conn.cursor()
 
-        # Count by status
-        cur.execute("""
-            SELECT status, COUNT(*)
-            FROM processing_queue
-            GROUP BY status
-            ORDER BY status
-        """)
+        # Counts by status, oldest pending and retryable errors in one query
+        _execute(cur, 'cli_status')
         rows = cur.fetchall()
 
-        total = sum(count for _, count in rows)
+        total = sum(row[1] for row in rows)
         print(f"Queue Status ({total} total)")
         print("=" * 40)
 
@@ -60,43 +162,31 @@ def cmd_status(args):
             print("  (empty queue)")
             return
 
-        for status, count in rows:
+        for status, count, _, _ in rows:
             print(f"  {status:<20} {count:>5}")
 
         print("-" * 40)
         print(f"  {'total':<20} {total:>5}")
 
+        _, _, oldest_pending, retryable = rows[0]
+
         # Show oldest pending
-        cur.execute("""
-            SELECT created_at FROM processing_queue
-            WHERE status = 'pending'
-            ORDER BY created_at ASC LIMIT 1
-        """)
-        row = cur.fetchone()
-        if row:
-            age = datetime.now(timezone.utc) - row[0]
+        if oldest_pending:
+            age = datetime.now(timezone.utc) - oldest_pending
             print(f"\n  Oldest pending: {_format_age(age)} ago")
 
         # Show items ready for retry
-        cur.execute("""
-            SELECT COUNT(*) FROM processing_queue
-            WHERE status = 'error'
-            AND (next_retry_at IS NULL OR next_retry_at <= NOW())
-        """)
-        retryable = cur.fetchone()[0]
         if retryable > 0:
             print(f"  Retryable errors: {retryable}")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def cmd_list(args):
     """List queue items filtered by status."""
     conn = get_db_connection()
     try:
-        cur = conn.cursor()
-
         query = """
             SELECT id, file_path, movie_code, actress, status,
                    error_message, retry_count, created_at
@@ -114,18 +204,18 @@ def cmd_list(args):
             query += " LIMIT %s"
             params.append(args.limit)
 
+        # Server-side cursor: rows stream in pages instead of being buffered
+        cur = conn.cursor(name='cli_list')
+        cur.itersize = 1000
         cur.execute(query, params)
-        rows = cur.fetchall()
-
-        if not rows:
-            status_filter = f" with status '{args.status}'" if args.status else ""
-            print(f"No items found{status_filter}.")
-            return
 
-        print(f"{'ID':<6} {'Status':<14} {'Code':<12} {'Actress':<20} {'Retries':<8} {'File'}")
-        print("-" * 90)
+        count = 0
+        for row in cur:
+            if count == 0:
+                print(f"{'ID':<6} {'Status':<14} {'Code':<12} {'Actress':<20} {'Retries':<8} {'File'}")
+                print("-" * 90)
+            count += 1
 
-        for row in rows:
             item_id, file_path, movie_code, actress, status, error_msg, retry_count, created_at = row
             filename = os.path.basename(file_path) if file_path else ""
             # Truncate filename if too long
@@ -143,47 +233,45 @@ def cmd_list(args):
             if args.verbose and error_msg:
                 print(f"       Error: {error_msg}")
 
-        print(f"\n{len(rows)} item(s) shown.")
+        if count == 0:
+            status_filter = f" with status '{args.status}'" if args.status else ""
+            print(f"No items found{status_filter}.")
+            return
+
+        print(f"\n{count} item(s) shown.")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def cmd_retry(args):
-    """Retry a specific error item by resetting it to pending."""
+    """Retry error items by resetting them to pending.
+
+    All given items are checked first and reset in a single transaction;
+    nothing is changed if any of them is missing or not in 'error'.
+    """
     conn = get_db_connection()
     try:
         cur = conn.cursor()
 
         # Check current status
-        cur.execute(
-            "SELECT id, file_path, status FROM processing_queue WHERE id = %s",
-            (args.id,)
-        )
-        row = cur.fetchone()
-
-        if not row:
-            print(f"Error: Item {args.id} not found.")
-            sys.exit(1)
+        rows = _fetch_items(cur, args.ids)
 
-        item_id, file_path, status = row
-
-        if status != 'error':
+        not_error = [row for row in rows if row[2] != 'error']
+        for item_id, _, status in not_error:
             print(f"Error: Item {item_id} has status '{status}', not 'error'. Use 'reset' to force.")
+        if not_error:
             sys.exit(1)
 
-        cur.execute(
-            """UPDATE processing_queue
-               SET status = 'pending', error_message = NULL, next_retry_at = NULL
-               WHERE id = %s""",
-            (item_id,)
-        )
+        _relax_commit(cur)
+        _execute(cur, 'cli_retry_items', [row[0] for row in rows])
         conn.commit()
-        print(f"Item {item_id} reset to 'pending' for retry.")
-        print(f"  File: {file_path}")
+        for item_id, file_path, _ in rows:
+            print(f"Item {item_id} reset to 'pending' for retry.")
+            print(f"  File: {file_path}")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def cmd_retry_all(args):
@@ -192,98 +280,86 @@ def cmd_retry_all(args):
     try:
         cur = conn.cursor()
 
-        cur.execute(
-            """UPDATE processing_queue
-               SET status = 'pending', error_message = NULL, next_retry_at = NULL
-               WHERE status = 'error'
-               RETURNING id"""
-        )
-        updated_ids = [row[0] for row in cur.fetchall()]
+        _relax_commit(cur)
+        _execute(cur, 'cli_retry_all')
+        count = cur.rowcount
         conn.commit()
 
-        count = len(updated_ids)
         if count == 0:
             print("No error items to retry.")
         else:
             print(f"{count} item(s) reset to 'pending' for retry.")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def cmd_cleanup(args):
     """Remove old completed items from the queue."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
+
+    # Show what will be deleted; the connection goes back to the pool (ending
+    # its transaction) before the prompt so no snapshot is held while waiting
     conn = get_db_connection()
     try:
         cur = conn.cursor()
-
-        cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
-
-        # Show what will be deleted
-        cur.execute(
-            """SELECT COUNT(*) FROM processing_queue
-               WHERE status = 'completed' AND updated_at < %s""",
-            (cutoff,)
-        )
+        _execute(cur, 'cli_cleanup_count', cutoff)
         count = cur.fetchone()[0]
+    finally:
+        release_db_connection(conn)
 
-        if count == 0:
-            print(f"No completed items older than {args.days} days.")
+    if count == 0:
+        print(f"No completed items older than {args.days} days.")
+        return
+
+    if not args.yes:
+        response = input(f"Delete {count} completed item(s) older than {args.days} days? [y/N] ")
+        if response.lower() != 'y':
+            print("Cancelled.")
             return
 
-        if not args.yes:
-            response = input(f"Delete {count} completed item(s) older than {args.days} days? [y/N] ")
-            if response.lower() != 'y':
-                print("Cancelled.")
-                return
-
-        cur.execute(
-            """DELETE FROM processing_queue
-               WHERE status = 'completed' AND updated_at < %s""",
-            (cutoff,)
-        )
+    conn = get_db_connection()
+    try:
+        cur = conn.cursor()
+        _execute(cur, 'cli_cleanup_delete', cutoff)
+        deleted = cur.rowcount
         conn.commit()
-        print(f"Deleted {count} completed item(s).")
+        print(f"Deleted {deleted} completed item(s).")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def cmd_reset(args):
-    """Reset an item to pending status regardless of current status."""
+    """Reset items to pending status regardless of current status.
+
+    All given items are reset in a single transaction; nothing is changed
+    if any of them is missing.
+    """
     conn = get_db_connection()
     try:
         cur = conn.cursor()
 
-        cur.execute(
-            "SELECT id, file_path, status FROM processing_queue WHERE id = %s",
-            (args.id,)
-        )
-        row = cur.fetchone()
-
-        if not row:
-            print(f"Error: Item {args.id} not found.")
-            sys.exit(1)
-
-        item_id, file_path, current_status = row
+        rows = _fetch_items(cur, args.ids)
 
-        if current_status == 'pending':
-            print(f"Item {item_id} is already 'pending'.")
+        to_reset = []
+        for item_id, file_path, current_status in rows:
+            if current_status == 'pending':
+                print(f"Item {item_id} is already 'pending'.")
+            else:
+                to_reset.append((item_id, file_path, current_status))
+        if not to_reset:
             return
 
-        cur.execute(
-            """UPDATE processing_queue
-               SET status = 'pending', error_message = NULL,
-                   retry_count = 0, next_retry_at = NULL
-               WHERE id = %s""",
-            (item_id,)
-        )
+        _relax_commit(cur)
+        _execute(cur, 'cli_reset_items', [item_id for item_id, _, _ in to_reset])
         conn.commit()
-        print(f"Item {item_id} reset from '{current_status}' to 'pending'.")
-        print(f"  File: {file_path}")
+        for item_id, file_path, current_status in to_reset:
+            print(f"Item {item_id} reset from '{current_status}' to 'pending'.")
+            print(f"  File: {file_path}")
 
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 
 def _format_age(delta: timedelta) -> str:
@@ -313,9 +389,11 @@ def build_parser() -> argparse.ArgumentParser:
             '  python -m src list --status error     List error items\n'
             '  python -m src list --status error -v  List errors with messages\n'
             '  python -m src retry 42                Retry failed item #42\n'
+            '  python -m src retry 42 43 44          Retry several failed items at once\n'
             '  python -m src retry-all               Retry all failed items\n'
             '  python -m src cleanup --days 30       Remove completed items older than 30 days\n'
             '  python -m src reset 42                Force-reset item #42 to pending\n'
+            '  python -m src reset 42 43 44          Force-reset several items at once\n'
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -357,12 +435,14 @@ def build_parser() -> argparse.ArgumentParser:
     # retry
     retry_parser = subparsers.add_parser(
         'retry',
-        help='Retry a specific failed item (must have status "error")',
+        help='Retry specific failed items (must have status "error")',
     )
     retry_parser.add_argument(
-        'id',
+        'ids',
         type=int,
-        help='ID of the item to retry',
+        nargs='+',
+        metavar='id',
+        help='ID(s) of the item(s) to retry',
     )
 
     # retry-all
@@ -391,12 +471,14 @@ def build_parser() -> argparse.ArgumentParser:
     # reset
     reset_parser = subparsers.add_parser(
         'reset',
-        help='Force-reset an item to pending (works on any status)',
+        help='Force-reset items to pending (works on any status)',
     )
     reset_parser.add_argument(
-        'id',
+        'ids',
         type=int,
-        help='ID of the item to reset',
+        nargs='+',
+        metavar='id',
+        help='ID(s) of the item(s) to reset',
     )
 
     return parser
@@ -0,0 +1,222 @@
+"""Minimal Docker Engine API client over the Docker Unix socket.
+
+Only covers what the download manager needs: running a command in an
+existing container (exec) and streaming its output. Requests share one
+keep-alive connection; each exec's output stream gets its own, because
+Docker hijacks that connection for the raw stream.
+"""
+
+import http.client
+import logging
+import os
+import socket
+import struct
+import subprocess
+import threading
+import time
+from typing import Optional
+from urllib.parse import quote
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+DOCKER_SOCKET = os.getenv("DOCKER_SOCKET", "/var/run/docker.sock")
+# Oldest API version with everything used here (Docker 20.10+)
+DOCKER_API_VERSION = "v1.41"
+API_TIMEOUT = 10  # seconds, for control requests (not output streams)
+EXEC_POLL_INTERVAL = 0.2  # seconds between exec inspects while waiting for exit
+STREAM_READ_SIZE = 65536
+
+# Multiplexed stream frame header: stream type (1 byte), 3 padding bytes,
+# payload size (4 bytes, big-endian)
+_FRAME_HEADER = struct.Struct(">BxxxL")
+
+
+class DockerAPIError(Exception):
+    """Raised when the Docker daemon rejects a request."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a Unix socket instead of TCP."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+class DockerExec:
+    """A running exec session; mirrors the parts of subprocess.Popen in use.
+
+    Output is stdout and stderr merged, as with ``stderr=STDOUT``.
+    """
+
+    def __init__(self, client: "DockerClient", exec_id: str, sock: socket.socket, buffered: bytes):
+        self._client = client
+        self._exec_id = exec_id
+        self._sock = sock
+        self._buf = bytearray(buffered)
+        self._killed = False
+        self.returncode: Optional[int] = None
+
+    def read(self) -> bytes:
+        """Return the next chunk of output, or b'' once the stream has ended.
+
+        After kill() this returns b'' straight away, dropping any output
+        still buffered, so the reader stops at its next read.
+        """
+        buf = self._buf
+        while not self._killed:
+            # Take every complete frame already buffered
+            out = []
+            pos = 0
+            while len(buf) - pos >= _FRAME_HEADER.size:
+                _, size = _FRAME_HEADER.unpack_from(buf, pos)
+                end = pos + _FRAME_HEADER.size + size
+                if end > len(buf):
+                    break
+                out.append(bytes(buf[pos + _FRAME_HEADER.size:end]))
+                pos = end
+            del buf[:pos]
+            if out:
+                return b"".join(out)
+
+            try:
+                chunk = self._sock.recv(STREAM_READ_SIZE)
+            except OSError:
+                if not self._killed:
+                    raise
+                chunk = b""
+            if not chunk:
+                return b""
+            buf += chunk
+        return b""
+
+    def kill(self):
+        """Stop streaming output and report the session as killed.
+
+        Safe to call from another thread: shutting the socket down wakes a
+        read() blocked in recv. Like killing the ``docker exec`` CLI, this
+        detaches from the process; Docker offers no API to signal an
+        exec'd process.
+        """
+        self._killed = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        """Wait for the process to exit and return its exit code.
+
+        Returns -9 (as for SIGKILL) after kill(). Raises
+        subprocess.TimeoutExpired if it is still running after ``timeout``.
+        """
+        if self.returncode is not None:
+            return self.returncode
+        self._sock.close()
+        if self._killed:
+            self.returncode = -9
+            return self.returncode
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            info = self._client.inspect_exec(self._exec_id)
+            if not info.get("Running"):
+                self.returncode = info.get("ExitCode")
+                if self.returncode is None:
+                    self.returncode = -1
+                return self.returncode
+            if deadline is not None and time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(self._exec_id, timeout)
+            time.sleep(EXEC_POLL_INTERVAL)
+
+
+class DockerClient:
+    """Docker Engine API client sharing one keep-alive connection."""
+
+    def __init__(self, socket_path: str = DOCKER_SOCKET):
+        self._socket_path = socket_path
+        self._conn = _UnixHTTPConnection(socket_path, timeout=API_TIMEOUT)
+        # http.client connections aren't thread-safe; jobs run on their own threads
+        self._lock = threading.Lock()
+
+    def close(self):
+        """Close the shared control connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None):
+        """Send one API request on the shared connection and return its JSON body."""
+        payload = orjson.dumps(body) if body is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        with self._lock:
+            # Retry once on a fresh connection if the daemon closed the idle one
+            for attempt in range(2):
+                try:
+                    self._conn.request(method, f"/{DOCKER_API_VERSION}{path}", body=payload, headers=headers)
+                    resp = self._conn.getresponse()
+                    data = resp.read()
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._conn.close()
+                    if attempt:
+                        raise
+        if resp.status >= 400:
+            raise DockerAPIError(f"{method} {path} failed ({resp.status}): {data[:200].decode(errors='replace')}")
+        return orjson.loads(data) if data else None
+
+    def inspect_exec(self, exec_id: str) -> dict:
+        """Return the exec's state (``Running``, ``ExitCode``, ...)."""
+        return self._request("GET", f"/exec/{exec_id}/json")
+
+    def exec_start(self, container: str, cmd: list[str]) -> DockerExec:
+        """Run ``cmd`` in ``container`` and return a handle streaming its output."""
+        created = self._request("POST", f"/containers/{quote(container, safe='')}/exec", {
+            "AttachStdout": True,
+            "AttachStderr": True,
+            "Cmd": cmd,
+        })
+        exec_id = created["Id"]
+
+        # The output stream hijacks its connection, so it gets a raw socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(API_TIMEOUT)
+            sock.connect(self._socket_path)
+            body = orjson.dumps({"Detach": False, "Tty": False})
+            sock.sendall(
+                f"POST /{DOCKER_API_VERSION}/exec/{exec_id}/start HTTP/1.1\r\n"
+                f"Host: localhost\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: Upgrade\r\n"
+                f"Upgrade: tcp\r\n"
+                f"\r\n".encode() + body
+            )
+
+            # Read the response head; anything after it is already stream data
+            head = b""
+            while b"\r\n\r\n" not in head:
+                chunk = sock.recv(STREAM_READ_SIZE)
+                if not chunk:
+                    raise DockerAPIError(f"Connection closed while starting exec {exec_id}")
+                head += chunk
+            head, _, rest = head.partition(b"\r\n\r\n")
+            status_line = head.split(b"\r\n", 1)[0].decode(errors="replace")
+            parts = status_line.split(" ", 2)
+            if len(parts) < 2 or parts[1] not in ("101", "200"):
+                raise DockerAPIError(f"Starting exec {exec_id} failed: {status_line}")
+            # Output streams for as long as the process runs
+            sock.settimeout(None)
+        except BaseException:
+            sock.close()
+            raise
+
+        return DockerExec(self, exec_id, sock, rest)
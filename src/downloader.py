@@ -1,4 +1,4 @@
-"""yt-dlp download manager using docker exec to trigger downloads.
+"""yt-dlp download manager using Docker exec (via the Engine API) to trigger downloads.
 
 Persists jobs to PostgreSQL via QueueDB. Keeps in-memory buffer only for
 active downloads (real-time output between DB flushes).
@@ -6,17 +6,67 @@ active downloads (real-time output between DB flushes).
 
 import logging
 import os
+import queue
 import subprocess
 import threading
 import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+from .docker_api import DockerClient, DockerExec
 
 logger = logging.getLogger(__name__)
 
 DOWNLOAD_TIMEOUT = 1800  # 30 minutes
-DB_FLUSH_INTERVAL = 5  # seconds between output_tail DB writes
+# A running job's output_tail is written once DB_FLUSH_MIN_LINES new lines
+# have built up, and otherwise every DB_FLUSH_INTERVAL seconds if it has any
+# new line (also while its output is stalled); unchanged output is not written
+DB_FLUSH_INTERVAL = 5  # seconds
+DB_FLUSH_MIN_LINES = 10
+# Periodic output_tail writes from all jobs are coalesced by one writer thread:
+# it collects updates for up to TAIL_WRITE_WINDOW seconds (or TAIL_WRITE_MAX_ROWS
+# jobs) and stores them with a single UPDATE
+TAIL_WRITE_WINDOW = 0.25
+TAIL_WRITE_MAX_ROWS = 100
+
+
+def _iter_output_batches(read: Callable[[], bytes]):
+    """Yield the complete lines of each chunk read from a raw output stream.
+
+    ``read`` returns the next chunk, or b'' at the end. Lines are split on
+    ``\n``, ``\r\n`` and bare ``\r`` (progress updates) like a text-mode
+    pipe would, with trailing whitespace stripped. Each chunk is split with
+    one ``bytes.splitlines()`` pass, so the per-line work left to the caller
+    is what it does with the list.
+    """
+    pending = b''
+    after_cr = False  # the last chunk ended in \r, which may pair with a \n
+    while True:
+        chunk = read()
+        if not chunk:
+            break
+        if after_cr and chunk.startswith(b'\n'):
+            # Second half of a \r\n split across reads: the line already ended
+            chunk = chunk[1:]
+            if not chunk:
+                after_cr = False
+                continue
+        data = pending + chunk if pending else chunk
+        after_cr = data.endswith(b'\r')
+        # Everything after the last line break is a partial line; carry it
+        # over. UTF-8 never uses \n or \r inside a multibyte character, so
+        # each complete line decodes cleanly. bytes.splitlines() (unlike
+        # str.splitlines()) breaks only on \n, \r\n and \r, in one pass
+        end = max(data.rfind(b'\n'), data.rfind(b'\r')) + 1
+        pending = data[end:]
+        if not end:
+            continue
+        yield [raw.decode('utf-8', 'replace').rstrip() for raw in data[:end].splitlines()]
+    if pending:
+        yield [pending.decode('utf-8', 'replace').rstrip()]
 
 
 class DownloadStatus(str, Enum):
@@ -26,37 +76,57 @@ class DownloadStatus(str, Enum):
     FAILED = "failed"
 
 
+def _iso(val: Optional[datetime]) -> Optional[str]:
+    """Format a timestamp column (datetime or NULL) for JSON."""
+    return val.isoformat() if val is not None else None
+
+
 def _row_to_dict(row: dict) -> dict:
     """Convert a DB row to the API-friendly dict format."""
-    def _fmt(val):
-        if val is None:
-            return None
-        if isinstance(val, datetime):
-            return val.isoformat()
-        return val
-
-    output_tail = row.get('output_tail') or []
+    output_tail = row.get('output_tail')
     return {
         "id": row['id'],
         "url": row['url'],
         "filename": row.get('filename'),
         "status": row['status'],
-        "created_at": _fmt(row.get('created_at')),
-        "started_at": _fmt(row.get('started_at')),
-        "finished_at": _fmt(row.get('finished_at')),
+        "created_at": _iso(row.get('created_at')),
+        "started_at": _iso(row.get('started_at')),
+        "finished_at": _iso(row.get('finished_at')),
         "error": row.get('error'),
         "output_tail": output_tail[-20:] if output_tail else [],
     }
 
 
+@dataclass(slots=True)
+class _ActiveJob:
+    """In-memory state of a running download (real-time output between DB flushes)."""
+    # Last 50 lines. deque(maxlen) is a ring buffer in C: appends reuse its
+    # preallocated blocks and drop the oldest line, no shifting. Only the
+    # job's own thread appends; readers copy it with a single list() call,
+    # which (like append) runs entirely in C under the GIL, so neither side
+    # needs a lock
+    lines: deque[str] = field(default_factory=lambda: deque(maxlen=50))
+    proc: Optional[DockerExec] = None
+    # Lines appended so far (by the job's thread), and how many of them the
+    # last queued output_tail snapshot covered
+    lines_total: int = 0
+    lines_flushed: int = 0
+
+
 class DownloadManager:
     def __init__(self, queue_db):
         self._queue_db = queue_db
-        # In-memory buffer: only for active downloads (real-time output between DB flushes)
-        self._active_output: dict[int, list[str]] = {}
-        self._active_procs: dict[int, subprocess.Popen] = {}
+        # Active downloads only. Single lookups need no lock; _lock makes the
+        # "remove only if still the same job" check in _unregister and the
+        # snapshot bookkeeping in _queue_tail atomic
+        self._active: dict[int, _ActiveJob] = {}
         self._lock = threading.Lock()
         self._container_name = os.getenv("YTDLP_CONTAINER_NAME", "ytdlp")
+        # One Docker API client (one keep-alive socket connection) for all jobs
+        self._docker = DockerClient()
+        # (job_id, output_tail) updates for the tail writer thread
+        self._tail_queue: queue.Queue[tuple[int, list[str]]] = queue.Queue()
+        threading.Thread(target=self._tail_writer, name='download-tail-writer', daemon=True).start()
 
         # Recover stale jobs from previous container run
         recovered = self._queue_db.recover_stale_downloads()
@@ -68,8 +138,7 @@ class DownloadManager:
         row = self._queue_db.add_download(url, filename)
         job_id = row['id']
 
-        with self._lock:
-            self._active_output[job_id] = []
+        self._register(job_id)
 
         thread = threading.Thread(target=self._run_download, args=(job_id, url, filename), daemon=True)
         thread.start()
@@ -83,21 +152,21 @@ class DownloadManager:
             return None
         result = _row_to_dict(row)
         # Overlay real-time output for active downloads
-        with self._lock:
-            if job_id in self._active_output:
-                result['output_tail'] = self._active_output[job_id][-20:]
+        live_tail = self._live_tail(job_id)
+        if live_tail is not None:
+            result['output_tail'] = live_tail
         return result
 
     def list_jobs(self, limit: int = 10, offset: int = 0, status: str = None) -> tuple[list[dict], int]:
         """List recent download jobs with pagination. Returns (jobs, total_count)."""
         rows, total = self._queue_db.list_downloads(limit=limit, offset=offset, status=status)
         results = []
-        with self._lock:
-            for row in rows:
-                result = _row_to_dict(row)
-                if row['id'] in self._active_output:
-                    result['output_tail'] = self._active_output[row['id']][-20:]
-                results.append(result)
+        for row in rows:
+            result = _row_to_dict(row)
+            live_tail = self._live_tail(row['id'])
+            if live_tail is not None:
+                result['output_tail'] = live_tail
+            results.append(result)
         return results, total
 
     def retry(self, job_id: int) -> Optional[dict]:
@@ -115,8 +184,7 @@ class DownloadManager:
         url = row['url']
         filename = row.get('filename')
 
-        with self._lock:
-            self._active_output[job_id] = []
+        self._register(job_id)
 
         thread = threading.Thread(target=self._run_download, args=(job_id, url, filename), daemon=True)
         thread.start()
@@ -128,8 +196,8 @@ class DownloadManager:
     def delete(self, job_id: int) -> bool:
         """Delete a download job. Cancels it first if active."""
         # Cancel if still running
-        with self._lock:
-            proc = self._active_procs.get(job_id)
+        job = self._active.get(job_id)
+        proc = job.proc if job else None
         if proc:
             try:
                 proc.kill()
@@ -141,16 +209,14 @@ class DownloadManager:
         # Delete from DB
         deleted = self._queue_db.delete_download(job_id)
         if deleted:
-            with self._lock:
-                self._active_output.pop(job_id, None)
-                self._active_procs.pop(job_id, None)
+            self._unregister(job_id)
             logger.info(f"[Download] Job {job_id} deleted")
         return deleted
 
     def cancel(self, job_id: int) -> bool:
         """Cancel an active download. Returns True if cancelled, False if not active."""
-        with self._lock:
-            proc = self._active_procs.get(job_id)
+        job = self._active.get(job_id)
+        proc = job.proc if job else None
         if proc is None:
             # Not actively running — just mark as failed in DB
             row = self._queue_db.get_download(job_id)
@@ -164,7 +230,7 @@ class DownloadManager:
                 logger.info(f"[Download] Job {job_id} marked as cancelled (no active process)")
                 return True
             return False
-        # Kill the subprocess
+        # Detach from the exec session
         try:
             proc.kill()
             logger.info(f"[Download] Job {job_id} process killed by user")
@@ -175,56 +241,55 @@ class DownloadManager:
 
     def _run_download(self, job_id: int, url: str, filename: Optional[str]):
         """Run the download in a background thread."""
-        now = datetime.now(timezone.utc)
-        self._queue_db.update_download_status(
-            job_id, status='downloading', started_at=now,
-        )
-
-        cmd = ["docker", "exec", self._container_name, "bash", "./scripts/downloadWithFileName.sh", url]
+        cmd = ["bash", "./scripts/downloadWithFileName.sh", url]
         if filename:
             cmd.append(filename)
 
-        logger.info(f"[Download] Job {job_id} starting: {' '.join(cmd)}")
-
+        job = self._active.get(job_id) or self._register(job_id)
         try:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+            # Inside the try so a failed write marks the job failed instead
+            # of leaving it queued
+            self._queue_db.update_download_status(
+                job_id, status='downloading', started_at=datetime.now(timezone.utc),
             )
-            with self._lock:
-                self._active_procs[job_id] = proc
-
-            output_lines = []
-            last_flush = time.monotonic()
-
-            for line in proc.stdout:
-                line = line.rstrip()
-                if line:
-                    logger.info(f"[Download:{job_id}] {line}")
-                output_lines.append(line)
-                # Keep last 50 lines in memory
-                if len(output_lines) > 50:
-                    output_lines.pop(0)
-
-                with self._lock:
-                    self._active_output[job_id] = output_lines.copy()
-
-                # Flush to DB periodically
-                if time.monotonic() - last_flush >= DB_FLUSH_INTERVAL:
-                    self._queue_db.update_download_status(
-                        job_id, output_tail=output_lines[-50:],
-                    )
-                    last_flush = time.monotonic()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"[Download] Job {job_id} starting in {self._container_name}: {' '.join(cmd)}")
+
+            proc = self._docker.exec_start(self._container_name, cmd)
+            job.proc = proc
+
+            output_lines = job.lines
+            # Set when the script prints "OK:" (see the exit code check below);
+            # tracked per line so it counts even after leaving the 50-line tail
+            output_has_ok = False
+            # Per-line output is only logged at DEBUG; INFO gets one line per flush
+            log_lines = logger.isEnabledFor(logging.DEBUG)
+
+            for batch in _iter_output_batches(proc.read):
+                if not output_has_ok:
+                    output_has_ok = any(line.lstrip().startswith("OK:") for line in batch)
+                if log_lines:
+                    for line in batch:
+                        if line:
+                            logger.debug(f"[Download:{job_id}] {line}")
+                output_lines.extend(batch)
+                job.lines_total += len(batch)
+
+                # Flush early once enough new output has built up; the tail
+                # writer flushes smaller changes on its interval, and the
+                # final status update always writes the complete tail
+                if job.lines_total - job.lines_flushed >= DB_FLUSH_MIN_LINES:
+                    self._queue_tail(job_id, job)
 
             proc.wait(timeout=DOWNLOAD_TIMEOUT)
+            finished_at = datetime.now(timezone.utc)
+            output_tail = list(output_lines)
 
             # The shell script uses set -e and the last [[ -f ]] test
             # returns 1 when no subtitle file exists, even though the
-            # video downloaded fine. Treat as success if output has "OK:".
-            output_has_ok = any(l.strip().startswith("OK:") for l in output_lines)
-
+            # video downloaded fine. Treat as success if output had "OK:"
+            # (output_has_ok, tracked while reading).
             if proc.returncode == -9 or proc.returncode == -15:
                 # Killed by signal (SIGKILL=-9, SIGTERM=-15) — user cancelled
                 logger.info(f"[Download] Job {job_id} was cancelled by user")
@@ -232,8 +297,8 @@ class DownloadManager:
                     job_id,
                     status='failed',
                     error='Cancelled by user',
-                    output_tail=output_lines[-50:],
-                    finished_at=datetime.now(timezone.utc),
+                    output_tail=output_tail,
+                    finished_at=finished_at,
                 )
             elif proc.returncode == 0 or output_has_ok:
                 if proc.returncode != 0:
@@ -243,8 +308,8 @@ class DownloadManager:
                 self._queue_db.update_download_status(
                     job_id,
                     status='completed',
-                    output_tail=output_lines[-50:],
-                    finished_at=datetime.now(timezone.utc),
+                    output_tail=output_tail,
+                    finished_at=finished_at,
                 )
             else:
                 error_msg = f"Exit code {proc.returncode}"
@@ -253,8 +318,8 @@ class DownloadManager:
                     job_id,
                     status='failed',
                     error=error_msg,
-                    output_tail=output_lines[-50:],
-                    finished_at=datetime.now(timezone.utc),
+                    output_tail=output_tail,
+                    finished_at=finished_at,
                 )
 
         except subprocess.TimeoutExpired:
@@ -275,10 +340,87 @@ class DownloadManager:
                 finished_at=datetime.now(timezone.utc),
             )
         finally:
-            # Remove from active buffers
-            with self._lock:
-                self._active_output.pop(job_id, None)
-                self._active_procs.pop(job_id, None)
+            # Remove from active buffers (unless a retry has already replaced them)
+            self._unregister(job_id, job)
+
+    def _register(self, job_id: int) -> _ActiveJob:
+        """Add (empty) live state for a job about to start."""
+        job = self._active[job_id] = _ActiveJob()
+        return job
+
+    def _unregister(self, job_id: int, job: Optional[_ActiveJob] = None):
+        """Drop a job's live state once it has finished or been deleted.
+
+        With ``job`` given, only drops it if it is still the registered state.
+        """
+        with self._lock:
+            if job is None or self._active.get(job_id) is job:
+                self._active.pop(job_id, None)
+
+    def _live_tail(self, job_id: int) -> Optional[list[str]]:
+        """Last 20 lines of a running job's output, or None if it isn't active."""
+        job = self._active.get(job_id)
+        if job is None:
+            return None
+        return list(job.lines)[-20:]
+
+    def _queue_tail(self, job_id: int, job: _ActiveJob):
+        """Queue a snapshot of a job's output for the tail writer, if it has new lines."""
+        with self._lock:
+            new_lines = job.lines_total - job.lines_flushed
+            if new_lines <= 0:
+                return
+            job.lines_flushed = job.lines_total
+            tail = list(job.lines)
+        logger.info(f"[Download:{job_id}] {new_lines} new lines, last: {tail[-1]}")
+        self._tail_queue.put((job_id, tail))
+
+    def _tail_writer(self):
+        """Write queued output_tail updates, coalescing them into batch UPDATEs.
+
+        Every DB_FLUSH_INTERVAL it also queues a snapshot of each active job
+        with lines not yet written, so output that stops short of
+        DB_FLUSH_MIN_LINES still reaches the database. Final statuses are
+        written directly by _run_download (together with the full tail), so
+        only progress snapshots go through here.
+        """
+        next_sweep = time.monotonic() + DB_FLUSH_INTERVAL
+        while True:
+            timeout = next_sweep - time.monotonic()
+            if timeout <= 0:
+                self._sweep_tails()
+                next_sweep = time.monotonic() + DB_FLUSH_INTERVAL
+                continue
+            try:
+                update = self._tail_queue.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            self._write_tails(update)
+
+    def _sweep_tails(self):
+        """Queue a snapshot of every active job with lines not yet written."""
+        for job_id, job in list(self._active.items()):
+            self._queue_tail(job_id, job)
+
+    def _write_tails(self, first: tuple[int, list[str]]):
+        """Store ``first`` and the updates queued within TAIL_WRITE_WINDOW with one UPDATE."""
+        pending = dict([first])
+        deadline = time.monotonic() + TAIL_WRITE_WINDOW
+        while len(pending) < TAIL_WRITE_MAX_ROWS:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                job_id, tail = self._tail_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            # A newer snapshot of the same job replaces the older one
+            pending[job_id] = tail
+
+        try:
+            self._queue_db.update_download_tails(list(pending.items()))
+        except Exception:
+            logger.exception(f"[Download] Failed to write output tails for jobs {sorted(pending)}")
 
 
 # Singleton instance
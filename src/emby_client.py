@@ -1,29 +1,183 @@
 """Emby server API client for triggering library scans and image management."""
 
 import base64
+import functools
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from enum import Enum
+from pathlib import Path
+from typing import Callable
 from urllib.parse import urlencode, urlparse, parse_qs, urlunparse
 
+import orjson
 import requests
+from urllib3.util.retry import Retry
 
-from .metrics import API_REQUESTS_TOTAL, API_REQUEST_DURATION
+from .metrics import API_REQUESTS_TOTAL, API_REQUEST_DURATION, UPDATE_VERIFICATION_MISMATCHES_TOTAL
 
 logger = logging.getLogger(__name__)
 
+# Metric children resolved once at import; .labels() takes a lock and a dict
+# lookup on every call
+_REQUESTS_OK = API_REQUESTS_TOTAL.labels(service='emby', status='success')
+_REQUESTS_ERROR = API_REQUESTS_TOTAL.labels(service='emby', status='error')
+_SCAN_DURATION = API_REQUEST_DURATION.labels(service='emby', operation='scan_library')
+_LOOKUP_DURATION = API_REQUEST_DURATION.labels(service='emby', operation='get_item_by_path')
+_UPDATE_DURATION = API_REQUEST_DURATION.labels(service='emby', operation='update_metadata')
+_UPLOAD_DURATION = API_REQUEST_DURATION.labels(service='emby', operation='upload_image')
+
 # Default retry schedule: exponential backoff 2s, 4s, 8s, 16s, 32s, 64s
 DEFAULT_RETRY_DELAYS = [2, 4, 8, 16, 32, 64]
+# Each retry sleeps a random 50%-150% of its scheduled delay, so workers that
+# scanned at the same moment don't poll Emby in lockstep
+RETRY_JITTER = 0.5
+
+# Path lookups fail fast for BREAKER_RESET_TIMEOUT seconds after
+# BREAKER_FAILURE_THRESHOLD consecutive request errors (Emby down/overloaded)
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30
+# Item polling stops after this many consecutive failed lookups (as opposed
+# to lookups that succeed but don't find the item yet)
+MAX_CONSECUTIVE_LOOKUP_ERRORS = 2
+
+# Default update_many fan-out; well within HTTP_POOL_MAXSIZE
+UPDATE_MANY_WORKERS = 8
+
+# Base /Items query for movie lookups by path
+_MOVIE_PATH_PARAMS = {'Recursive': 'true', 'IncludeItemTypes': 'Movie', 'Fields': 'Path'}
+
+# Extra headers for JSON requests to Emby (the API token is added by
+# _EmbyAuthAdapter); requests copies them, so one dict serves every call
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# Headers for image downloads (plus a Bearer token for WordPress hosts)
+IMAGE_REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0', 'Accept': 'image/*,*/*;q=0.8'}
+_RECURSIVE_PARAMS = {'Recursive': 'true'}
+
+# Image hosts (and their subdomains) that get the WordPress Bearer token
+WORDPRESS_HOSTS = frozenset({'familyhub.id'})
 
 # Image types uploaded per item: Primary (original), Backdrop (W800), Banner (W800)
 IMAGE_TYPES = ('Primary', 'Backdrop', 'Banner')
 
+# Existing images cleared before an upload, as (image_type, index). The
+# deletes are independent, so they are sent concurrently
+STALE_IMAGES = (
+    *(('Backdrop', i) for i in range(5)),
+    ('Banner', 0),
+    ('Primary', 0),
+    ('Logo', 0),
+)
+
+# Keep-alive connections kept per host by the HTTP session; sized above the
+# bulk refresh fan-out (including each item's concurrent image deletes) so
+# concurrent calls never discard pooled connections
+HTTP_POOL_MAXSIZE = 48
+
+# Transport-level retries for brief gateway errors (idempotent methods only,
+# urllib3's default); failures beyond these surface as RequestException
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+
+
+class LookupStatus(Enum):
+    """Outcome of an Emby item lookup."""
+    FOUND = 'found'
+    NOT_INDEXED = 'not_indexed'  # Emby answered, no matching item (yet)
+    ERROR = 'error'  # request failed or was skipped
+
+
+def _csv_to_named(value) -> list[dict]:
+    """``[{'Name': ...}]`` entries from a list or comma-separated string, in one pass."""
+    if isinstance(value, str):
+        value = value.split(',')
+    return [{'Name': name} for name in (v.strip() for v in value) if name]
+
+
+def _jittered(delay: float) -> float:
+    """A retry delay randomised by +/-RETRY_JITTER."""
+    return random.uniform(delay * (1 - RETRY_JITTER), delay * (1 + RETRY_JITTER))
+
+
+class _CircuitBreaker:
+    """Fails calls fast after repeated request errors, until a cool-down passes.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    allow() returns False for ``reset_timeout`` seconds. Then one call is let
+    through as a trial (half-open): success closes the breaker, another
+    failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        # Shared by every worker using the client
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """True while calls are being rejected."""
+        with self._lock:
+            return (self._opened_at is not None
+                    and time.monotonic() - self._opened_at < self.reset_timeout)
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Half-open: this call is the trial; hold others back until it reports
+            self._opened_at = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info('Emby reachable again, closing circuit breaker')
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(
+                        'Emby failed %d times in a row, failing lookups fast for %ds',
+                        self._failures, self.reset_timeout,
+                    )
+                self._opened_at = time.monotonic()
+
+
+class _EmbyAuthAdapter(requests.adapters.HTTPAdapter):
+    """Adapter for requests to the Emby server; adds the API token header.
+
+    Mounted on the Emby base URL only, so the token is never sent to other
+    hosts (image downloads) or along redirects away from Emby.
+    """
+
+    def __init__(self, api_key: str, **kwargs):
+        self._api_key = api_key
+        super().__init__(**kwargs)
+
+    def add_headers(self, request, **kwargs):
+        request.headers.setdefault('X-Emby-Token', self._api_key)
+
 
 class EmbyClient:
     """Client for Emby server API operations."""
 
     def __init__(self, base_url: str, api_key: str, parent_folder_id: str = '',
                  user_id: str = '', wordpress_token: str = '', retry_delays: list[int] | None = None,
-                 token_manager=None):
+                 token_manager=None, verify_updates: bool = False,
+                 session: requests.Session | None = None):
         """Initialize Emby client.
 
         Args:
@@ -34,6 +188,12 @@ class EmbyClient:
             wordpress_token: WordPress API token for downloading images (static fallback)
             retry_delays: List of delay seconds for retry attempts. Defaults to [2,4,8,16,32,64].
             token_manager: Optional TokenManager instance for auto-refreshing WordPress tokens
+            verify_updates: If True, update_item_metadata reads each update back
+                and fails on a mismatch. If False (default), the read-back runs
+                in the background and only logs and counts mismatches.
+            session: Shared HTTP session (e.g. the MetadataClient's, see
+                metadata.create_http_session); the caller closes it. If None,
+                the client creates and owns one.
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
@@ -42,6 +202,43 @@ class EmbyClient:
         self._static_wordpress_token = wordpress_token
         self._token_manager = token_manager
         self.retry_delays = retry_delays if retry_delays is not None else DEFAULT_RETRY_DELAYS
+        # /Items query base scoped to the parent folder (if configured); the
+        # folder never changes, so it is built once
+        scope = {'ParentId': parent_folder_id} if parent_folder_id else {}
+        self._video_scope_params = {**_MOVIE_PATH_PARAMS, 'IncludeItemTypes': 'Video', **scope}
+        self._api_key_params = {'api_key': api_key}
+        self._breaker = _CircuitBreaker()
+        self.verify_updates = verify_updates
+        # Background read-back checks when verify_updates is off
+        self._verify_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='emby-verify')
+        # Keep-alive session shared by every call on this client
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self._session = session
+        # Emby calls go through their own adapter, which sends the API token
+        self._session.mount(
+            f'{self.base_url}/',
+            _EmbyAuthAdapter(api_key, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY),
+        )
+
+    def close(self):
+        """Close the underlying HTTP session, unless it was passed in.
+
+        Pending background checks are dropped.
+        """
+        self._verify_executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @property
     def wordpress_token(self) -> str:
@@ -60,15 +257,13 @@ class EmbyClient:
             True if scan was triggered successfully, False otherwise.
         """
         url = f'{self.base_url}/Library/Refresh'
-        headers = {'X-Emby-Token': self.api_key}
-        params = {}
-
-        if path:
-            params['path'] = path
+        params = {'path': path} if path else {}
 
         try:
-            resp = requests.post(url, headers=headers, params=params, timeout=10)
-            logger.info('Emby scan response: status=%s, body=%s', resp.status_code, resp.text[:200])
+            resp = self._session.post(url, params=params, timeout=10)
+            # resp.text decodes the whole body; skip it when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Emby scan response: status=%s, body=%s', resp.status_code, resp.text[:200])
             resp.raise_for_status()
             logger.info('Emby library scan triggered successfully')
             return True
@@ -85,10 +280,9 @@ class EmbyClient:
             List of library dicts with 'Name' and 'Id', or None on error.
         """
         url = f'{self.base_url}/Library/VirtualFolders'
-        headers = {'X-Emby-Token': self.api_key}
 
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = self._session.get(url, timeout=10)
             resp.raise_for_status()
             libraries = resp.json()
             logger.info('Found %d Emby libraries', len(libraries))
@@ -110,22 +304,17 @@ class EmbyClient:
             True if scan was triggered successfully, False otherwise.
         """
         url = f'{self.base_url}/emby/Items/{library_id}/Refresh'
-        headers = {
-            'X-Emby-Token': self.api_key,
-            'Content-Type': 'application/json',
-        }
-        params = {'Recursive': 'true'}
 
         try:
             start = time.monotonic()
-            resp = requests.post(url, headers=headers, params=params, timeout=30)
-            API_REQUEST_DURATION.labels(service='emby', operation='scan_library').observe(time.monotonic() - start)
+            resp = self._session.post(url, headers=JSON_HEADERS, params=_RECURSIVE_PARAMS, timeout=30)
+            _SCAN_DURATION.observe(time.monotonic() - start)
             resp.raise_for_status()
-            API_REQUESTS_TOTAL.labels(service='emby', status='success').inc()
+            _REQUESTS_OK.inc()
             logger.info('Emby library %s scan triggered successfully', library_id)
             return True
         except requests.RequestException as e:
-            API_REQUESTS_TOTAL.labels(service='emby', status='error').inc()
+            _REQUESTS_ERROR.inc()
             logger.warning('Failed to trigger Emby library %s scan: %s', library_id, e)
             return False
 
@@ -136,43 +325,60 @@ class EmbyClient:
             file_path: Full path to the video file
 
         Returns:
-            Item dict with Id and other metadata, or None if not found.
+            Item dict with Id and other metadata, or None if not found (or
+            on error; see lookup_item_by_path to tell the two apart).
+        """
+        return self.lookup_item_by_path(file_path)[0]
+
+    def lookup_item_by_path(self, file_path: str) -> tuple[dict | None, LookupStatus]:
+        """Find Emby item by file path, reporting why nothing was returned.
+
+        Args:
+            file_path: Full path to the video file
+
+        Returns:
+            (item, status): the item dict and FOUND; None and NOT_INDEXED if
+            Emby answered without a match; None and ERROR if the request
+            failed (transport error, 4xx/5xx) or the circuit breaker is open.
         """
+        if not self._breaker.allow():
+            logger.warning('Emby circuit breaker open, skipping path lookup: %s', file_path)
+            return None, LookupStatus.ERROR
+
         url = f'{self.base_url}/Items'
-        headers = {'X-Emby-Token': self.api_key}
-        params = {
-            'Recursive': 'true',
-            'IncludeItemTypes': 'Movie',
-            'Fields': 'Path',
-            'Path': file_path,
-        }
+        params = {**_MOVIE_PATH_PARAMS, 'Path': file_path}
 
         try:
             start = time.monotonic()
-            resp = requests.get(url, headers=headers, params=params, timeout=10)
-            API_REQUEST_DURATION.labels(service='emby', operation='get_item_by_path').observe(time.monotonic() - start)
+            resp = self._session.get(url, params=params, timeout=10)
+            _LOOKUP_DURATION.observe(time.monotonic() - start)
             resp.raise_for_status()
-            API_REQUESTS_TOTAL.labels(service='emby', status='success').inc()
+            self._breaker.record_success()
+            _REQUESTS_OK.inc()
             data = resp.json()
             items = data.get('Items', [])
 
             if items:
                 logger.info('Found Emby item for path %s: %s', file_path, items[0].get('Id'))
-                return items[0]
+                return items[0], LookupStatus.FOUND
 
             logger.warning('No Emby item found for path: %s', file_path)
-            return None
+            return None, LookupStatus.NOT_INDEXED
         except requests.RequestException as e:
-            API_REQUESTS_TOTAL.labels(service='emby', status='error').inc()
+            self._breaker.record_failure()
+            _REQUESTS_ERROR.inc()
             logger.error('Failed to find Emby item by path: %s', e)
-            return None
+            return None, LookupStatus.ERROR
 
     def get_item_by_path_with_retry(self, file_path: str) -> dict | None:
         """Find Emby item by file path, retrying with exponential backoff.
 
         After a library scan, Emby takes time to index new files. This method
-        polls with exponential backoff until the item appears or retries are
-        exhausted. Falls back to find_item_by_filename if path search fails.
+        polls with jittered exponential backoff until the item appears or
+        retries are exhausted. Falls back to find_item_by_filename if path
+        search fails. Gives up early when lookups keep failing outright
+        (Emby down, bad API key) rather than just not finding the item yet,
+        and while the circuit breaker is open.
 
         Args:
             file_path: Full path to the video file
@@ -181,25 +387,37 @@ class EmbyClient:
             Item dict with Id and other metadata, or None if not found after all retries.
         """
         # Try immediate lookup first (no delay)
-        item = self.get_item_by_path(file_path)
+        item, status = self.lookup_item_by_path(file_path)
         if item:
             return item
+        errors = 1 if status is LookupStatus.ERROR else 0
 
-        # Retry with exponential backoff
+        # Retry with jittered exponential backoff
         for i, delay in enumerate(self.retry_delays):
+            if self._breaker.is_open:
+                logger.error('Emby unavailable, giving up on: %s', file_path)
+                return None
+            delay = _jittered(delay)
             logger.info(
-                'Item not found yet, retry %d/%d in %ds for: %s',
+                'Item not found yet, retry %d/%d in %.1fs for: %s',
                 i + 1, len(self.retry_delays), delay, file_path,
             )
             time.sleep(delay)
 
-            item = self.get_item_by_path(file_path)
+            item, status = self.lookup_item_by_path(file_path)
             if item:
                 logger.info('Found item after retry %d for: %s', i + 1, file_path)
                 return item
+            errors = errors + 1 if status is LookupStatus.ERROR else 0
+            if errors >= MAX_CONSECUTIVE_LOOKUP_ERRORS:
+                logger.error(
+                    'Emby path lookup failed %d times in a row (server error or '
+                    'misconfiguration, not indexing delay), giving up on: %s',
+                    errors, file_path,
+                )
+                return None
 
         # Final fallback: search by filename
-        from pathlib import Path
         filename = Path(file_path).name
         logger.info('Path search exhausted, trying filename fallback: %s', filename)
         item = self.find_item_by_filename(filename)
@@ -223,43 +441,32 @@ class EmbyClient:
             filename: The video filename to search for (e.g., 'ABC-123.mp4')
 
         Returns:
-            Item dict with Id and other metadata, or None if not found.
+            Item dict whose Path ends with ``filename``, or None if no search
+            result matches.
         """
         url = f'{self.base_url}/Items'
-        headers = {'X-Emby-Token': self.api_key}
-        params = {
-            'Recursive': 'true',
-            'IncludeItemTypes': 'Video',
-            'Fields': 'Path',
-            'SearchTerm': filename,
-        }
-
-        # Scope search to parent folder if configured
-        if self.parent_folder_id:
-            params['ParentId'] = self.parent_folder_id
+        params = {**self._video_scope_params, 'SearchTerm': filename}
 
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=10)
+            resp = self._session.get(url, params=params, timeout=10)
             resp.raise_for_status()
             data = resp.json()
             items = data.get('Items', [])
 
-            # Match by filename in the Path field
-            for item in items:
-                item_path = item.get('Path', '')
-                if item_path.endswith(filename):
-                    logger.info('Found Emby item by filename %s: %s', filename, item.get('Id'))
-                    return item
+            # Match by filename in the Path field. Search results are fuzzy, so
+            # anything else would be the wrong item; never fall back to one
+            match = next((item for item in items if (item.get('Path') or '').endswith(filename)), None)
+            if match is not None:
+                logger.info('Found Emby item by filename %s: %s', filename, match.get('Id'))
+                return match
 
-            # If no exact path match but we got results, return the first one
             if items:
-                logger.info(
-                    'No exact path match for %s, using first search result: %s',
-                    filename, items[0].get('Id'),
+                logger.warning(
+                    'No Emby search result for %s has a matching path (%d results), ignoring them',
+                    filename, len(items),
                 )
-                return items[0]
-
-            logger.warning('No Emby item found for filename: %s', filename)
+            else:
+                logger.warning('No Emby item found for filename: %s', filename)
             return None
         except requests.RequestException as e:
             logger.error('Failed to find Emby item by filename: %s', e)
@@ -279,12 +486,11 @@ class EmbyClient:
             url = f'{self.base_url}/Users/{self.user_id}/Items/{item_id}'
         else:
             url = f'{self.base_url}/Items/{item_id}'
-        headers = {'X-Emby-Token': self.api_key}
 
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = self._session.get(url, timeout=10)
             resp.raise_for_status()
-            item = resp.json()
+            item = orjson.loads(resp.content)
             logger.info('Retrieved Emby item details for %s', item_id)
             return item
         except requests.RequestException as e:
@@ -301,7 +507,8 @@ class EmbyClient:
                   genre (array/string), label, movie_code
 
         Returns:
-            True if update succeeded, False otherwise.
+            True if update succeeded (and, with verify_updates, was read back
+            intact), False otherwise.
         """
         # First, get the existing item
         emby_item = self.get_item_details(item_id)
@@ -314,7 +521,7 @@ class EmbyClient:
         file_path = emby_item.get('Path', '')
         if file_path:
             # Extract filename without extension: /path/to/file.mp4 -> file
-            filename = file_path.replace('\\', '/').split('/')[-1]  # Get last part
+            filename = file_path.replace('\\', '/').rpartition('/')[2]  # Get last part
             name_without_ext = filename.rsplit('.', 1)[0]  # Remove extension
             emby_item['Name'] = name_without_ext
             emby_item['SortName'] = name_without_ext  # Same as Name
@@ -341,56 +548,98 @@ class EmbyClient:
         # Handle actress -> People
         actress_list = metadata.get('actress', [])
         if actress_list:
+            # Strip each name once, as _csv_to_named does
             emby_item['People'] = [
-                {'Name': name.strip(), 'Type': 'Actor'}
-                for name in actress_list
-                if name.strip()
+                {'Name': name, 'Type': 'Actor'}
+                for name in (a.strip() for a in actress_list)
+                if name
             ]
 
         # Handle genre -> GenreItems
-        genre = metadata.get('genre', [])
-        if isinstance(genre, str):
-            # Split comma-separated string
-            genre = [g.strip() for g in genre.split(',') if g.strip()]
-        if genre:
-            emby_item['GenreItems'] = [{'Name': g} for g in genre]
+        genre_items = _csv_to_named(metadata.get('genre', []))
+        if genre_items:
+            emby_item['GenreItems'] = genre_items
 
         # Handle label -> Studios
-        label = metadata.get('label', '')
-        if label:
-            # Split comma-separated if needed
-            labels = [l.strip() for l in label.split(',') if l.strip()]
-            emby_item['Studios'] = [{'Name': l} for l in labels]
+        studios = _csv_to_named(metadata.get('label', ''))
+        if studios:
+            emby_item['Studios'] = studios
 
         # Lock data to prevent Emby from overwriting
         emby_item['LockData'] = True
 
         # POST the updated item back
         url = f'{self.base_url}/Items/{item_id}'
-        headers = {
-            'X-Emby-Token': self.api_key,
-            'Content-Type': 'application/json',
-        }
 
         try:
             start = time.monotonic()
-            resp = requests.post(url, json=emby_item, headers=headers, timeout=30)
-            API_REQUEST_DURATION.labels(service='emby', operation='update_metadata').observe(time.monotonic() - start)
-            logger.info('Emby update response: status=%s, body=%s', resp.status_code, resp.text[:200])
+            resp = self._session.post(url, data=orjson.dumps(emby_item), headers=JSON_HEADERS, timeout=30)
+            _UPDATE_DURATION.observe(time.monotonic() - start)
+            # resp.text decodes the whole body; skip it when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('Emby update response: status=%s, body=%s', resp.status_code, resp.text[:200])
             resp.raise_for_status()
-            API_REQUESTS_TOTAL.labels(service='emby', status='success').inc()
+            _REQUESTS_OK.inc()
         except requests.RequestException as e:
-            API_REQUESTS_TOTAL.labels(service='emby', status='error').inc()
+            _REQUESTS_ERROR.inc()
             logger.error('Failed to update Emby item %s: %s', item_id, e)
             if hasattr(e, 'response') and e.response is not None:
                 logger.error('Response status: %s, body: %s', e.response.status_code, e.response.text[:500])
             return False
 
-        # Verify the update was persisted by reading back from Emby
-        time.sleep(1)  # Brief pause for Emby to persist
+        if self.verify_updates:
+            return self._verify_update(item_id, emby_item)
+        # Off the critical path: mismatches are logged and counted only
+        self._verify_executor.submit(self._verify_update, item_id, emby_item)
+        return True
+
+    def update_many(self, updates: list[tuple[str, dict]], max_workers: int = UPDATE_MANY_WORKERS,
+                    on_updated: Callable[[str, dict], None] | None = None) -> list[bool]:
+        """Run update_item_metadata for several items concurrently.
+
+        Args:
+            updates: (item_id, metadata) pairs
+            max_workers: Maximum number of updates in flight
+            on_updated: Called with (item_id, metadata) on a worker thread as
+                soon as that item's update succeeds, e.g. to queue its images
+
+        Returns:
+            Success flag per update, in input order. An update that raised
+            is logged and counts as failed.
+        """
+        if not updates:
+            return []
+
+        def update(pair):
+            item_id, metadata = pair
+            try:
+                if not self.update_item_metadata(item_id, metadata):
+                    return False
+                if on_updated:
+                    on_updated(item_id, metadata)
+                return True
+            except Exception:
+                logger.exception('Failed to update Emby item %s', item_id)
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(updates)),
+                                thread_name_prefix='emby-update') as executor:
+            return list(executor.map(update, updates))
+
+    def _verify_update(self, item_id: str, emby_item: dict) -> bool:
+        """Read an updated item back from Emby and check the written fields stuck.
+
+        The POST handler saves the item before responding, so no pause is
+        needed. Failures are logged and counted in
+        emby_update_verification_mismatches_total.
+
+        Returns:
+            True if the read-back matches, False otherwise.
+        """
         verified = self.get_item_details(item_id)
         if not verified:
             logger.error('Verification failed: could not read back item %s', item_id)
+            UPDATE_VERIFICATION_MISMATCHES_TOTAL.inc()
             return False
 
         mismatches = []
@@ -418,6 +667,7 @@ class EmbyClient:
 
         if mismatches:
             logger.error('Emby update verification FAILED for item %s: %s', item_id, '; '.join(mismatches))
+            UPDATE_VERIFICATION_MISMATCHES_TOTAL.inc()
             return False
 
         logger.info('Emby update verified for item %s', item_id)
@@ -425,11 +675,23 @@ class EmbyClient:
 
     # ---- Image management methods ----
 
-    def download_image(self, image_url: str) -> tuple[bytes, str] | None:
+    @staticmethod
+    def _is_wordpress_url(image_url: str) -> bool:
+        """Whether an image URL is on a WordPress host (needs the Bearer token).
+
+        Matches the host exactly, so other domains merely containing the name
+        never receive the token.
+        """
+        host = (urlparse(image_url).hostname or '').lower()
+        return any(host == h or host.endswith('.' + h) for h in WORDPRESS_HOSTS)
+
+    def download_image(self, image_url: str, wordpress_token: str | None = None) -> tuple[bytes, str] | None:
         """Download an image from a URL.
 
         Args:
             image_url: Full URL of the image to download.
+            wordpress_token: Token to send for WordPress URLs, when the caller
+                already has it; otherwise it is fetched once per call.
 
         Returns:
             Tuple of (image_bytes, content_type) on success, None on failure.
@@ -438,18 +700,18 @@ class EmbyClient:
             logger.warning('Empty image URL, skipping download')
             return None
 
-        try:
-            # Build headers - add WordPress auth if URL is from WordPress
-            headers = {
-                'User-Agent': 'Mozilla/5.0',
-                'Accept': 'image/*,*/*;q=0.8',
-            }
+        is_wordpress = self._is_wordpress_url(image_url)
+        token = None
+        if is_wordpress:
+            token = wordpress_token if wordpress_token is not None else self.wordpress_token
 
+        try:
             # Add WordPress Bearer token if downloading from WordPress domain
-            if self.wordpress_token and 'familyhub.id' in image_url:
-                headers['Authorization'] = f'Bearer {self.wordpress_token}'
+            headers = IMAGE_REQUEST_HEADERS
+            if token:
+                headers = {**IMAGE_REQUEST_HEADERS, 'Authorization': f'Bearer {token}'}
 
-            resp = requests.get(
+            resp = self._session.get(
                 image_url,
                 headers=headers,
                 timeout=30,
@@ -457,11 +719,12 @@ class EmbyClient:
             )
 
             # Handle 401 with token refresh + single retry (WordPress URLs only)
-            if resp.status_code == 401 and self._token_manager and 'familyhub.id' in image_url:
+            if resp.status_code == 401 and self._token_manager and is_wordpress:
                 logger.warning('Got 401 downloading image, attempting token refresh')
                 self._token_manager.handle_401()
-                headers['Authorization'] = f'Bearer {self.wordpress_token}'
-                resp = requests.get(
+                token = self.wordpress_token
+                headers = {**IMAGE_REQUEST_HEADERS, 'Authorization': f'Bearer {token}'}
+                resp = self._session.get(
                     image_url,
                     headers=headers,
                     timeout=30,
@@ -488,11 +751,13 @@ class EmbyClient:
             return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _make_w800_url(image_url: str) -> str:
         """Transform an image URL to request a W800 variant.
 
         Adds or replaces the `w` query parameter with `800` and removes `horizontal`.
-        Mirrors the legacy Util.convertBase64FromUrlW800 logic.
+        Mirrors the legacy Util.convertBase64FromUrlW800 logic. Pure, so results
+        are cached for retries and re-uploads of the same image.
 
         Args:
             image_url: Original image URL.
@@ -509,19 +774,20 @@ class EmbyClient:
         new_query = urlencode(flat_params, doseq=True)
         return urlunparse(parsed._replace(query=new_query))
 
-    def download_image_w800(self, image_url: str) -> tuple[bytes, str] | None:
+    def download_image_w800(self, image_url: str, wordpress_token: str | None = None) -> tuple[bytes, str] | None:
         """Download a W800-resized variant of an image.
 
         Used for Backdrop and Banner image types.
 
         Args:
             image_url: Original image URL (will be modified to add w=800).
+            wordpress_token: As for download_image.
 
         Returns:
             Tuple of (image_bytes, content_type) on success, None on failure.
         """
         w800_url = self._make_w800_url(image_url)
-        return self.download_image(w800_url)
+        return self.download_image(w800_url, wordpress_token)
 
     def delete_image(self, item_id: str, image_type: str, index: int = 0) -> bool:
         """Delete an image from an Emby item.
@@ -535,10 +801,9 @@ class EmbyClient:
             True if deletion succeeded or image didn't exist, False on error.
         """
         url = f'{self.base_url}/Items/{item_id}/Images/{image_type}/{index}'
-        headers = {'X-Emby-Token': self.api_key}
 
         try:
-            resp = requests.delete(url, headers=headers, timeout=10)
+            resp = self._session.delete(url, timeout=10)
             # 204 No Content = success, 404 = already gone (both are fine)
             if resp.status_code in (200, 204, 404):
                 logger.info('Deleted image %s/%d from item %s (status=%s)',
@@ -568,25 +833,25 @@ class EmbyClient:
             True if upload succeeded, False otherwise.
         """
         url = f'{self.base_url}/Items/{item_id}/Images/{image_type}'
-        params = {'api_key': self.api_key}
-        encoded = base64.b64encode(image_data).decode('ascii')
+        # Sent as bytes: a str body would be copied again when encoded for the socket
+        encoded = base64.b64encode(image_data)
 
         try:
             start = time.monotonic()
-            resp = requests.post(
+            resp = self._session.post(
                 url,
-                params=params,
+                params=self._api_key_params,
                 data=encoded,
                 headers={'Content-Type': content_type},
                 timeout=60,
             )
-            API_REQUEST_DURATION.labels(service='emby', operation='upload_image').observe(time.monotonic() - start)
+            _UPLOAD_DURATION.observe(time.monotonic() - start)
             resp.raise_for_status()
-            API_REQUESTS_TOTAL.labels(service='emby', status='success').inc()
+            _REQUESTS_OK.inc()
             logger.info('Uploaded %s image to item %s', image_type, item_id)
             return True
         except requests.RequestException as e:
-            API_REQUESTS_TOTAL.labels(service='emby', status='error').inc()
+            _REQUESTS_ERROR.inc()
             logger.error('Failed to upload %s image to item %s: %s', image_type, item_id, e)
             return False
 
@@ -598,6 +863,10 @@ class EmbyClient:
         2. Download original image -> upload as Primary
         3. Download W800 variant -> upload as Backdrop and Banner
 
+        Independent requests run concurrently: the two downloads (from the
+        image host) overlap the deletes, and the three uploads start together
+        once the deletes are done.
+
         Errors are logged but do not block the pipeline.
 
         Args:
@@ -611,34 +880,43 @@ class EmbyClient:
             logger.warning('No image URL provided for item %s, skipping image upload', item_id)
             return False
 
-        # Step 1: Delete existing images (best-effort)
-        for i in range(5):
-            self.delete_image(item_id, 'Backdrop', i)
-        self.delete_image(item_id, 'Banner')
-        self.delete_image(item_id, 'Primary')
-        self.delete_image(item_id, 'Logo')
-
-        any_success = False
-
-        # Step 2: Download and upload W800 variant for Backdrop and Banner
-        w800_result = self.download_image_w800(image_url)
-        if w800_result:
-            w800_data, w800_ct = w800_result
-            if self.upload_image(item_id, 'Backdrop', w800_data, w800_ct):
-                any_success = True
-            if self.upload_image(item_id, 'Banner', w800_data, w800_ct):
-                any_success = True
-        else:
-            logger.warning('Could not download W800 image for item %s', item_id)
-
-        # Step 3: Download and upload original for Primary
-        original_result = self.download_image(image_url)
-        if original_result:
-            orig_data, orig_ct = original_result
-            if self.upload_image(item_id, 'Primary', orig_data, orig_ct):
-                any_success = True
-        else:
-            logger.warning('Could not download original image for item %s', item_id)
+        with ThreadPoolExecutor(max_workers=len(STALE_IMAGES)) as executor:
+            # Both downloads share one token lookup
+            token = self.wordpress_token if self._is_wordpress_url(image_url) else None
+            w800_future = executor.submit(self.download_image_w800, image_url, token)
+            if self._make_w800_url(image_url) == image_url:
+                # Already the W800 URL: the same image serves as Primary
+                original_future = w800_future
+            else:
+                original_future = executor.submit(self.download_image, image_url, token)
+
+            # Step 1: Delete existing images (best-effort)
+            deletes = [
+                executor.submit(self.delete_image, item_id, image_type, index)
+                for image_type, index in STALE_IMAGES
+            ]
+            wait(deletes)
+
+            uploads = []
+
+            # Step 2: Upload W800 variant for Backdrop and Banner
+            w800_result = w800_future.result()
+            if w800_result:
+                w800_data, w800_ct = w800_result
+                uploads.append(executor.submit(self.upload_image, item_id, 'Backdrop', w800_data, w800_ct))
+                uploads.append(executor.submit(self.upload_image, item_id, 'Banner', w800_data, w800_ct))
+            else:
+                logger.warning('Could not download W800 image for item %s', item_id)
+
+            # Step 3: Upload original for Primary
+            original_result = original_future.result()
+            if original_result:
+                orig_data, orig_ct = original_result
+                uploads.append(executor.submit(self.upload_image, item_id, 'Primary', orig_data, orig_ct))
+            else:
+                logger.warning('Could not download original image for item %s', item_id)
+
+            any_success = any([future.result() for future in uploads])
 
         if any_success:
             logger.info('Image upload completed for item %s', item_id)
@@ -655,12 +933,8 @@ class EmbyClient:
         """
         task_id = 'd15b3f9fc313609ffe7e49bd1c74f753'
         url = f'{self.base_url}/emby/ScheduledTasks/Running/{task_id}'
-        headers = {
-            'X-Emby-Token': self.api_key,
-            'Content-Type': 'application/json',
-        }
         try:
-            resp = requests.post(url, headers=headers, timeout=15)
+            resp = self._session.post(url, headers=JSON_HEADERS, timeout=15)
             if resp.status_code < 300:
                 logger.info('Video preview generation task triggered')
                 return True
@@ -1,48 +1,61 @@
 """Extract movie code and subtitle language from a filename."""
 
+import functools
 import re
-from pathlib import Path
 
 
 # Movie code pattern: 2-6 uppercase letters, dash, 1-5 digits
 MOVIE_CODE_RE = re.compile(r'([A-Za-z]{2,6})-(\d{1,5})')
 
-# Subtitle keyword mapping (checked in order, first match wins)
-SUBTITLE_KEYWORDS = [
-    (re.compile(r'english\s*sub(?:bed|s|title[ds]?)?', re.IGNORECASE), 'English Sub'),
-    (re.compile(r'\benglish\b', re.IGNORECASE), 'English Sub'),
-    (re.compile(r'\beng\b', re.IGNORECASE), 'English Sub'),
-    (re.compile(r'chinese\s*sub(?:bed|s|title[ds]?)?', re.IGNORECASE), 'Chinese Sub'),
-    (re.compile(r'\bchinese\b', re.IGNORECASE), 'Chinese Sub'),
-    (re.compile(r'\bchi\b', re.IGNORECASE), 'Chinese Sub'),
-    (re.compile(r'korean\s*sub(?:bed|s|title[ds]?)?', re.IGNORECASE), 'Korean Sub'),
-    (re.compile(r'\bkorean\b', re.IGNORECASE), 'Korean Sub'),
-    (re.compile(r'\bkor\b', re.IGNORECASE), 'Korean Sub'),
-    (re.compile(r'japanese\s*sub(?:bed|s|title[ds]?)?', re.IGNORECASE), 'Japanese Sub'),
-    (re.compile(r'\bjapanese\b', re.IGNORECASE), 'Japanese Sub'),
-    (re.compile(r'\bjpn\b', re.IGNORECASE), 'Japanese Sub'),
-]
-
-
+# Subtitle keywords, one group per label in precedence order (the first
+# label with any match wins, wherever it appears in the filename). The
+# lookahead skips positions that can't start a keyword without trying
+# every alternative there.
+SUBTITLE_LABELS = ('English Sub', 'Chinese Sub', 'Korean Sub', 'Japanese Sub')
+SUBTITLE_RE = re.compile(
+    r'(?=[ecjk])(?:(english\s*sub(?:bed|s|title[ds]?)?|\benglish\b|\beng\b)'
+    r'|(chinese\s*sub(?:bed|s|title[ds]?)?|\bchinese\b|\bchi\b)'
+    r'|(korean\s*sub(?:bed|s|title[ds]?)?|\bkorean\b|\bkor\b)'
+    r'|(japanese\s*sub(?:bed|s|title[ds]?)?|\bjapanese\b|\bjpn\b))',
+    re.IGNORECASE,
+)
+
+
+def _stem(filename: str) -> str:
+    """Final path component without its extension, like Path.stem but cheaper."""
+    base = filename[filename.rfind('/') + 1:]
+    dot = base.rfind('.')
+    # A leading dot starts a hidden name, not an extension
+    return base if dot <= 0 else base[:dot]
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_movie_code(filename: str) -> str | None:
     """Extract a movie code like 'SONE-760' from a filename.
 
-    Returns the code in uppercase or None if not found.
+    Returns the code in uppercase or None if not found. Results are cached
+    per filename (the function is pure), as the same file can be looked at
+    again on retries and dashboard actions.
     """
-    stem = Path(filename).stem
+    stem = _stem(filename)
     match = MOVIE_CODE_RE.search(stem)
     if match:
         return f'{match.group(1).upper()}-{match.group(2)}'
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def detect_subtitle(filename: str) -> str:
     """Detect subtitle language from filename keywords.
 
     Returns 'English Sub', 'Chinese Sub', 'Korean Sub', 'Japanese Sub', or 'No Sub'.
+    Cached per filename, like extract_movie_code.
     """
-    stem = Path(filename).stem
-    for pattern, label in SUBTITLE_KEYWORDS:
-        if pattern.search(stem):
-            return label
-    return 'No Sub'
+    # One pass over the stem; the lowest group number found is the label
+    best = None
+    for match in SUBTITLE_RE.finditer(_stem(filename)):
+        if best is None or match.lastindex < best:
+            best = match.lastindex
+            if best == 1:
+                break
+    return SUBTITLE_LABELS[best - 1] if best else 'No Sub'
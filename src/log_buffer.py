@@ -2,7 +2,7 @@
 
 import logging
 from collections import deque
-from datetime import datetime
+from itertools import islice
 from typing import List
 
 
@@ -16,7 +16,8 @@ class LogBuffer(logging.Handler):
             maxlen: Maximum number of log messages to store (default 500)
         """
         super().__init__()
-        self.buffer = deque(maxlen=maxlen)
+        # Formatted lines only; that is all the dashboard reads
+        self.buffer: deque[str] = deque(maxlen=maxlen)
         self.formatter = logging.Formatter(
             '%(asctime)s [%(levelname)s] %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
@@ -25,14 +26,7 @@ class LogBuffer(logging.Handler):
     def emit(self, record: logging.LogRecord):
         """Add a log record to the buffer."""
         try:
-            msg = self.format(record)
-            self.buffer.append({
-                'timestamp': datetime.fromtimestamp(record.created).isoformat(),
-                'level': record.levelname,
-                'logger': record.name,
-                'message': record.getMessage(),
-                'formatted': msg,
-            })
+            self.buffer.append(self.format(record))
         except Exception:
             self.handleError(record)
 
@@ -45,9 +39,10 @@ class LogBuffer(logging.Handler):
         Returns:
             List of formatted log message strings
         """
-        # Get last N entries from the buffer
-        recent = list(self.buffer)[-lines:]
-        return [entry['formatted'] for entry in recent]
+        # Walk back from the newest entry so only the requested lines are copied
+        recent = list(islice(reversed(self.buffer), lines))
+        recent.reverse()
+        return recent
 
     def clear(self):
         """Clear all buffered logs."""
@@ -1,24 +1,63 @@
 """WP REST API client for searching movie metadata."""
 
 import logging
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
 
 from .metrics import API_REQUESTS_TOTAL, API_REQUEST_DURATION
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_DURATION = API_REQUEST_DURATION.labels(service='wordpress', operation='search')
+_REQUESTS_OK = API_REQUESTS_TOTAL.labels(service='wordpress', status='success')
+_REQUESTS_ERROR = API_REQUESTS_TOTAL.labels(service='wordpress', status='error')
+_REQUESTS_401 = API_REQUESTS_TOTAL.labels(service='wordpress', status='401')
+
 # Unified search endpoint (backend handles provider selection)
 # Note: base_url already includes /emby/v1, so just add /search
 UNIFIED_SEARCH_ENDPOINT = '/search'
 
+# Search result cache (stale-while-revalidate), used when enabled per client:
+# entries older than the soft TTL are served while a background refresh runs,
+# entries older than the hard TTL are refetched before returning
+SEARCH_CACHE_SOFT_TTL = 600  # seconds
+SEARCH_CACHE_HARD_TTL = 3600  # seconds
+SEARCH_CACHE_MAX_SIZE = 10_000
+
+# Keep-alive connections kept per host by the HTTP session; sized above the
+# bulk refresh fan-out so concurrent calls never discard pooled connections
+HTTP_POOL_MAXSIZE = 32
+# Default search_many fan-out; kept within the connection pool
+SEARCH_MANY_CONCURRENCY = 16
+# Threads revalidating soft-expired cache entries; stale codes beyond this
+# wait their turn (and keep being served from the cache meanwhile)
+SEARCH_REFRESH_WORKERS = 4
+
+
+def create_http_session() -> requests.Session:
+    """Create a keep-alive session with a pool of HTTP_POOL_MAXSIZE per host.
+
+    One session can be passed to both MetadataClient and EmbyClient so
+    searches and WordPress image downloads share their connections.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 class MetadataClient:
     """Client for the emby-service WP REST API."""
 
     def __init__(self, base_url: str, token: str = '', search_order: list[str] | None = None,
-                 token_manager=None):
+                 token_manager=None, cache_soft_ttl: float = 0, cache_hard_ttl: float = 0,
+                 session: requests.Session | None = None):
         """Initialize metadata client.
 
         Args:
@@ -26,14 +65,44 @@ class MetadataClient:
             token: Authorization token (static fallback)
             search_order: DEPRECATED - no longer used, backend handles provider selection
             token_manager: Optional TokenManager instance for auto-refreshing tokens
+            cache_soft_ttl: Age in seconds after which a cached result is
+                refreshed in the background (still served meanwhile)
+            cache_hard_ttl: Age in seconds after which a cached result is
+                no longer served; 0 disables the search cache
+            session: Shared HTTP session (see create_http_session); the
+                caller closes it. If None, the client creates and owns one.
         """
         self.base_url = base_url.rstrip('/')
         self._static_token = token
         self._token_manager = token_manager
+        # Keep-alive session so repeated searches reuse the TLS connection
+        self._owns_session = session is None
+        self._session = session if session is not None else create_http_session()
+        # (token, request headers) for the last token seen; replaced, never mutated
+        self._auth_headers: tuple[str | None, dict] = (None, {})
+        # movie_code -> (fetched_at, metadata), least recently used first
+        self._cache_soft_ttl = cache_soft_ttl
+        self._cache_hard_ttl = cache_hard_ttl
+        self._cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Per-code locks so concurrent misses for one code fetch it once
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        self._refreshing: set[str] = set()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=SEARCH_REFRESH_WORKERS,
+                                                    thread_name_prefix='metadata-refresh')
         # search_order kept for backwards compatibility but not used
         if search_order:
             logger.info('search_order parameter is deprecated - unified search handles provider selection')
 
+    def close(self):
+        """Close the underlying HTTP session, unless it was passed in.
+
+        Queued background refreshes are dropped.
+        """
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        if self._owns_session:
+            self._session.close()
+
     @property
     def token(self) -> str:
         """Get the current token (from token_manager if available, else static)."""
@@ -41,10 +110,23 @@ class MetadataClient:
             return self._token_manager.get_token()
         return self._static_token
 
+    def _headers(self) -> dict:
+        """Search request headers for the current token, rebuilt only when it changes."""
+        token = self.token
+        cached_token, headers = self._auth_headers
+        if token != cached_token:
+            headers = {'Content-Type': 'application/json'}
+            if token:
+                headers['Authorization'] = f'Bearer {token}'
+            self._auth_headers = (token, headers)
+        return headers
+
     def search(self, movie_code: str, fresh: bool = False) -> dict | None:
         """Search for movie metadata using unified endpoint.
 
         The backend handles provider fallback logic (missav → javguru).
+        When the client's search cache is enabled, found results are kept
+        in memory and served stale-while-revalidate.
 
         Args:
             movie_code: The movie code to search for
@@ -53,10 +135,112 @@ class MetadataClient:
         Returns:
             Metadata dict on success, None on failure.
         """
+        if not self._cache_hard_ttl:
+            return self._search(movie_code, fresh)
+        if fresh:
+            return self._fetch_and_cache(movie_code, fresh=True)
+
+        age, metadata = self._cache_lookup(movie_code)
+        if metadata is None or age >= self._cache_hard_ttl:
+            return self._fetch_locked(movie_code)
+        if age >= self._cache_soft_ttl:
+            self._refresh_in_background(movie_code)
+        return metadata
+
+    def search_many(self, movie_codes: list[str], fresh: bool = False,
+                    concurrency: int = SEARCH_MANY_CONCURRENCY) -> dict[str, dict]:
+        """Search several movie codes concurrently.
+
+        Each distinct code is searched once via search() (so the cache
+        applies), on up to ``concurrency`` threads sharing the session's
+        connection pool.
+
+        Args:
+            movie_codes: Movie codes to search for
+            fresh: If True, bypass cache and fetch fresh data from API
+            concurrency: Maximum number of searches in flight
+
+        Returns:
+            Dict mapping each code found to its metadata; codes with no
+            result, or whose search failed, are left out.
+        """
+        codes = list(dict.fromkeys(movie_codes))
+        if not codes:
+            return {}
+
+        def search_one(movie_code):
+            try:
+                return self.search(movie_code, fresh=fresh)
+            except Exception:
+                logger.exception('Metadata search failed for %s', movie_code)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(codes)),
+                                thread_name_prefix='metadata-search') as pool:
+            return {code: metadata for code, metadata in zip(codes, pool.map(search_one, codes))
+                    if metadata}
+
+    def _cache_lookup(self, movie_code: str) -> tuple[float, dict | None]:
+        """Return (age, metadata) for a cached code, or (0, None) on a miss."""
+        with self._cache_lock:
+            entry = self._cache.get(movie_code)
+            if entry is None:
+                return 0, None
+            self._cache.move_to_end(movie_code)
+        fetched_at, metadata = entry
+        return time.monotonic() - fetched_at, metadata
+
+    def _fetch_and_cache(self, movie_code: str, fresh: bool = False) -> dict | None:
+        """Search the API and store a found result in the cache."""
+        metadata = self._search(movie_code, fresh)
+        if metadata is not None:
+            with self._cache_lock:
+                self._cache[movie_code] = (time.monotonic(), metadata)
+                self._cache.move_to_end(movie_code)
+                if len(self._cache) > SEARCH_CACHE_MAX_SIZE:
+                    self._cache.popitem(last=False)
+        return metadata
+
+    def _fetch_locked(self, movie_code: str) -> dict | None:
+        """Fetch a missing or expired code, once for all concurrent callers."""
+        with self._cache_lock:
+            lock = self._fetch_locks.setdefault(movie_code, threading.Lock())
+        try:
+            with lock:
+                # Another caller may have fetched it while we waited
+                age, metadata = self._cache_lookup(movie_code)
+                if metadata is not None and age < self._cache_soft_ttl:
+                    return metadata
+                return self._fetch_and_cache(movie_code)
+        finally:
+            with self._cache_lock:
+                self._fetch_locks.pop(movie_code, None)
+
+    def _refresh_in_background(self, movie_code: str):
+        """Queue a refresh of a stale cached code unless one is pending."""
+        with self._cache_lock:
+            if movie_code in self._refreshing:
+                return
+            self._refreshing.add(movie_code)
+
+        def refresh():
+            try:
+                self._fetch_locked(movie_code)
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(movie_code)
+
+        try:
+            self._refresh_executor.submit(refresh)
+        except RuntimeError:
+            # Client closed; keep serving the stale entry
+            with self._cache_lock:
+                self._refreshing.discard(movie_code)
+
+    def _search(self, movie_code: str, fresh: bool = False) -> dict | None:
+        """POST one search to the unified endpoint."""
         url = f'{self.base_url}{UNIFIED_SEARCH_ENDPOINT}'
-        headers = {'Content-Type': 'application/json'}
-        if self.token:
-            headers['Authorization'] = f'Bearer {self.token}'
+        headers = self._headers()
 
         payload = {'moviecode': movie_code}
         if fresh:
@@ -66,35 +250,35 @@ class MetadataClient:
             fresh_text = ' (FORCE FRESH)' if fresh else ''
             logger.info('Searching metadata for %s via unified endpoint%s', movie_code, fresh_text)
 
+            # One observation per search, covering a 401 refresh and retry
             start = time.monotonic()
-            resp = requests.post(
+            resp = self._session.post(
                 url,
                 json=payload,
                 headers=headers,
                 timeout=30,
             )
-            API_REQUEST_DURATION.labels(service='wordpress', operation='search').observe(time.monotonic() - start)
 
             # Handle 401 with token refresh + single retry
             if resp.status_code == 401 and self._token_manager:
-                API_REQUESTS_TOTAL.labels(service='wordpress', status='401').inc()
+                _REQUESTS_401.inc()
                 logger.warning('Got 401 for %s, attempting token refresh', movie_code)
                 self._token_manager.handle_401()
                 # Rebuild headers with new token
-                headers['Authorization'] = f'Bearer {self.token}'
-                start = time.monotonic()
-                resp = requests.post(
+                headers = self._headers()
+                resp = self._session.post(
                     url,
                     json=payload,
                     headers=headers,
                     timeout=30,
                 )
-                API_REQUEST_DURATION.labels(service='wordpress', operation='search').observe(time.monotonic() - start)
+            _SEARCH_DURATION.observe(time.monotonic() - start)
 
             resp.raise_for_status()
-            body = resp.json()
+            # Parse the bytes directly; search bodies carry full movie metadata
+            body = orjson.loads(resp.content)
 
-            API_REQUESTS_TOTAL.labels(service='wordpress', status='success').inc()
+            _REQUESTS_OK.inc()
 
             if body.get('success') and body.get('data'):
                 source = body.get('source', 'unknown')
@@ -105,7 +289,7 @@ class MetadataClient:
             logger.info('No metadata found for %s (unified search)', movie_code)
             return None
 
-        except requests.RequestException as e:
-            API_REQUESTS_TOTAL.labels(service='wordpress', status='error').inc()
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            _REQUESTS_ERROR.inc()
             logger.warning('Unified search failed for %s: %s', movie_code, e)
             return None
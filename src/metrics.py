@@ -32,6 +32,11 @@ FILES_DETECTED_TOTAL = Counter(
     'Total new video files detected by the watcher',
 )
 
+UPDATE_VERIFICATION_MISMATCHES_TOTAL = Counter(
+    'emby_update_verification_mismatches_total',
+    'Emby metadata updates whose read-back did not match (or could not be read)',
+)
+
 # ---- Histograms ----
 
 API_REQUEST_DURATION = Histogram(
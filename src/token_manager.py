@@ -17,6 +17,9 @@ from .metrics import TOKEN_REFRESH_TOTAL
 
 logger = logging.getLogger(__name__)
 
+_REFRESH_OK = TOKEN_REFRESH_TOTAL.labels(result='success')
+_REFRESH_ERROR = TOKEN_REFRESH_TOTAL.labels(result='error')
+
 # Refresh when within this many hours of expiry (tokens last 24h)
 PROACTIVE_REFRESH_HOURS = 4
 
@@ -165,7 +168,7 @@ class TokenManager:
             # Persist to DB
             self._save_to_db(new_token, expires_at)
 
-            TOKEN_REFRESH_TOTAL.labels(result='success').inc()
+            _REFRESH_OK.inc()
             logger.info(
                 'Token refreshed successfully (expires in %.1f hours)',
                 expires_in / 3600,
@@ -173,11 +176,11 @@ class TokenManager:
             return True
 
         except requests.RequestException as e:
-            TOKEN_REFRESH_TOTAL.labels(result='error').inc()
+            _REFRESH_ERROR.inc()
             logger.error('Token refresh failed: %s', e)
             return False
         except Exception as e:
-            TOKEN_REFRESH_TOTAL.labels(result='error').inc()
+            _REFRESH_ERROR.inc()
             logger.error('Unexpected error during token refresh: %s', e)
             return False
 
@@ -6,7 +6,6 @@ Each worker runs in its own thread and can be shut down gracefully.
 Status flow: pending -> processing -> moved -> emby_pending -> completed
 """
 
-import json
 import logging
 import signal
 import threading
@@ -14,6 +13,8 @@ import time
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from .emby_client import EmbyClient
 from .extractor import extract_movie_code, detect_subtitle
 from .metadata import MetadataClient
@@ -23,6 +24,17 @@ from .renamer import build_filename, move_file
 
 logger = logging.getLogger(__name__)
 
+_EXTRACT_ERROR = PIPELINE_ITEMS_TOTAL.labels(stage='extract', result='error')
+_EXTRACT_OK = PIPELINE_ITEMS_TOTAL.labels(stage='extract', result='success')
+_METADATA_ERROR = PIPELINE_ITEMS_TOTAL.labels(stage='metadata', result='error')
+_METADATA_OK = PIPELINE_ITEMS_TOTAL.labels(stage='metadata', result='success')
+_RENAME_ERROR = PIPELINE_ITEMS_TOTAL.labels(stage='rename', result='error')
+_RENAME_OK = PIPELINE_ITEMS_TOTAL.labels(stage='rename', result='success')
+_EMBY_UPDATE_ERROR = PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='error')
+_EMBY_UPDATE_OK = PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='success')
+_FILE_PROCESSOR_ACTIVE = WORKER_LAST_ACTIVE.labels(worker='FileProcessor')
+_EMBY_UPDATER_ACTIVE = WORKER_LAST_ACTIVE.labels(worker='EmbyUpdater')
+
 
 class BaseWorker:
     """Base class for queue workers with common start/stop logic."""
@@ -114,13 +126,13 @@ class FileProcessorWorker(BaseWorker):
                     error_message=f'No movie code found in filename: {filename}',
                     file_path=new_location,
                 )
-                PIPELINE_ITEMS_TOTAL.labels(stage='extract', result='error').inc()
+                _EXTRACT_ERROR.inc()
                 return True
 
             # Step 2: Detect subtitle
             subtitle = detect_subtitle(filename)
             logger.info('[FileProcessor] Extracted: code=%s subtitle=%s', movie_code, subtitle)
-            PIPELINE_ITEMS_TOTAL.labels(stage='extract', result='success').inc()
+            _EXTRACT_OK.inc()
 
             # Step 3: Fetch metadata
             metadata = self.metadata_client.search(movie_code)
@@ -136,7 +148,7 @@ class FileProcessorWorker(BaseWorker):
                     error_message=f'No metadata found for movie code: {movie_code}',
                     file_path=new_location,
                 )
-                PIPELINE_ITEMS_TOTAL.labels(stage='metadata', result='error').inc()
+                _METADATA_ERROR.inc()
                 return True
 
             # Step 4: Extract fields from metadata
@@ -154,7 +166,7 @@ class FileProcessorWorker(BaseWorker):
 
             title = title.title()
 
-            PIPELINE_ITEMS_TOTAL.labels(stage='metadata', result='success').inc()
+            _METADATA_OK.inc()
 
             # Step 5: Build new filename and move
             extension = Path(file_path).suffix
@@ -162,7 +174,7 @@ class FileProcessorWorker(BaseWorker):
 
             new_path = move_file(file_path, self.destination_dir, actress, new_filename)
             logger.info('[FileProcessor] Moved: %s -> %s', filename, new_path)
-            PIPELINE_ITEMS_TOTAL.labels(stage='rename', result='success').inc()
+            _RENAME_OK.inc()
 
             # Step 6: Update queue item
             self.queue_db.update_status(
@@ -187,7 +199,7 @@ class FileProcessorWorker(BaseWorker):
             finally:
                 self.queue_db._put_conn(conn)
 
-            WORKER_LAST_ACTIVE.labels(worker='FileProcessor').set_to_current_time()
+            _FILE_PROCESSOR_ACTIVE.set_to_current_time()
             return True
 
         except Exception as e:
@@ -196,7 +208,7 @@ class FileProcessorWorker(BaseWorker):
                 item_id, 'error',
                 error_message=str(e),
             )
-            PIPELINE_ITEMS_TOTAL.labels(stage='rename', result='error').inc()
+            _RENAME_ERROR.inc()
             return True
 
     def _move_to_unprocessed(self, file_path: str) -> str | None:
@@ -263,7 +275,7 @@ class EmbyUpdaterWorker(BaseWorker):
                     item_id, 'error',
                     error_message='Emby library scan failed',
                 )
-                PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='error').inc()
+                _EMBY_UPDATE_ERROR.inc()
                 return True
 
             # Step 2: Translate path to Emby's view and poll for the item
@@ -277,7 +289,7 @@ class EmbyUpdaterWorker(BaseWorker):
                     item_id, 'error',
                     error_message=f'Emby item not found for path: {new_path}',
                 )
-                PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='error').inc()
+                _EMBY_UPDATE_ERROR.inc()
                 return True
 
             emby_item_id = emby_item.get('Id')
@@ -285,7 +297,7 @@ class EmbyUpdaterWorker(BaseWorker):
             # Step 3: Update Emby metadata
             metadata = item.get('metadata_json')
             if isinstance(metadata, str):
-                metadata = json.loads(metadata)
+                metadata = orjson.loads(metadata)
 
             if metadata:
                 update_success = self.emby_client.update_item_metadata(emby_item_id, metadata)
@@ -296,7 +308,7 @@ class EmbyUpdaterWorker(BaseWorker):
                         error_message=f'Failed to update Emby metadata for item {emby_item_id}',
                         emby_item_id=emby_item_id,
                     )
-                    PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='error').inc()
+                    _EMBY_UPDATE_ERROR.inc()
                     return True
 
                 # Step 4: Upload images (best-effort, don't block pipeline)
@@ -315,8 +327,8 @@ class EmbyUpdaterWorker(BaseWorker):
                 emby_item_id=emby_item_id,
             )
             logger.info('[EmbyUpdater] Completed item %s (Emby ID: %s)', item_id, emby_item_id)
-            PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='success').inc()
-            WORKER_LAST_ACTIVE.labels(worker='EmbyUpdater').set_to_current_time()
+            _EMBY_UPDATE_OK.inc()
+            _EMBY_UPDATER_ACTIVE.set_to_current_time()
             return True
 
         except Exception as e:
@@ -325,7 +337,7 @@ class EmbyUpdaterWorker(BaseWorker):
                 item_id, 'error',
                 error_message=str(e),
             )
-            PIPELINE_ITEMS_TOTAL.labels(stage='emby_update', result='error').inc()
+            _EMBY_UPDATE_ERROR.inc()
             return True
 
 
@@ -0,0 +1,294 @@
+"""Tests for the API module."""
+
+import asyncio
+import threading
+from contextlib import nullcontext
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from starlette.middleware.cors import CORSMiddleware
+
+from src import api
+
+
+def make_db(row):
+    """A mock QueueDB whose cursor returns ``row`` and records statements."""
+    cur = MagicMock()
+    cur.fetchone.return_value = row
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cur
+    db = Mock()
+    db.connection = lambda: nullcontext(conn)
+    return db, conn, cur
+
+
+def updates(cur):
+    """(sql, params) of the UPDATE statements run on ``cur``."""
+    return [c.args for c in cur.execute.call_args_list if 'UPDATE processing_queue' in c.args[0]]
+
+
+METADATA = {'title': 'SONE-760 Title', 'actress': ['Some Actress'], 'image_cropped': 'https://img/x.jpg'}
+
+
+class TestActionRunAll:
+    """Tests for POST /api/queue/{id}/actions/run-all."""
+
+    @pytest.fixture(autouse=True)
+    def moved(self):
+        with patch.object(api, '_locate_source_file', side_effect=lambda path: path), \
+                patch.object(api, '_rename_and_move',
+                             return_value=('Some Actress', 'new.mp4', '/dest/Some Actress/new.mp4')) as mock_move:
+            yield mock_move
+
+    def run(self, db, metadata_client, emby_client):
+        return api.action_run_all.__wrapped__(
+            1, fresh=False, db=db, metadata_client=metadata_client, emby_client=emby_client)
+
+    def test_success_marks_completed(self, moved):
+        db, conn, cur = make_db(('/watch/SONE-760 English subbed.mp4', 'emby-1'))
+        emby = Mock(**{'update_item_metadata.return_value': True})
+
+        result = self.run(db, Mock(**{'search.return_value': METADATA}), emby)
+
+        assert result['status'] == 'completed'
+        assert result['movie_code'] == 'SONE-760'
+        moved.assert_called_once_with('/watch/SONE-760 English subbed.mp4', 'SONE-760', 'English Sub', METADATA)
+        emby.update_item_metadata.assert_called_once_with('emby-1', METADATA)
+        emby.upload_item_images.assert_called_once_with('emby-1', 'https://img/x.jpg')
+        (move_sql, move_params), (done_sql, _) = updates(cur)
+        assert "status = 'moved'" in move_sql
+        assert '/dest/Some Actress/new.mp4' in move_params
+        assert "status = 'completed'" in done_sql
+        assert conn.commit.call_count == 2
+
+    def test_missing_code(self, moved):
+        db, conn, cur = make_db(('/watch/no code here.mp4', 'emby-1'))
+        metadata_client = Mock()
+
+        with pytest.raises(HTTPException) as exc:
+            self.run(db, metadata_client, Mock())
+
+        assert exc.value.status_code == 400
+        metadata_client.search.assert_not_called()
+        moved.assert_not_called()
+        assert updates(cur) == []
+
+    def test_missing_metadata(self, moved):
+        db, conn, cur = make_db(('/watch/SONE-760.mp4', 'emby-1'))
+
+        with pytest.raises(HTTPException) as exc:
+            self.run(db, Mock(**{'search.return_value': None}), Mock())
+
+        assert exc.value.status_code == 404
+        moved.assert_not_called()
+        assert updates(cur) == []
+
+    @pytest.mark.parametrize('emby_update', [
+        {'return_value': False},
+        {'side_effect': ValueError('bad response')},
+    ])
+    def test_emby_failure_leaves_item_moved(self, moved, emby_update):
+        db, conn, cur = make_db(('/watch/SONE-760.mp4', 'emby-1'))
+        emby = Mock()
+        emby.update_item_metadata.configure_mock(**emby_update)
+
+        result = self.run(db, Mock(**{'search.return_value': METADATA}), emby)
+
+        assert result['status'] == 'moved'
+        emby.upload_item_images.assert_not_called()
+        [(move_sql, move_params)] = updates(cur)
+        assert "status = 'moved'" in move_sql
+        assert '/dest/Some Actress/new.mp4' in move_params
+        conn.commit.assert_called_once()
+        conn.rollback.assert_not_called()
+
+    def test_without_emby_id_stays_moved(self, moved):
+        db, conn, cur = make_db(('/watch/SONE-760.mp4', None))
+        emby = Mock()
+
+        result = self.run(db, Mock(**{'search.return_value': METADATA}), emby)
+
+        assert result['status'] == 'moved'
+        emby.update_item_metadata.assert_not_called()
+        assert len(updates(cur)) == 1
+
+
+def call_asgi(middleware_cls, method='GET', headers=()):
+    """Run a request through ``middleware_cls`` wrapping a plain 200 app.
+
+    Returns (inner app called, response status, response headers as a list).
+    """
+    called = []
+
+    async def inner(scope, receive, send):
+        called.append(True)
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': b'{}'})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    scope = {'type': 'http', 'method': method, 'path': '/api/stats',
+             'headers': [(k.lower().encode(), v.encode()) for k, v in headers]}
+    asyncio.run(middleware_cls(inner)(scope, receive, send))
+    start = sent[0]
+    return bool(called), start['status'], start['headers']
+
+
+class TestCORSHeadersMiddleware:
+    """Tests for the precomputed-header CORS middleware."""
+
+    def test_no_origin_passes_through(self):
+        called, status, headers = call_asgi(api.CORSHeadersMiddleware)
+        assert called
+        assert status == 200
+        assert headers == [(b'content-type', b'application/json')]
+
+    def test_simple_cross_origin_request(self):
+        called, status, headers = call_asgi(
+            api.CORSHeadersMiddleware, headers=[('Origin', 'http://nas.local:8080')])
+        assert called
+        assert (b'access-control-allow-origin', b'*') in headers
+        assert (b'access-control-allow-credentials', b'true') in headers
+        assert (b'content-type', b'application/json') in headers
+        assert not any(key == b'vary' for key, _ in headers)
+
+    def test_credentialed_request_echoes_origin(self):
+        called, status, headers = call_asgi(
+            api.CORSHeadersMiddleware,
+            headers=[('Origin', 'http://nas.local:8080'), ('Cookie', 'session=1')])
+        assert called
+        assert (b'access-control-allow-origin', b'http://nas.local:8080') in headers
+        assert (b'access-control-allow-credentials', b'true') in headers
+        assert (b'vary', b'Origin') in headers
+        assert (b'access-control-allow-origin', b'*') not in headers
+
+    def test_preflight_answered_directly(self):
+        called, status, headers = call_asgi(
+            api.CORSHeadersMiddleware, method='OPTIONS',
+            headers=[('Origin', 'http://nas.local:8080'),
+                     ('Access-Control-Request-Method', 'DELETE'),
+                     ('Access-Control-Request-Headers', 'x-custom, content-type')])
+        assert not called
+        assert status == 200
+        headers = dict(headers)
+        assert headers[b'access-control-allow-origin'] == b'http://nas.local:8080'
+        assert headers[b'access-control-allow-methods'] == b'DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT'
+        assert headers[b'access-control-allow-headers'] == b'x-custom, content-type'
+        assert headers[b'access-control-allow-credentials'] == b'true'
+        assert headers[b'vary'] == b'Origin'
+
+    def test_plain_options_reaches_app(self):
+        # OPTIONS without Access-Control-Request-Method is not a preflight
+        called, status, headers = call_asgi(
+            api.CORSHeadersMiddleware, method='OPTIONS', headers=[('Origin', 'http://nas.local:8080')])
+        assert called
+        assert (b'access-control-allow-origin', b'*') in headers
+
+    @pytest.mark.parametrize('method, headers', [
+        ('GET', []),
+        ('GET', [('Origin', 'http://nas.local:8080')]),
+        ('GET', [('Origin', 'http://nas.local:8080'), ('Cookie', 'session=1')]),
+        ('OPTIONS', [('Origin', 'http://nas.local:8080'), ('Access-Control-Request-Method', 'POST'),
+                     ('Access-Control-Request-Headers', 'content-type')]),
+    ])
+    def test_matches_starlette_cors(self, method, headers):
+        def starlette_cors(app):
+            return CORSMiddleware(app, allow_origins=['*'], allow_credentials=True,
+                                  allow_methods=['*'], allow_headers=['*'])
+
+        expected = call_asgi(starlette_cors, method, headers)
+        called, status, response_headers = call_asgi(api.CORSHeadersMiddleware, method, headers)
+        assert (called, status, sorted(response_headers)) == (expected[0], expected[1], sorted(expected[2]))
+
+
+@pytest.fixture
+def poll_cache():
+    """Empty poll cache with a controllable clock: poll_cache[0] is now."""
+    now = [1000.0]
+    with patch.dict(api._POLL_CACHE, clear=True), \
+            patch.dict(api._POLL_CACHE_LOCKS, clear=True), \
+            patch.dict(api._POLL_CACHE_GENERATIONS, clear=True), \
+            patch.object(api, '_time', Mock(monotonic=lambda: now[0])):
+        yield now
+
+
+class TestPollCache:
+    """Tests for _poll_cached() and _poll_cache_invalidate()."""
+
+    def test_hit_within_ttl(self, poll_cache):
+        build = Mock(return_value={'jobs': []})
+        first = api._poll_cached(('downloads', 10), build)
+        poll_cache[0] += api.POLL_CACHE_TTL - 0.01
+        assert api._poll_cached(('downloads', 10), build) is first
+        build.assert_called_once()
+
+        poll_cache[0] += 0.01
+        assert api._poll_cached(('downloads', 10), build) is not first
+        assert build.call_count == 2
+
+    def test_keys_cached_separately(self, poll_cache):
+        build = Mock(return_value={'jobs': []})
+        api._poll_cached(('downloads', 10), build)
+        api._poll_cached(('downloads', 20), build)
+        assert build.call_count == 2
+
+    def test_concurrent_misses_build_once(self, poll_cache):
+        release = threading.Event()
+        building = threading.Event()
+
+        def build():
+            building.set()
+            release.wait(2)
+            return {'lines': []}
+
+        build_mock = Mock(side_effect=build)
+        responses = []
+        threads = [threading.Thread(target=lambda: responses.append(api._poll_cached(('logs', 100), build_mock)))
+                   for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        building.wait(2)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        build_mock.assert_called_once()
+        assert len(responses) == 5
+        assert all(response is responses[0] for response in responses)
+
+    def test_invalidate_drops_entries_of_kind(self, poll_cache):
+        build = Mock(return_value={})
+        api._poll_cached(('downloads', 10), build)
+        api._poll_cached(('logs', 100), build)
+        api._poll_cache_invalidate('downloads')
+
+        api._poll_cached(('downloads', 10), build)
+        api._poll_cached(('logs', 100), build)
+        assert build.call_count == 3
+
+    def test_build_racing_invalidation_not_stored(self, poll_cache):
+        def build():
+            # A write lands while the stale page is being read
+            api._poll_cache_invalidate('downloads')
+            return {'jobs': ['stale']}
+
+        stale = api._poll_cached(('downloads', 10), build)
+        assert stale.body == b'{"jobs":["stale"]}'
+        assert ('downloads', 10) not in api._POLL_CACHE
+
+        fresh = api._poll_cached(('downloads', 10), Mock(return_value={'jobs': ['new']}))
+        assert fresh.body == b'{"jobs":["new"]}'
+        assert api._POLL_CACHE[('downloads', 10)][1] is fresh
+
+    def test_one_lock_per_kind(self, poll_cache):
+        for offset in range(50):
+            api._poll_cached(('downloads', 10, offset), Mock(return_value={}))
+        assert list(api._POLL_CACHE_LOCKS) == ['downloads']
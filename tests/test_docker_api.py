@@ -0,0 +1,124 @@
+"""Tests for the Docker Engine API client module."""
+
+import socket
+import struct
+import subprocess
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from src.docker_api import DockerAPIError, DockerClient, DockerExec
+
+
+def frame(stream: int, payload: bytes) -> bytes:
+    """Build one multiplexed stream frame."""
+    return struct.pack('>BxxxL', stream, len(payload)) + payload
+
+
+@pytest.fixture
+def sockets():
+    """A connected socket pair: (exec side, daemon side)."""
+    ours, theirs = socket.socketpair()
+    yield ours, theirs
+    ours.close()
+    theirs.close()
+
+
+class TestDockerExecRead:
+    """Tests for demultiplexing exec output."""
+
+    def test_merges_stdout_and_stderr(self, sockets):
+        ours, theirs = sockets
+        theirs.sendall(frame(1, b'out\n') + frame(2, b'err\n'))
+        theirs.close()
+
+        proc = DockerExec(Mock(), 'abc', ours, b'')
+        assert proc.read() == b'out\nerr\n'
+        assert proc.read() == b''
+
+    def test_frame_split_across_reads(self, sockets):
+        ours, theirs = sockets
+        data = frame(1, b'hello world\n')
+        # Part of the first frame arrived with the HTTP response head
+        proc = DockerExec(Mock(), 'abc', ours, data[:5])
+        theirs.sendall(data[5:9])
+        theirs.sendall(data[9:])
+        theirs.close()
+
+        assert proc.read() == b'hello world\n'
+        assert proc.read() == b''
+
+    def test_kill_ends_stream(self, sockets):
+        ours, _ = sockets
+        proc = DockerExec(Mock(), 'abc', ours, b'')
+        proc.kill()
+
+        assert proc.read() == b''
+        assert proc.wait() == -9
+
+    def test_kill_drops_buffered_output(self, sockets):
+        ours, theirs = sockets
+        proc = DockerExec(Mock(), 'abc', ours, frame(1, b'late\n'))
+        theirs.sendall(frame(1, b'later\n'))
+        proc.kill()
+
+        assert proc.read() == b''
+
+    def test_kill_wakes_blocked_read(self, sockets):
+        ours, _ = sockets
+        proc = DockerExec(Mock(), 'abc', ours, b'')
+        timer = threading.Timer(0.05, proc.kill)
+        timer.start()
+
+        assert proc.read() == b''
+        timer.join()
+
+
+class TestDockerExecWait:
+    """Tests for waiting on exec exit codes."""
+
+    def test_returns_exit_code(self, sockets):
+        ours, _ = sockets
+        client = Mock()
+        client.inspect_exec.side_effect = [
+            {'Running': True, 'ExitCode': None},
+            {'Running': False, 'ExitCode': 3},
+        ]
+        proc = DockerExec(client, 'abc', ours, b'')
+
+        with patch('src.docker_api.time.sleep'):
+            assert proc.wait(timeout=10) == 3
+        assert proc.returncode == 3
+        client.inspect_exec.assert_called_with('abc')
+
+    def test_timeout(self, sockets):
+        ours, _ = sockets
+        client = Mock()
+        client.inspect_exec.return_value = {'Running': True, 'ExitCode': None}
+        proc = DockerExec(client, 'abc', ours, b'')
+
+        with patch('src.docker_api.time.sleep'), pytest.raises(subprocess.TimeoutExpired):
+            proc.wait(timeout=0)
+
+
+class TestDockerClient:
+    """Tests for DockerClient control requests."""
+
+    def test_error_status_raises(self):
+        client = DockerClient('/nonexistent.sock')
+        resp = Mock(status=404)
+        resp.read.return_value = b'{"message": "No such container: ytdlp"}'
+        with patch.object(client, '_conn') as conn:
+            conn.getresponse.return_value = resp
+            with pytest.raises(DockerAPIError, match='No such container'):
+                client.exec_start('ytdlp', ['true'])
+
+    def test_retries_once_on_stale_connection(self):
+        client = DockerClient('/nonexistent.sock')
+        resp = Mock(status=200)
+        resp.read.return_value = b'{"Running": false, "ExitCode": 0}'
+        with patch.object(client, '_conn') as conn:
+            conn.request.side_effect = [BrokenPipeError(), None]
+            conn.getresponse.return_value = resp
+            assert client.inspect_exec('abc') == {'Running': False, 'ExitCode': 0}
+        assert conn.close.call_count == 1
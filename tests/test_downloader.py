@@ -0,0 +1,170 @@
+"""Tests for the download manager and its output parsing."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from src.downloader import DownloadManager, _iter_output_batches
+
+
+def make_manager():
+    return DownloadManager(Mock(**{'recover_stale_downloads.return_value': 0}))
+
+
+@pytest.fixture
+def manager():
+    """A DownloadManager over a mock QueueDB and Docker client, without its tail writer thread."""
+    with patch('src.downloader.DockerClient'), patch('src.downloader.threading.Thread'):
+        yield make_manager()
+
+
+def queued_tails(manager):
+    """Drain the (job_id, tail) snapshots queued for the tail writer."""
+    tails = []
+    while not manager._tail_queue.empty():
+        tails.append(manager._tail_queue.get_nowait())
+    return tails
+
+
+def start_download(manager, *reads):
+    """Run job 1 to completion over an exec session returning ``reads``.
+
+    Each read is bytes, or a callable run at that point (returning the bytes).
+    """
+    remaining = list(reads)
+
+    def read():
+        if not remaining:
+            return b''
+        chunk = remaining.pop(0)
+        return chunk() if callable(chunk) else chunk
+
+    manager._docker.exec_start.return_value = Mock(read=read, returncode=0, **{'wait.return_value': 0})
+    manager._register(1)
+    manager._run_download(1, 'https://example.com/v', None)
+
+
+def reader(*chunks):
+    """A read() that returns each chunk in turn, then b''."""
+    remaining = list(chunks)
+    return lambda: remaining.pop(0) if remaining else b''
+
+
+class TestIterOutputBatches:
+    """Tests for _iter_output_batches()."""
+
+    def test_splits_all_line_endings(self):
+        batches = list(_iter_output_batches(reader(b'a\nb\r\nc\rd\n')))
+        assert batches == [['a', 'b', 'c', 'd']]
+
+    def test_partial_line_carried_over(self):
+        batches = list(_iter_output_batches(reader(b'li', b'ne1\nli', b'ne2')))
+        assert batches == [['line1'], ['line2']]
+
+    def test_crlf_split_across_reads(self):
+        batches = list(_iter_output_batches(reader(b'line1\r', b'\nline2\n')))
+        assert batches == [['line1'], ['line2']]
+
+    def test_crlf_split_with_bare_newline_chunk(self):
+        batches = list(_iter_output_batches(reader(b'line1\r', b'\n', b'line2\n')))
+        assert batches == [['line1'], ['line2']]
+
+    def test_only_newline_and_carriage_return_break_lines(self):
+        # str.splitlines() would also break on these
+        batches = list(_iter_output_batches(reader(b'a\x0bb\x0cc\x1cd\xc2\x85e\n')))
+        assert batches == [['a\x0bb\x0cc\x1cd\x85e']]
+
+    def test_blank_lines_kept(self):
+        batches = list(_iter_output_batches(reader(b'a\r', b'\r\nb\n')))
+        assert batches == [['a'], ['', 'b']]
+
+
+class TestRunDownload:
+    """Tests for DownloadManager._run_download()."""
+
+    def test_failed_start_write_marks_job_failed(self, manager):
+        db = manager._queue_db
+        db.update_download_status.side_effect = [RuntimeError('pool exhausted'), None]
+        manager._register(1)
+
+        manager._run_download(1, 'https://example.com/v', None)
+
+        manager._docker.exec_start.assert_not_called()
+        assert db.update_download_status.call_args.kwargs['status'] == 'failed'
+        assert db.update_download_status.call_args.kwargs['error'] == 'pool exhausted'
+        assert 1 not in manager._active
+
+
+class TestOutputFlush:
+    """Tests for progress writes of a running download's output_tail."""
+
+    def test_flushes_early_after_min_lines(self, manager):
+        start_download(manager, b'a\n' * 4, b'b\n' * 6, b'c\n' * 3)
+
+        [(job_id, tail)] = queued_tails(manager)
+        assert job_id == 1
+        assert tail == ['a'] * 4 + ['b'] * 6
+
+    def test_fewer_lines_flushed_by_interval_sweep(self, manager):
+        sweeps = []
+
+        def stall():
+            # The writer's interval sweep runs while the output is stalled
+            manager._sweep_tails()
+            sweeps.append(queued_tails(manager))
+            manager._sweep_tails()  # nothing new since
+            sweeps.append(queued_tails(manager))
+            return b''
+
+        start_download(manager, b'a\nb\nc\n', stall)
+
+        assert sweeps == [[(1, ['a', 'b', 'c'])], []]
+
+    def test_writer_thread_sweeps_on_interval(self):
+        with patch('src.downloader.DockerClient'), patch('src.downloader.DB_FLUSH_INTERVAL', 0.05):
+            manager = make_manager()
+            job = manager._register(1)
+            job.lines.extend(['a', 'b'])
+            job.lines_total = 2
+
+            deadline = time.monotonic() + 2
+            while not manager._queue_db.update_download_tails.called:
+                assert time.monotonic() < deadline, 'timed out'
+                time.sleep(0.01)
+
+        manager._queue_db.update_download_tails.assert_called_once_with([(1, ['a', 'b'])])
+
+
+class TestWriteTails:
+    """Tests for the tail writer's coalescing of progress snapshots."""
+
+    def test_newer_snapshot_replaces_older(self, manager):
+        manager._tail_queue.put((2, ['b1']))
+        manager._tail_queue.put((1, ['a1', 'a2']))
+
+        manager._write_tails((1, ['a1']))
+
+        manager._queue_db.update_download_tails.assert_called_once_with([(1, ['a1', 'a2']), (2, ['b1'])])
+
+    def test_batch_capped_at_max_rows(self, manager):
+        for job_id in range(2, 6):
+            manager._tail_queue.put((job_id, ['line']))
+
+        with patch('src.downloader.TAIL_WRITE_MAX_ROWS', 3):
+            manager._write_tails((1, ['line']))
+
+        [items] = manager._queue_db.update_download_tails.call_args.args
+        assert [job_id for job_id, _ in items] == [1, 2, 3]
+        assert queued_tails(manager) == [(4, ['line']), (5, ['line'])]
+
+    def test_window_closes_without_more_updates(self, manager):
+        with patch('src.downloader.TAIL_WRITE_WINDOW', 0.01):
+            manager._write_tails((1, ['line']))
+        manager._queue_db.update_download_tails.assert_called_once_with([(1, ['line'])])
+
+    def test_write_error_is_logged(self, manager):
+        manager._queue_db.update_download_tails.side_effect = RuntimeError('db down')
+        with patch('src.downloader.TAIL_WRITE_WINDOW', 0.01), \
+                patch('src.downloader.logger') as mock_logger:
+            manager._write_tails((1, ['line']))
+        mock_logger.exception.assert_called_once()
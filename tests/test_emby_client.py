@@ -2,6 +2,7 @@
 
 from unittest.mock import Mock, call, patch
 
+import orjson
 import pytest
 import requests
 from src.emby_client import EmbyClient, DEFAULT_RETRY_DELAYS, IMAGE_TYPES
@@ -27,7 +28,36 @@ class TestEmbyClient:
         client = EmbyClient('https://emby.example.com/', 'test-key')
         assert client.base_url == 'https://emby.example.com'
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close):
+        with EmbyClient('https://emby.example.com', 'test-key'):
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+    def test_shared_session_left_open(self):
+        session = requests.Session()
+        with patch.object(session, 'close') as mock_close:
+            client = EmbyClient('https://emby.example.com', 'test-key', session=session)
+            client.close()
+        mock_close.assert_not_called()
+        assert client._session is session
+        # The token adapter is still scoped to the Emby server
+        assert session.get_adapter('https://emby.example.com/Items') is not session.get_adapter('https://other.test/')
+
+    def test_token_sent_to_emby_only(self):
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        emby = client._session.prepare_request(
+            requests.Request('GET', 'https://emby.example.com/Items'))
+        other = client._session.prepare_request(
+            requests.Request('GET', 'https://emby.example.com.evil.test/img.jpg'))
+
+        client._session.get_adapter(emby.url).add_headers(emby)
+        client._session.get_adapter(other.url).add_headers(other)
+
+        assert emby.headers['X-Emby-Token'] == 'test-key'
+        assert 'X-Emby-Token' not in other.headers
+
+    @patch('src.emby_client.requests.Session.post')
     def test_trigger_library_scan_success(self, mock_post):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -41,12 +71,11 @@ class TestEmbyClient:
         assert result is True
         mock_post.assert_called_once_with(
             'https://emby.example.com/Library/Refresh',
-            headers={'X-Emby-Token': 'test-key'},
             params={},
             timeout=10,
         )
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_trigger_library_scan_with_path(self, mock_post):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -60,12 +89,11 @@ class TestEmbyClient:
         assert result is True
         mock_post.assert_called_once_with(
             'https://emby.example.com/Library/Refresh',
-            headers={'X-Emby-Token': 'test-key'},
             params={'path': '/path/to/library'},
             timeout=10,
         )
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_trigger_library_scan_failure(self, mock_post):
         mock_post.side_effect = requests.RequestException('Connection failed')
 
@@ -74,7 +102,7 @@ class TestEmbyClient:
 
         assert result is False
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_get_libraries_success(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -92,11 +120,10 @@ class TestEmbyClient:
         assert result[1]['Name'] == 'TV Shows'
         mock_get.assert_called_once_with(
             'https://emby.example.com/Library/VirtualFolders',
-            headers={'X-Emby-Token': 'test-key'},
             timeout=10,
         )
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_get_libraries_failure(self, mock_get):
         mock_get.side_effect = requests.RequestException('Connection failed')
 
@@ -105,7 +132,7 @@ class TestEmbyClient:
 
         assert result is None
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_scan_library_by_id_success(self, mock_post):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -117,12 +144,12 @@ class TestEmbyClient:
         assert result is True
         mock_post.assert_called_once_with(
             'https://emby.example.com/emby/Items/4/Refresh',
-            headers={'X-Emby-Token': 'test-key', 'Content-Type': 'application/json'},
+            headers={'Content-Type': 'application/json'},
             params={'Recursive': 'true'},
             timeout=30,
         )
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_scan_library_by_id_failure(self, mock_post):
         mock_post.side_effect = requests.RequestException('Connection failed')
 
@@ -135,7 +162,7 @@ class TestEmbyClient:
 class TestGetItemByPathWithRetry:
     """Tests for the polling retry mechanism."""
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_found_immediately(self, mock_get):
         """Item found on first try, no retries needed."""
         mock_resp = Mock()
@@ -154,7 +181,7 @@ class TestGetItemByPathWithRetry:
         assert mock_get.call_count == 1
 
     @patch('src.emby_client.time.sleep')
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_found_after_retry(self, mock_get, mock_sleep):
         """Item found after one retry."""
         not_found = Mock()
@@ -176,10 +203,12 @@ class TestGetItemByPathWithRetry:
         assert result is not None
         assert result['Id'] == 'item-1'
         assert mock_get.call_count == 2
-        mock_sleep.assert_called_once_with(2)
+        mock_sleep.assert_called_once()
+        # 2s delay with +/-50% jitter
+        assert 1 <= mock_sleep.call_args.args[0] <= 3
 
     @patch('src.emby_client.time.sleep')
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_not_found_falls_back_to_filename(self, mock_get, mock_sleep):
         """All path retries fail, falls back to filename search and succeeds."""
         not_found = Mock()
@@ -206,7 +235,7 @@ class TestGetItemByPathWithRetry:
         assert mock_sleep.call_count == 2
 
     @patch('src.emby_client.time.sleep')
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_not_found_after_all_retries(self, mock_get, mock_sleep):
         """Item never found, returns None after all retries and fallback."""
         not_found = Mock()
@@ -221,10 +250,11 @@ class TestGetItemByPathWithRetry:
         # 1 initial + 2 retries + 1 filename fallback = 4
         assert mock_get.call_count == 4
 
+    @patch('src.emby_client.random.uniform', side_effect=lambda low, high: high)
     @patch('src.emby_client.time.sleep')
-    @patch('src.emby_client.requests.get')
-    def test_exponential_backoff_delays(self, mock_get, mock_sleep):
-        """Verify the sleep delays match the configured schedule."""
+    @patch('src.emby_client.requests.Session.get')
+    def test_exponential_backoff_delays(self, mock_get, mock_sleep, mock_uniform):
+        """Verify the sleep delays follow the configured schedule, jittered."""
         not_found = Mock()
         not_found.raise_for_status = Mock()
         not_found.json.return_value = {'Items': []}
@@ -234,13 +264,95 @@ class TestGetItemByPathWithRetry:
         client = EmbyClient('https://emby.example.com', 'test-key', retry_delays=delays)
         client.get_item_by_path_with_retry('/dest/Actress/video.mp4')
 
-        assert mock_sleep.call_args_list == [call(2), call(4), call(8)]
+        assert mock_uniform.call_args_list == [call(1, 3), call(2, 6), call(4, 12)]
+        assert mock_sleep.call_args_list == [call(3), call(6), call(12)]
+
+    @patch('src.emby_client.time.sleep')
+    @patch('src.emby_client.requests.Session.get')
+    def test_stops_retrying_when_emby_is_down(self, mock_get, mock_sleep):
+        """Consecutive request errors end the polling early."""
+        mock_get.side_effect = requests.ConnectionError('Connection refused')
+
+        client = EmbyClient('https://emby.example.com', 'test-key', retry_delays=[1] * 10)
+        result = client.get_item_by_path_with_retry('/dest/Actress/video.mp4')
+
+        assert result is None
+        # 1 initial + 1 retry; no filename fallback
+        assert mock_get.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('src.emby_client.time.sleep')
+    @patch('src.emby_client.requests.Session.get')
+    def test_stops_retrying_on_auth_error(self, mock_get, mock_sleep):
+        """A rejected API key is an error, not an indexing delay."""
+        unauthorized = Mock()
+        unauthorized.raise_for_status.side_effect = requests.HTTPError('401 Unauthorized')
+        mock_get.return_value = unauthorized
+
+        client = EmbyClient('https://emby.example.com', 'test-key', retry_delays=[1] * 6)
+        result = client.get_item_by_path_with_retry('/dest/Actress/video.mp4')
+
+        assert result is None
+        assert mock_get.call_count == 2
+
+    @patch('src.emby_client.time.sleep')
+    @patch('src.emby_client.requests.Session.get')
+    def test_isolated_error_keeps_polling(self, mock_get, mock_sleep):
+        """Only consecutive errors stop the polling."""
+        not_found = Mock()
+        not_found.raise_for_status = Mock()
+        not_found.json.return_value = {'Items': []}
+        found = Mock()
+        found.raise_for_status = Mock()
+        found.json.return_value = {'Items': [{'Id': 'item-1'}]}
+        error = requests.ConnectionError('reset')
+        mock_get.side_effect = [error, not_found, error, found]
+
+        client = EmbyClient('https://emby.example.com', 'test-key', retry_delays=[1] * 6)
+        result = client.get_item_by_path_with_retry('/dest/Actress/video.mp4')
+
+        assert result == {'Id': 'item-1'}
+        assert mock_get.call_count == 4
+
+
+class TestCircuitBreaker:
+    """Tests for the path lookup circuit breaker."""
+
+    @patch('src.emby_client.requests.Session.get')
+    def test_open_breaker_skips_requests(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError('Connection refused')
+        client = EmbyClient('https://emby.example.com', 'test-key')
+
+        for _ in range(5):
+            assert client.get_item_by_path('/dest/video.mp4') is None
+        assert mock_get.call_count == 5
+
+        assert client.get_item_by_path('/dest/video.mp4') is None
+        assert mock_get.call_count == 5
+
+    @patch('src.emby_client.time.monotonic')
+    @patch('src.emby_client.requests.Session.get')
+    def test_half_open_trial_closes_breaker(self, mock_get, mock_monotonic):
+        found = Mock()
+        found.raise_for_status = Mock()
+        found.json.return_value = {'Items': [{'Id': 'item-1'}]}
+        mock_get.side_effect = [requests.ConnectionError('down')] * 5 + [found, found]
+        mock_monotonic.return_value = 100.0
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        for _ in range(5):
+            client.get_item_by_path('/dest/video.mp4')
+        assert client._breaker.is_open
+
+        mock_monotonic.return_value = 131.0
+        assert client.get_item_by_path('/dest/video.mp4') == {'Id': 'item-1'}
+        assert not client._breaker.is_open
+        assert client.get_item_by_path('/dest/video.mp4') == {'Id': 'item-1'}
 
 
 class TestFindItemByFilename:
     """Tests for filename-based fallback search."""
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_found_by_exact_path_match(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -263,7 +375,7 @@ class TestFindItemByFilename:
         assert call_args[1]['params']['ParentId'] == '4'
         assert call_args[1]['params']['SearchTerm'] == 'video.mp4'
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_found_without_parent_folder(self, mock_get):
         """Search works without parent_folder_id (no ParentId param)."""
         mock_resp = Mock()
@@ -280,7 +392,7 @@ class TestFindItemByFilename:
         call_args = mock_get.call_args
         assert 'ParentId' not in call_args[1]['params']
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_not_found(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -292,7 +404,7 @@ class TestFindItemByFilename:
 
         assert result is None
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_network_error(self, mock_get):
         mock_get.side_effect = requests.RequestException('timeout')
 
@@ -301,9 +413,9 @@ class TestFindItemByFilename:
 
         assert result is None
 
-    @patch('src.emby_client.requests.get')
-    def test_no_exact_match_uses_first_result(self, mock_get):
-        """When no path ends with filename, returns first search result."""
+    @patch('src.emby_client.requests.Session.get')
+    def test_no_exact_match_returns_none(self, mock_get):
+        """When no path ends with filename, the fuzzy results are not used."""
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
         mock_resp.json.return_value = {
@@ -314,14 +426,79 @@ class TestFindItemByFilename:
         client = EmbyClient('https://emby.example.com', 'test-key')
         result = client.find_item_by_filename('video.mp4')
 
-        assert result is not None
-        assert result['Id'] == 'item-1'
+        assert result is None
+
+
+class TestUpdateItemMetadata:
+    """Tests for metadata update verification."""
+
+    ITEM = {'Id': 'item-1', 'Path': '/dest/Actress/ABC-123.mp4'}
+    METADATA = {'original_title': 'Title', 'overview': 'Overview'}
+
+    @patch('src.emby_client.requests.Session.post')
+    def test_verified_synchronously_when_enabled(self, mock_post):
+        mock_post.return_value = Mock(status_code=204, text='')
+        client = EmbyClient('https://emby.example.com', 'test-key', verify_updates=True)
+        # Read-back lost the edits
+        with patch.object(client, 'get_item_details', side_effect=[dict(self.ITEM), dict(self.ITEM)]):
+            assert client.update_item_metadata('item-1', self.METADATA) is False
+
+    @patch('src.emby_client.requests.Session.post')
+    def test_verified_in_background_by_default(self, mock_post):
+        mock_post.return_value = Mock(status_code=204, text='')
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        with patch.object(client, '_verify_executor') as executor, \
+                patch.object(client, 'get_item_details', return_value=dict(self.ITEM)):
+            assert client.update_item_metadata('item-1', self.METADATA) is True
+
+        executor.submit.assert_called_once()
+        assert executor.submit.call_args.args[:2] == (client._verify_update, 'item-1')
+
+    @patch('src.emby_client.requests.Session.post')
+    def test_each_update_starts_from_current_item(self, mock_post):
+        """POST /Items/{id} replaces the whole item, so edits made between
+        two updates must be read back, not overwritten."""
+        mock_post.return_value = Mock(status_code=204, text='')
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        edited = {**self.ITEM, 'Tags': ['edited elsewhere']}
+        with patch.object(client, '_verify_executor'), \
+                patch.object(client, 'get_item_details', side_effect=[dict(self.ITEM), edited]) as mock_details:
+            assert client.update_item_metadata('item-1', self.METADATA) is True
+            assert client.update_item_metadata('item-1', self.METADATA) is True
+
+        assert mock_details.call_count == 2
+        assert orjson.loads(mock_post.call_args.kwargs['data'])['Tags'] == ['edited elsewhere']
+
+
+class TestUpdateMany:
+    """Tests for concurrent metadata updates."""
+
+    def test_results_in_input_order(self):
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        updated = []
+        outcomes = {'a': True, 'b': False, 'c': RuntimeError('boom')}
+
+        def update(item_id, metadata):
+            if isinstance(outcomes[item_id], Exception):
+                raise outcomes[item_id]
+            return outcomes[item_id]
+
+        with patch.object(client, 'update_item_metadata', side_effect=update):
+            results = client.update_many([('a', {}), ('b', {}), ('c', {})],
+                                         on_updated=lambda item_id, _: updated.append(item_id))
+
+        assert results == [True, False, False]
+        assert updated == ['a']
+
+    def test_empty(self):
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        assert client.update_many([]) == []
 
 
 class TestDownloadImage:
     """Tests for image download methods."""
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_download_image_success(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -343,7 +520,43 @@ class TestDownloadImage:
             allow_redirects=True,
         )
 
-    @patch('src.emby_client.requests.get')
+    @pytest.mark.parametrize('url, authorized', [
+        ('https://familyhub.id/wp-content/poster.jpg', True),
+        ('https://media.FamilyHub.id/poster.jpg', True),
+        ('https://familyhub.id.attacker.test/poster.jpg', False),
+        ('https://evil-familyhub.id/poster.jpg', False),
+    ])
+    @patch('src.emby_client.requests.Session.get')
+    def test_download_image_wordpress_token_host_match(self, mock_get, url, authorized):
+        mock_resp = Mock()
+        mock_resp.status_code = 200
+        mock_resp.content = b'jpeg'
+        mock_resp.headers = {'Content-Type': 'image/jpeg'}
+        mock_get.return_value = mock_resp
+
+        client = EmbyClient('https://emby.example.com', 'test-key', wordpress_token='wp-token')
+        client.download_image(url)
+
+        headers = mock_get.call_args.kwargs['headers']
+        assert ('Authorization' in headers) is authorized
+
+    @patch('src.emby_client.requests.Session.get')
+    def test_download_image_refreshes_token_once_on_401(self, mock_get):
+        unauthorized = Mock(status_code=401, content=b'', headers={'Content-Type': 'text/html'})
+        image = Mock(status_code=200, content=b'jpeg', headers={'Content-Type': 'image/jpeg'})
+        mock_get.side_effect = [unauthorized, image]
+        token_manager = Mock()
+        token_manager.get_token.side_effect = ['old-token', 'new-token']
+
+        client = EmbyClient('https://emby.example.com', 'test-key', token_manager=token_manager)
+        result = client.download_image('https://familyhub.id/poster.jpg')
+
+        assert result == (b'jpeg', 'image/jpeg')
+        token_manager.handle_401.assert_called_once()
+        assert token_manager.get_token.call_count == 2
+        assert mock_get.call_args.kwargs['headers']['Authorization'] == 'Bearer new-token'
+
+    @patch('src.emby_client.requests.Session.get')
     def test_download_image_not_an_image(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -355,7 +568,7 @@ class TestDownloadImage:
 
         assert result is None
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_download_image_network_error(self, mock_get):
         mock_get.side_effect = requests.RequestException('Timeout')
 
@@ -384,7 +597,7 @@ class TestDownloadImage:
         assert 'w=800' in result
         assert 'horizontal' not in result
 
-    @patch('src.emby_client.requests.get')
+    @patch('src.emby_client.requests.Session.get')
     def test_download_image_w800_transforms_url(self, mock_get):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -407,7 +620,7 @@ class TestDownloadImage:
 class TestDeleteImage:
     """Tests for image deletion."""
 
-    @patch('src.emby_client.requests.delete')
+    @patch('src.emby_client.requests.Session.delete')
     def test_delete_image_success(self, mock_delete):
         mock_resp = Mock()
         mock_resp.status_code = 204
@@ -419,11 +632,10 @@ class TestDeleteImage:
         assert result is True
         mock_delete.assert_called_once_with(
             'https://emby.example.com/Items/item-123/Images/Primary/0',
-            headers={'X-Emby-Token': 'test-key'},
             timeout=10,
         )
 
-    @patch('src.emby_client.requests.delete')
+    @patch('src.emby_client.requests.Session.delete')
     def test_delete_image_with_index(self, mock_delete):
         mock_resp = Mock()
         mock_resp.status_code = 204
@@ -435,11 +647,10 @@ class TestDeleteImage:
         assert result is True
         mock_delete.assert_called_once_with(
             'https://emby.example.com/Items/item-123/Images/Backdrop/3',
-            headers={'X-Emby-Token': 'test-key'},
             timeout=10,
         )
 
-    @patch('src.emby_client.requests.delete')
+    @patch('src.emby_client.requests.Session.delete')
     def test_delete_image_404_is_ok(self, mock_delete):
         mock_resp = Mock()
         mock_resp.status_code = 404
@@ -450,7 +661,7 @@ class TestDeleteImage:
 
         assert result is True
 
-    @patch('src.emby_client.requests.delete')
+    @patch('src.emby_client.requests.Session.delete')
     def test_delete_image_network_error(self, mock_delete):
         mock_delete.side_effect = requests.RequestException('Connection refused')
 
@@ -463,7 +674,7 @@ class TestDeleteImage:
 class TestUploadImage:
     """Tests for image upload."""
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_upload_image_success(self, mock_post):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -482,10 +693,10 @@ class TestUploadImage:
         assert call_kwargs[1]['headers'] == {'Content-Type': 'image/jpeg'}
         # Verify data is base64 encoded
         import base64
-        expected_b64 = base64.b64encode(image_data).decode('ascii')
+        expected_b64 = base64.b64encode(image_data)
         assert call_kwargs[1]['data'] == expected_b64
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_upload_image_failure(self, mock_post):
         mock_post.side_effect = requests.RequestException('Upload failed')
 
@@ -494,7 +705,7 @@ class TestUploadImage:
 
         assert result is False
 
-    @patch('src.emby_client.requests.post')
+    @patch('src.emby_client.requests.Session.post')
     def test_upload_image_default_content_type(self, mock_post):
         mock_resp = Mock()
         mock_resp.raise_for_status = Mock()
@@ -531,13 +742,17 @@ class TestUploadItemImages:
 
         # Verify deletions: 5 Backdrop indices + Banner + Primary + Logo = 8 calls
         assert mock_delete.call_count == 8
+        assert sorted(mock_delete.call_args_list) == sorted(
+            [call('item-123', 'Backdrop', i) for i in range(5)]
+            + [call('item-123', t, 0) for t in ('Banner', 'Primary', 'Logo')]
+        )
 
         # Verify uploads: Backdrop + Banner (w800) + Primary (original) = 3 calls
         assert mock_upload.call_count == 3
         upload_calls = mock_upload.call_args_list
-        assert upload_calls[0] == call('item-123', 'Backdrop', b'w800-data', 'image/jpeg')
-        assert upload_calls[1] == call('item-123', 'Banner', b'w800-data', 'image/jpeg')
-        assert upload_calls[2] == call('item-123', 'Primary', b'orig-data', 'image/jpeg')
+        assert call('item-123', 'Backdrop', b'w800-data', 'image/jpeg') in upload_calls
+        assert call('item-123', 'Banner', b'w800-data', 'image/jpeg') in upload_calls
+        assert call('item-123', 'Primary', b'orig-data', 'image/jpeg') in upload_calls
 
     @patch.object(EmbyClient, 'upload_image', return_value=True)
     @patch.object(EmbyClient, 'download_image')
@@ -564,6 +779,32 @@ class TestUploadItemImages:
 
         assert result is False
 
+    @patch.object(EmbyClient, 'upload_image', return_value=True)
+    @patch.object(EmbyClient, 'download_image')
+    @patch.object(EmbyClient, 'download_image_w800', return_value=(b'w800-data', 'image/jpeg'))
+    @patch.object(EmbyClient, 'delete_image', return_value=True)
+    def test_upload_item_images_w800_url_downloaded_once(self, mock_delete, mock_dl_w800, mock_dl_orig, mock_upload):
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        result = client.upload_item_images('item-123', 'https://images.example.com/poster.jpg?w=800')
+
+        assert result is True
+        mock_dl_orig.assert_not_called()
+        assert call('item-123', 'Primary', b'w800-data', 'image/jpeg') in mock_upload.call_args_list
+
+    @patch.object(EmbyClient, 'upload_image', return_value=True)
+    @patch.object(EmbyClient, 'download_image', return_value=(b'orig-data', 'image/jpeg'))
+    @patch.object(EmbyClient, 'download_image_w800', return_value=(b'w800-data', 'image/jpeg'))
+    @patch.object(EmbyClient, 'delete_image')
+    def test_upload_item_images_uploads_after_deletes(self, mock_delete, mock_dl_w800, mock_dl_orig, mock_upload):
+        events = []
+        mock_delete.side_effect = lambda *args: events.append('delete') or True
+        mock_upload.side_effect = lambda *args: events.append('upload') or True
+
+        client = EmbyClient('https://emby.example.com', 'test-key')
+        assert client.upload_item_images('item-123', 'https://images.example.com/poster.jpg') is True
+
+        assert events == ['delete'] * 8 + ['upload'] * 3
+
     @patch.object(EmbyClient, 'upload_image', return_value=True)
     @patch.object(EmbyClient, 'download_image', return_value=None)
     @patch.object(EmbyClient, 'download_image_w800', return_value=None)
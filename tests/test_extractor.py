@@ -41,6 +41,12 @@ class TestExtractMovieCode:
     def test_path_with_directories(self):
         assert extract_movie_code('/watch/SONE-760 title.mp4') == 'SONE-760'
 
+    def test_hidden_file(self):
+        assert extract_movie_code('/watch/.SONE-760') == 'SONE-760'
+
+    def test_directories_and_extension_not_searched(self):
+        assert extract_movie_code('/watch/ABC-123/title.ab-12') is None
+
 
 class TestDetectSubtitle:
     """Tests for detect_subtitle()."""
@@ -63,9 +69,20 @@ class TestDetectSubtitle:
     def test_no_subtitle(self):
         assert detect_subtitle('SONE-760 Some random title.mp4') == 'No Sub'
 
+    def test_directories_not_searched(self):
+        assert detect_subtitle('/media/english/SONE-760 title.mp4') == 'No Sub'
+
     def test_case_insensitive(self):
         assert detect_subtitle('SONE-760 ENGLISH SUBBED title.mp4') == 'English Sub'
 
     def test_english_subbed_over_chinese(self):
         """English subbed should be matched first when both keywords present."""
         assert detect_subtitle('SONE-760 English subbed Chinese subbed.mp4') == 'English Sub'
+
+    def test_precedence_not_position(self):
+        """A later English keyword still beats an earlier Chinese one."""
+        assert detect_subtitle('SONE-760 chi dub eng.mp4') == 'English Sub'
+
+    def test_korean_and_japanese(self):
+        assert detect_subtitle('SONE-760 kor title.mp4') == 'Korean Sub'
+        assert detect_subtitle('SONE-760 Japanese subtitles.mp4') == 'Japanese Sub'
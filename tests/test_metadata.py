@@ -0,0 +1,206 @@
+"""Tests for the metadata client's search cache."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from src.metadata import MetadataClient, SEARCH_REFRESH_WORKERS
+
+
+@pytest.fixture
+def clock():
+    """A controllable time.monotonic for src.metadata: clock[0] is now."""
+    now = [1000.0]
+    fake_time = Mock(monotonic=lambda: now[0])
+    with patch('src.metadata.time', fake_time):
+        yield now
+
+
+def make_client(**kwargs):
+    kwargs.setdefault('cache_soft_ttl', 600)
+    kwargs.setdefault('cache_hard_ttl', 3600)
+    return MetadataClient('https://wp.example.com', **kwargs)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+class TestSearchCache:
+    """Tests for MetadataClient.search() caching."""
+
+    def test_disabled_without_hard_ttl(self):
+        client = make_client(cache_hard_ttl=0)
+        with patch.object(client, '_search', return_value={'title': 'A'}) as mock_search:
+            client.search('ABC-123')
+            client.search('ABC-123')
+        assert mock_search.call_count == 2
+
+    def test_fresh_entry_served_from_cache(self, clock):
+        client = make_client()
+        with patch.object(client, '_search', return_value={'title': 'A'}) as mock_search:
+            assert client.search('ABC-123') == {'title': 'A'}
+            clock[0] += 599
+            assert client.search('ABC-123') == {'title': 'A'}
+        mock_search.assert_called_once()
+
+    def test_not_found_is_not_cached(self, clock):
+        client = make_client()
+        with patch.object(client, '_search', return_value=None) as mock_search:
+            client.search('ABC-123')
+            client.search('ABC-123')
+        assert mock_search.call_count == 2
+
+    def test_soft_expired_served_stale_and_refreshed(self, clock):
+        client = make_client()
+        with patch.object(client, '_search', side_effect=[{'title': 'old'}, {'title': 'new'}]) as mock_search:
+            client.search('ABC-123')
+            clock[0] += 601
+            assert client.search('ABC-123') == {'title': 'old'}
+            wait_for(lambda: mock_search.call_count == 2 and not client._refreshing)
+            assert client.search('ABC-123') == {'title': 'new'}
+
+    def test_hard_expired_refetched_synchronously(self, clock):
+        client = make_client()
+        with patch.object(client, '_search', side_effect=[{'title': 'old'}, {'title': 'new'}]):
+            client.search('ABC-123')
+            clock[0] += 3600
+            assert client.search('ABC-123') == {'title': 'new'}
+
+    def test_fresh_bypasses_cache(self, clock):
+        client = make_client()
+        with patch.object(client, '_search', side_effect=[{'title': 'old'}, {'title': 'new'}]) as mock_search:
+            client.search('ABC-123')
+            assert client.search('ABC-123', fresh=True) == {'title': 'new'}
+        assert mock_search.call_args.args == ('ABC-123', True)
+
+    def test_concurrent_misses_fetch_once(self):
+        client = make_client()
+        release = threading.Event()
+
+        def slow_search(movie_code, fresh=False):
+            release.wait(2)
+            return {'title': movie_code}
+
+        with patch.object(client, '_search', side_effect=slow_search) as mock_search:
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(client.search('ABC-123')))
+                       for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            wait_for(lambda: mock_search.call_count == 1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        mock_search.assert_called_once()
+        assert results == [{'title': 'ABC-123'}] * 5
+
+    def test_refresh_runs_once_per_code(self, clock):
+        client = make_client()
+        release = threading.Event()
+        with patch.object(client, '_search', return_value={'title': 'old'}):
+            client.search('ABC-123')
+        clock[0] += 601
+
+        def slow_search(movie_code, fresh=False):
+            release.wait(2)
+            return {'title': 'new'}
+
+        with patch.object(client, '_search', side_effect=slow_search) as mock_search:
+            for _ in range(5):
+                assert client.search('ABC-123') == {'title': 'old'}
+            release.set()
+            wait_for(lambda: not client._refreshing)
+        mock_search.assert_called_once()
+
+    def test_refreshes_are_bounded(self, clock):
+        client = make_client()
+        codes = [f'ABC-{n}' for n in range(SEARCH_REFRESH_WORKERS * 3)]
+        with patch.object(client, '_search', return_value={'title': 'old'}):
+            for code in codes:
+                client.search(code)
+        clock[0] += 601
+
+        release = threading.Event()
+        running = []
+        peak = []
+
+        def slow_search(movie_code, fresh=False):
+            running.append(movie_code)
+            peak.append(len(running))
+            release.wait(2)
+            running.remove(movie_code)
+            return {'title': 'new'}
+
+        with patch.object(client, '_search', side_effect=slow_search):
+            for code in codes:
+                client.search(code)
+            wait_for(lambda: len(running) == SEARCH_REFRESH_WORKERS)
+            release.set()
+            wait_for(lambda: not client._refreshing)
+
+        assert max(peak) == SEARCH_REFRESH_WORKERS
+        client.close()
+
+
+class TestSearchMany:
+    """Tests for MetadataClient.search_many()."""
+
+    def test_duplicate_codes_searched_once(self):
+        client = make_client(cache_hard_ttl=0)
+        with patch.object(client, 'search', side_effect=lambda code, fresh=False: {'title': code}) as mock_search:
+            found = client.search_many(['ABC-1', 'ABC-2', 'ABC-1', 'ABC-2', 'ABC-1'])
+
+        assert found == {'ABC-1': {'title': 'ABC-1'}, 'ABC-2': {'title': 'ABC-2'}}
+        assert sorted(c.args[0] for c in mock_search.call_args_list) == ['ABC-1', 'ABC-2']
+
+    def test_missing_and_failed_results_left_out(self):
+        client = make_client(cache_hard_ttl=0)
+        results = {'ABC-1': {'title': 'A'}, 'ABC-2': None, 'ABC-3': RuntimeError('boom')}
+
+        def search(code, fresh=False):
+            if isinstance(results[code], Exception):
+                raise results[code]
+            return results[code]
+
+        with patch.object(client, 'search', side_effect=search):
+            assert client.search_many(list(results)) == {'ABC-1': {'title': 'A'}}
+
+    def test_fresh_passed_through(self):
+        client = make_client(cache_hard_ttl=0)
+        with patch.object(client, 'search', return_value={'title': 'A'}) as mock_search:
+            client.search_many(['ABC-1'], fresh=True)
+        mock_search.assert_called_once_with('ABC-1', fresh=True)
+
+    def test_concurrency_bound_respected(self):
+        client = make_client(cache_hard_ttl=0)
+        codes = [f'ABC-{n}' for n in range(12)]
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def search(code, fresh=False):
+            with lock:
+                running.append(code)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(code)
+            return {'title': code}
+
+        with patch.object(client, 'search', side_effect=search):
+            found = client.search_many(codes, concurrency=3)
+
+        assert len(found) == 12
+        assert max(peak) == 3
+
+    def test_empty(self):
+        client = make_client(cache_hard_ttl=0)
+        with patch.object(client, 'search') as mock_search:
+            assert client.search_many([]) == {}
+        mock_search.assert_not_called()
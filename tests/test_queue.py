@@ -6,6 +6,7 @@ Falls back to localhost defaults for local development.
 """
 
 import os
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, MagicMock
@@ -15,7 +16,9 @@ import pytest
 # Skip all tests if psycopg2 is not installed
 psycopg2 = pytest.importorskip('psycopg2')
 
-from src.queue import QueueDB, VALID_STATUSES, MAX_RETRIES
+from src.queue import (
+    QueueDB, VALID_STATUSES, MAX_RETRIES, execute_prepared, to_jsonb, _BlockingConnectionPool,
+)
 
 
 @pytest.fixture
@@ -157,6 +160,24 @@ class TestUpdateStatus:
         assert row['status'] == 'completed'
 
 
+class TestUpdateMetadataBatch:
+    """Tests for update_metadata_batch()."""
+
+    def test_updates_all_items(self, db):
+        first = db.add('/watch/SONE-760.mp4')
+        second = db.add('/watch/ABC-123.mp4')
+        updated = db.update_metadata_batch([
+            (first['id'], {'title': 'First'}),
+            (second['id'], {'title': 'Second'}),
+        ])
+        assert updated == 2
+        assert db.get(first['id'])['metadata_json'] == {'title': 'First'}
+        assert db.get(second['id'])['metadata_json'] == {'title': 'Second'}
+
+    def test_empty_batch(self, db):
+        assert db.update_metadata_batch([]) == 0
+
+
 class TestGetNextPending:
     """Tests for get_next_pending()."""
 
@@ -291,3 +312,115 @@ class TestDelete:
 
     def test_delete_nonexistent(self, db):
         assert db.delete(99999) is False
+
+
+class TestConnection:
+    """Tests for the connection() context manager."""
+
+    def test_rolls_back_on_error(self, db):
+        with pytest.raises(RuntimeError):
+            with db.connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "INSERT INTO processing_queue (file_path) VALUES ('/watch/x.mp4')"
+                    )
+                raise RuntimeError('boom')
+        assert db.get_by_file_path('/watch/x.mp4') is None
+
+
+class TestUpdateDownloadTails:
+    """Tests for update_download_tails()."""
+
+    def test_updates_running_downloads(self, db):
+        first = db.add_download('https://example.com/1')
+        second = db.add_download('https://example.com/2')
+        for row in (first, second):
+            db.update_download_status(row['id'], status='downloading')
+
+        updated = db.update_download_tails([(first['id'], ['a']), (second['id'], ['b', 'c'])])
+
+        assert updated == 2
+        assert db.get_download(first['id'])['output_tail'] == ['a']
+        assert db.get_download(second['id'])['output_tail'] == ['b', 'c']
+
+    def test_finished_download_left_alone(self, db):
+        row = db.add_download('https://example.com/1')
+        db.update_download_status(row['id'], status='completed', output_tail=['final'])
+
+        assert db.update_download_tails([(row['id'], ['late progress'])]) == 0
+        assert db.get_download(row['id'])['output_tail'] == ['final']
+
+    def test_empty(self, db):
+        assert db.update_download_tails([]) == 0
+
+
+class TestBlockingConnectionPool:
+    """Tests for the pool behind QueueDB (no database needed)."""
+
+    @pytest.fixture
+    def pool(self):
+        with patch('psycopg2.connect', side_effect=lambda *a, **kw: MagicMock()):
+            yield _BlockingConnectionPool(0, 1, 'postgres://test')
+
+    def test_checkout_waits_for_returned_connection(self, pool):
+        conn = pool.getconn()
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+        waiter.start()
+        time.sleep(0.05)
+        assert not got
+        pool.putconn(conn)
+        waiter.join(1)
+        assert len(got) == 1
+
+    def test_checkout_times_out(self, pool):
+        pool.getconn()
+        with patch('src.queue.POOL_WAIT_TIMEOUT', 0.01):
+            with pytest.raises(psycopg2.pool.PoolError):
+                pool.getconn()
+
+    def test_failed_connect_frees_its_slot(self, pool):
+        with patch('psycopg2.connect', side_effect=psycopg2.OperationalError('down')):
+            with pytest.raises(psycopg2.OperationalError):
+                pool.getconn()
+        pool.putconn(pool.getconn())
+
+
+class TestExecutePrepared:
+    """Tests for execute_prepared()."""
+
+    def test_prepares_once_per_connection(self):
+        cur = MagicMock()
+        execute_prepared(cur, 'stmt_a', 'SELECT status FROM processing_queue WHERE id = $1', (7,))
+        execute_prepared(cur, 'stmt_a', 'SELECT status FROM processing_queue WHERE id = $1', (8,))
+
+        sql_calls = [c.args[0] for c in cur.execute.call_args_list]
+        assert sql_calls == [
+            'PREPARE stmt_a AS SELECT status FROM processing_queue WHERE id = $1',
+            'EXECUTE stmt_a (%s)',
+            'EXECUTE stmt_a (%s)',
+        ]
+        assert cur.execute.call_args_list[-1].args[1] == (8,)
+
+    def test_new_connection_prepares_again(self):
+        first, second = MagicMock(), MagicMock()
+        execute_prepared(first, 'stmt_b', 'SELECT 1')
+        execute_prepared(second, 'stmt_b', 'SELECT 1')
+        assert second.execute.call_args_list[0].args[0] == 'PREPARE stmt_b AS SELECT 1'
+        assert second.execute.call_args_list[1].args[0] == 'EXECUTE stmt_b'
+
+    def test_prepared_statement_runs(self, db):
+        row = db.add('/watch/SONE-760.mp4')
+        with db.connection() as conn, conn.cursor() as cur:
+            for _ in range(2):
+                execute_prepared(cur, 'test_item_status',
+                                 'SELECT status FROM processing_queue WHERE id = $1', (row['id'],))
+                assert cur.fetchone()[0] == 'pending'
+
+
+class TestToJsonb:
+    """Tests for to_jsonb()."""
+
+    def test_serializes_with_orjson(self):
+        adapted = to_jsonb({'title': "It's", 'actress': ['A']})
+        assert adapted.dumps(adapted.adapted) == '{"title":"It\'s","actress":["A"]}'